@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark the codecs encoding stored documents.
+
+Encodes and decodes game and player documents shaped like the ones the
+bot writes, both whole (JSON string layout) and field by field (hash
+layout), with every codec available, and reports the mean cost of each.
+
+Usage::
+
+    python benchmark_codec.py -n 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+from uuid import uuid4
+
+from discord_against_humanity.ports.codec import JsonCodec, OrjsonCodec, orjson
+
+
+def _game_document() -> dict[str, Any]:
+    """Build a game document shaped like the ones the bot writes."""
+    players = [str(uuid4()) for _ in range(8)]
+    return {
+        "guild": 123456789012345678,
+        "category": 123456789012345679,
+        "board": 123456789012345680,
+        "players": players,
+        "black_cards": [str(uuid4())],
+        "white_cards": [],
+        "points": 5,
+        "playing": True,
+        "phase": "voting",
+        "voting": "players",
+        "results": [
+            [player, "A sentence with the answer of a player filled in."]
+            for player in players
+        ],
+        "tsar": players[0],
+        "round": 12,
+    }
+
+
+def _player_document() -> dict[str, Any]:
+    """Build a player document shaped like the ones the bot writes."""
+    return {
+        "user": 123456789012345681,
+        "guild": 123456789012345678,
+        "channel": 123456789012345682,
+        "game": str(uuid4()),
+        "score": 3,
+        "white_cards": [str(uuid4()) for _ in range(10)],
+        "answers": [],
+        "tsar_choice": None,
+        "vote": None,
+    }
+
+
+def _mean_us(action: Callable[[], Any], iterations: int) -> float:
+    """Time *action* and return its mean cost in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        action()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations: int) -> None:
+    """Run the benchmark and print a per-codec summary."""
+    codecs = [JsonCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    documents = {"game": _game_document(), "player": _player_document()}
+
+    print(f"{'codec':<8} {'document':<10} {'layout':<7} {'enc µs':>8} {'dec µs':>8}")
+    for codec in codecs:
+        for name, document in documents.items():
+            text = codec.dumps(document)
+            fields = {field: codec.dumps(value) for field, value in document.items()}
+            timings = {
+                "string": (
+                    _mean_us(lambda: codec.dumps(document), iterations),
+                    _mean_us(lambda: codec.loads(text), iterations),
+                ),
+                "hash": (
+                    _mean_us(
+                        lambda: {f: codec.dumps(v) for f, v in document.items()},
+                        iterations,
+                    ),
+                    _mean_us(
+                        lambda: {f: codec.loads(v) for f, v in fields.items()},
+                        iterations,
+                    ),
+                ),
+            }
+            for layout, (encode, decode) in timings.items():
+                print(
+                    f"{codec.name:<8} {name:<10} {layout:<7} "
+                    f"{encode:>8.2f} {decode:>8.2f}"
+                )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--iterations",
+        type=int,
+        default=10000,
+        help="Number of encodings and decodings per case (default 10000)",
+    )
+    args = parser.parse_args()
+    run(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Benchmark Valkey round trips and latency per repository write.
+
+Runs a realistic ``insert``/``replace``/``delete_by_id`` cycle against a
+live Valkey server and reports how many round trips each operation
+costs, along with its mean latency.  With ``--memory``, the cycle runs
+against the in-memory repository instead, measuring the cost of the
+repository itself without any network I/O.
+
+Usage::
+
+    VALKEY_HOST=localhost VALKEY_PORT=6379 python benchmark_repository.py
+    python benchmark_repository.py --memory
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from os import environ
+from typing import Any
+from uuid import uuid4
+
+import valkey.asyncio as valkey
+
+from discord_against_humanity.ports.memory import MemoryRepository
+from discord_against_humanity.ports.repository import Repository
+from discord_against_humanity.ports.valkey import ValkeyRepository
+
+
+class RoundTripCounter:
+    """Count commands and pipelines sent by an async Valkey client."""
+
+    def __init__(self, client: valkey.Valkey | None = None) -> None:
+        self.count = 0
+        if client is None:
+            return
+        execute_command = client.execute_command
+        pipeline = client.pipeline
+
+        async def counted_execute_command(*args: Any, **kwargs: Any) -> Any:
+            self.count += 1
+            return await execute_command(*args, **kwargs)
+
+        def counted_pipeline(*args: Any, **kwargs: Any) -> Any:
+            pipe = pipeline(*args, **kwargs)
+            execute = pipe.execute
+
+            async def counted_execute(*a: Any, **kw: Any) -> Any:
+                self.count += 1
+                return await execute(*a, **kw)
+
+            pipe.execute = counted_execute  # type: ignore[method-assign]
+            return pipe
+
+        client.execute_command = counted_execute_command  # type: ignore[method-assign]
+        client.pipeline = counted_pipeline  # type: ignore[method-assign]
+
+
+def _game_document(guild: int) -> dict[str, Any]:
+    """Build a game document shaped like the ones the bot writes."""
+    return {
+        "guild": guild,
+        "category": 1,
+        "board": 2,
+        "players": [str(uuid4()) for _ in range(8)],
+        "black_cards": [str(uuid4()) for _ in range(20)],
+        "white_cards": [str(uuid4()) for _ in range(150)],
+        "points": 5,
+        "playing": True,
+        "voting": "players",
+        "results": [],
+        "tsar": 0,
+    }
+
+
+async def run(iterations: int, memory: bool = False) -> None:
+    """Run the benchmark and print a per-operation summary."""
+    collection = f"bench_{uuid4().hex[:8]}"
+    client = None
+    repo: Repository
+    if memory:
+        counter = RoundTripCounter()
+        repo = MemoryRepository(collection, index_fields=["guild"])
+    else:
+        client = valkey.Valkey(
+            host=environ.get("VALKEY_HOST", "localhost"),
+            port=int(environ.get("VALKEY_PORT", "6379")),
+            decode_responses=True,
+        )
+        counter = RoundTripCounter(client)
+        repo = ValkeyRepository(client, collection, index_fields=["guild"])
+    totals = {"insert": [0, 0.0], "replace": [0, 0.0], "delete": [0, 0.0]}
+
+    for i in range(iterations):
+        document = _game_document(i)
+
+        before, start = counter.count, time.perf_counter()
+        doc_id = await repo.insert(dict(document))
+        totals["insert"][0] += counter.count - before
+        totals["insert"][1] += time.perf_counter() - start
+
+        document["voting"] = "tsar"
+        before, start = counter.count, time.perf_counter()
+        await repo.replace(doc_id, document)
+        totals["replace"][0] += counter.count - before
+        totals["replace"][1] += time.perf_counter() - start
+
+        before, start = counter.count, time.perf_counter()
+        await repo.delete_by_id(doc_id)
+        totals["delete"][0] += counter.count - before
+        totals["delete"][1] += time.perf_counter() - start
+
+    print(f"{'operation':<10} {'RTT/op':>8} {'ms/op':>8}")
+    for name, (round_trips, elapsed) in totals.items():
+        print(
+            f"{name:<10} {round_trips / iterations:>8.2f} "
+            f"{elapsed / iterations * 1000:>8.3f}"
+        )
+    if client is not None:
+        await client.aclose()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--iterations",
+        type=int,
+        default=1000,
+        help="Number of insert/replace/delete cycles (default 1000)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Benchmark the in-memory repository instead of Valkey",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, args.memory))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,11 @@ import logging
 
 import discord
 
+from discord_against_humanity.adapters.interaction import documents
 from discord_against_humanity.domain.game import Game
 from discord_against_humanity.domain.player import Player
-from discord_against_humanity.utils.debug import async_log_event
+from discord_against_humanity.utils.metrics import CHECK_SECONDS, timed
+from discord_against_humanity.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +28,8 @@ __all__ = [
 ]
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def game_exists(interaction: discord.Interaction) -> bool:
     """Check if a game exists in this guild.
 
@@ -38,12 +41,16 @@ async def game_exists(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     return game.document_id is not None
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def no_game_exists(interaction: discord.Interaction) -> bool:
     """Check if no game exists in this guild.
 
@@ -55,12 +62,16 @@ async def no_game_exists(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     return game.document_id is None
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def is_player(interaction: discord.Interaction) -> bool:
     """Check if the user is a player in the game.
 
@@ -72,20 +83,25 @@ async def is_player(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     player = await Player.create(
         interaction.client,
         interaction.client.repo_factory,  # type: ignore[attr-defined]
         user=interaction.user,
         guild=interaction.guild,
+        identity_map=documents(interaction),
     )
     result = player.document_id in game.players_id  # type: ignore[operator]
     logger.debug("Result of is_player: %s", result)
     return result
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def is_not_player(interaction: discord.Interaction) -> bool:
     """Check if the user is not a player in the game.
 
@@ -97,20 +113,25 @@ async def is_not_player(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     player = await Player.create(
         interaction.client,
         interaction.client.repo_factory,  # type: ignore[attr-defined]
         user=interaction.user,
         guild=interaction.guild,
+        identity_map=documents(interaction),
     )
     result = player.document_id not in game.players_id  # type: ignore[operator]
     logger.debug("Result of is_not_player: %s", result)
     return result
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def game_playing(interaction: discord.Interaction) -> bool:
     """Check if the game is currently in progress.
 
@@ -122,13 +143,17 @@ async def game_playing(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     logger.debug("Result of game_playing: %s", game.playing)
     return game.playing  # type: ignore[return-value]
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def game_not_playing(interaction: discord.Interaction) -> bool:
     """Check if the game is not currently in progress.
 
@@ -140,13 +165,17 @@ async def game_not_playing(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     logger.debug("Result of game_not_playing: %s", not game.playing)
     return not game.playing
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def is_enough_players(interaction: discord.Interaction) -> bool:
     """Check if there are enough players to start the game.
 
@@ -158,14 +187,18 @@ async def is_enough_players(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     result = len(game.players_id) >= 2  # type: ignore[arg-type]
     logger.debug("Result of is_enough_players: %s", result)
     return result
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def from_user_channel(interaction: discord.Interaction) -> bool:
     """Check if the command was sent from the user's private channel.
 
@@ -181,13 +214,15 @@ async def from_user_channel(interaction: discord.Interaction) -> bool:
         interaction.client.repo_factory,  # type: ignore[attr-defined]
         user=interaction.user,
         guild=interaction.guild,
+        identity_map=documents(interaction),
     )
     result = interaction.channel == player.channel
     logger.debug("Result of from_user_channel: %s", result)
     return result
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def is_players_voting(interaction: discord.Interaction) -> bool:
     """Check if it is the players' turn to vote.
 
@@ -199,14 +234,18 @@ async def is_players_voting(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     result = game.voting == "players"
     logger.debug("Result of is_players_voting: %s", result)
     return result
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def is_tsar_voting(interaction: discord.Interaction) -> bool:
     """Check if it is the tsar's turn to vote.
 
@@ -218,14 +257,18 @@ async def is_tsar_voting(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     result = game.voting == "tsar"
     logger.debug("Result of is_tsar_voting: %s", result)
     return result
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def is_tsar(interaction: discord.Interaction) -> bool:
     """Check if the user is the current tsar.
 
@@ -237,20 +280,25 @@ async def is_tsar(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     player = await Player.create(
         interaction.client,
         interaction.client.repo_factory,  # type: ignore[attr-defined]
         user=interaction.user,
         guild=interaction.guild,
+        identity_map=documents(interaction),
     )
     result = game.tsar_id == player.document_id
     logger.debug("Result of is_tsar: %s", result)
     return result
 
 
-@async_log_event
+@timed(CHECK_SECONDS, "check")
+@traced
 async def is_not_tsar(interaction: discord.Interaction) -> bool:
     """Check if the user is not the current tsar.
 
@@ -262,13 +310,17 @@ async def is_not_tsar(interaction: discord.Interaction) -> bool:
     """
     assert interaction.guild is not None
     game = await Game.create(
-        interaction.client, interaction.client.repo_factory, interaction.guild  # type: ignore[attr-defined]
+        interaction.client,
+        interaction.client.repo_factory,  # type: ignore[attr-defined]
+        interaction.guild,
+        identity_map=documents(interaction),
     )
     player = await Player.create(
         interaction.client,
         interaction.client.repo_factory,  # type: ignore[attr-defined]
         user=interaction.user,
         guild=interaction.guild,
+        identity_map=documents(interaction),
     )
     result = game.tsar_id != player.document_id
     logger.debug("Result of is_not_tsar: %s", result)
@@ -1,5 +1,6 @@
 """Cards Against Humanity slash command module."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -21,8 +22,14 @@ from discord_against_humanity.adapters.checks.game_checks import (
     is_tsar_voting,
     no_game_exists,
 )
+from discord_against_humanity.adapters.interaction import documents
 from discord_against_humanity.domain.game import Game
 from discord_against_humanity.domain.player import Player
+from discord_against_humanity.domain.pool import (
+    ChannelPool,
+    Overwrites,
+    default_overwrites,
+)
 from discord_against_humanity.utils.embed import create_embed
 
 logger = logging.getLogger("discord_against_humanity.commands")
@@ -68,17 +75,17 @@ class CardsAgainstHumanity(commands.Cog):
             interaction: The Discord interaction.
         """
         assert interaction.guild is not None
-        permissions = self._default_permission(interaction.guild)
         game = await Game.create(
-            self.bot, self.repo_factory, interaction.guild
+            self.bot,
+            self.repo_factory,
+            interaction.guild,
+            identity_map=documents(interaction),
         )
+        pool = ChannelPool(self.repo_factory, interaction.guild.id)
+        board = await pool.take_board(interaction.guild)
         game.guild = interaction.guild
-        game.category = await interaction.guild.create_category(
-            "Cards Against Humanity"
-        )
-        game.board = await interaction.guild.create_text_channel(
-            "board", category=game.category, overwrites=permissions
-        )
+        game.category = board.category  # type: ignore[assignment]
+        game.board = board
         await game.save()
         await interaction.response.send_message(
             "Game created! Use `/join` to join.", ephemeral=True
@@ -99,18 +106,13 @@ class CardsAgainstHumanity(commands.Cog):
         assert interaction.guild is not None
         await interaction.response.defer(ephemeral=True)
         game = await Game.create(
-            self.bot, self.repo_factory, interaction.guild
+            self.bot,
+            self.repo_factory,
+            interaction.guild,
+            identity_map=documents(interaction),
         )
-        players = await game.get_players()
-        for player in players:
-            if player.channel is not None:
-                await player.channel.delete()
-            await player.delete()
-        if game.board is not None:
-            await game.board.delete()
-        if game.category is not None:
-            await game.category.delete()
-        await game.delete()
+        await self.bot.game_runner.cancel(game.document_id)  # type: ignore[attr-defined]
+        await game.teardown()
         await interaction.followup.send("Game deleted.", ephemeral=True)
 
     @app_commands.command(
@@ -127,33 +129,40 @@ class CardsAgainstHumanity(commands.Cog):
         """
         assert interaction.guild is not None
         await interaction.response.defer(ephemeral=True)
-        permissions = self._default_permission(interaction.guild)
         user_permissions = PermissionOverwrite(
             read_messages=True, send_messages=True
         )
+        permissions = self._default_permission(interaction.guild)
+        permissions[interaction.user] = user_permissions  # type: ignore[index]
         game = await Game.create(
-            self.bot, self.repo_factory, interaction.guild
+            self.bot,
+            self.repo_factory,
+            interaction.guild,
+            identity_map=documents(interaction),
         )
         player = await Player.create(
             self.bot,
             self.repo_factory,
             user=interaction.user,
             guild=interaction.guild,
+            identity_map=documents(interaction),
         )
         name = "_".join(interaction.user.display_name.split())
         player.guild = interaction.guild
         player.user = interaction.user  # type: ignore[assignment]
-        player.channel = await interaction.guild.create_text_channel(
-            name, category=game.category, overwrites=permissions
-        )
-        await game.board.set_permissions(  # type: ignore[union-attr]
-            interaction.user, overwrite=user_permissions
+        pool = ChannelPool(self.repo_factory, interaction.guild.id)
+        channel, _ = await asyncio.gather(
+            pool.take_channel(
+                name,
+                game.category,  # type: ignore[arg-type]
+                permissions,
+            ),
+            game.board.set_permissions(  # type: ignore[union-attr]
+                interaction.user, overwrite=user_permissions
+            ),
         )
-        await player.channel.set_permissions(
-            interaction.user, overwrite=user_permissions
-        )
-        await player.save()
-        await game.add_player(player)
+        player.channel = channel
+        await game.join(player)
         await game.board.send(  # type: ignore[union-attr]
             f"{interaction.user.mention} has joined the game!"
         )
@@ -174,13 +183,17 @@ class CardsAgainstHumanity(commands.Cog):
         assert interaction.guild is not None
         await interaction.response.defer(ephemeral=True)
         game = await Game.create(
-            self.bot, self.repo_factory, interaction.guild
+            self.bot,
+            self.repo_factory,
+            interaction.guild,
+            identity_map=documents(interaction),
         )
         player = await Player.create(
             self.bot,
             self.repo_factory,
             user=interaction.user,
             guild=interaction.guild,
+            identity_map=documents(interaction),
         )
         await game.delete_player(player)
         if player.document_id == game.tsar_id and game.players_id:
@@ -190,8 +203,9 @@ class CardsAgainstHumanity(commands.Cog):
                 f"{tsar.user.mention}! You're the tsar!"
             )
         await game.save()
-        if player.channel is not None:
-            await player.channel.delete()
+        await game.notify()
+        pool = ChannelPool(self.repo_factory, interaction.guild.id)
+        await pool.release(player.channel)
         await player.delete()
         await game.board.send(  # type: ignore[union-attr]
             f"{interaction.user.mention} has left the game!"
@@ -212,6 +226,9 @@ class CardsAgainstHumanity(commands.Cog):
     ) -> None:
         """Start the game.
 
+        The rounds themselves are played by the bot's game runner, so
+        the interaction is answered as soon as the game is set up.
+
         Args:
             interaction: The Discord interaction.
             points: Number of points required to win (default 5).
@@ -219,42 +236,21 @@ class CardsAgainstHumanity(commands.Cog):
         assert interaction.guild is not None
         await interaction.response.defer(ephemeral=True)
         game = await Game.create(
-            self.bot, self.repo_factory, interaction.guild
+            self.bot,
+            self.repo_factory,
+            interaction.guild,
+            identity_map=documents(interaction),
         )
         game.playing = True
         game.points = points
+        await game.build_decks()
         await game.save()
         await game.board.send("The game will start!")  # type: ignore[union-attr]
         await game.board.send(embed=self._reminder())  # type: ignore[union-attr]
 
         await game.set_random_tsar()
-        is_score_max = await game.is_points_max()
-        while game.playing and not is_score_max:
-            await game.get(game.document_id)
-            if not game.playing:
-                break
-            tsar = await game.get_tsar()
-            await game.board.send(  # type: ignore[union-attr]
-                f"{tsar.user.mention}! You're the tsar!"
-            )
-            question = await game.draw_black_card()
-            await game.board.send(embed=question)  # type: ignore[union-attr]
-            players = await game.get_players()
-            for player in players:
-                if player.channel is not None:
-                    await player.channel.send(embed=question)
-                await player.draw_white_cards(game.white_cards_id)
-            await game.wait_for_players_answers()
-            proposals = await game.send_answers()
-            await game.board.send(embed=proposals)  # type: ignore[union-attr]
-            if tsar.channel is not None:
-                await tsar.channel.send(embed=proposals)
-            await game.wait_for_tsar_answer()
-            await game.select_winner()
-            await game.score()
-            is_score_max = await game.is_points_max()
-        await self._cleanup_game(interaction)
-        await interaction.followup.send("Game over!", ephemeral=True)
+        self.bot.game_runner.run(game)  # type: ignore[attr-defined]
+        await interaction.followup.send("Game started!", ephemeral=True)
 
     @app_commands.command(name="stop", description="Stop the current game")
     @app_commands.guild_only()
@@ -268,10 +264,14 @@ class CardsAgainstHumanity(commands.Cog):
         """
         assert interaction.guild is not None
         game = await Game.create(
-            self.bot, self.repo_factory, interaction.guild
+            self.bot,
+            self.repo_factory,
+            interaction.guild,
+            identity_map=documents(interaction),
         )
         game.playing = False
         await game.save()
+        await game.notify()
         await interaction.response.send_message("Game stopped.", ephemeral=True)
 
     @app_commands.command(
@@ -298,13 +298,17 @@ class CardsAgainstHumanity(commands.Cog):
         """
         assert interaction.guild is not None
         game = await Game.create(
-            self.bot, self.repo_factory, interaction.guild
+            self.bot,
+            self.repo_factory,
+            interaction.guild,
+            identity_map=documents(interaction),
         )
         player = await Player.create(
             self.bot,
             self.repo_factory,
             user=interaction.user,
             guild=interaction.guild,
+            identity_map=documents(interaction),
         )
         black_card = await game.get_black_card()
         try:
@@ -321,6 +325,7 @@ class CardsAgainstHumanity(commands.Cog):
                 )
             else:
                 await player.add_answers(int_answers)
+                await game.notify()
                 await game.board.send(  # type: ignore[union-attr]
                     f"{interaction.user.mention} has voted!"
                 )
@@ -352,21 +357,26 @@ class CardsAgainstHumanity(commands.Cog):
         """
         assert interaction.guild is not None
         game = await Game.create(
-            self.bot, self.repo_factory, interaction.guild
+            self.bot,
+            self.repo_factory,
+            interaction.guild,
+            identity_map=documents(interaction),
         )
         player = await Player.create(
             self.bot,
             self.repo_factory,
             user=interaction.user,
             guild=interaction.guild,
+            identity_map=documents(interaction),
         )
-        if answer not in range(1, len(game.players_id)):  # type: ignore[arg-type]
+        if not game.is_proposal(answer):
             await interaction.response.send_message(
                 "Your answer is not in the acceptable range.", ephemeral=True
             )
         else:
             player.tsar_choice = answer
             await player.save()
+            await game.notify()
             await game.board.send(  # type: ignore[union-attr]
                 f"{interaction.user.mention} has voted!"
             )
@@ -388,7 +398,10 @@ class CardsAgainstHumanity(commands.Cog):
         """
         assert interaction.guild is not None
         game = await Game.create(
-            self.bot, self.repo_factory, interaction.guild
+            self.bot,
+            self.repo_factory,
+            interaction.guild,
+            identity_map=documents(interaction),
         )
         await game.score()
         await interaction.response.send_message(
@@ -420,9 +433,7 @@ class CardsAgainstHumanity(commands.Cog):
         }
         return create_embed(embed)
 
-    def _default_permission(
-        self, guild: discord.Guild
-    ) -> dict[discord.Role | discord.Member, PermissionOverwrite]:
+    def _default_permission(self, guild: discord.Guild) -> Overwrites:
         """Create default channel permissions.
 
         Args:
@@ -431,39 +442,7 @@ class CardsAgainstHumanity(commands.Cog):
         Returns:
             A permissions overwrites mapping.
         """
-        permissions: dict[
-            discord.Role | discord.Member, PermissionOverwrite
-        ] = {}
-        permissions[guild.default_role] = PermissionOverwrite(
-            read_messages=False
-        )
-        permissions[guild.me] = PermissionOverwrite(
-            read_messages=True, send_messages=True
-        )
-        return permissions
-
-    async def _cleanup_game(
-        self, interaction: discord.Interaction
-    ) -> None:
-        """Clean up game resources after a game ends.
-
-        Args:
-            interaction: The Discord interaction.
-        """
-        assert interaction.guild is not None
-        game = await Game.create(
-            self.bot, self.repo_factory, interaction.guild
-        )
-        players = await game.get_players()
-        for player in players:
-            if player.channel is not None:
-                await player.channel.delete()
-            await player.delete()
-        if game.board is not None:
-            await game.board.delete()
-        if game.category is not None:
-            await game.category.delete()
-        await game.delete()
+        return default_overwrites(guild)
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -0,0 +1,27 @@
+"""Helpers for request-scoped state attached to a Discord interaction."""
+
+import discord
+
+from discord_against_humanity.domain.document import IdentityMap
+
+__all__ = ["documents"]
+
+_DOCUMENTS_KEY = "documents"
+
+
+def documents(interaction: discord.Interaction) -> IdentityMap:
+    """Get the identity map shared by an interaction's checks and handler.
+
+    The map lives in ``interaction.extras`` so it is created lazily on
+    first use and discarded together with the interaction.  Passing it
+    to ``Game.create`` / ``Player.create`` makes every check and the
+    command handler reuse the same documents instead of reloading them.
+
+    Args:
+        interaction: The Discord interaction.
+
+    Returns:
+        The identity map for this interaction.
+    """
+    identity_map: IdentityMap = interaction.extras.setdefault(_DOCUMENTS_KEY, {})
+    return identity_map
@@ -0,0 +1,258 @@
+"""Game runner — supervises the round loop of every game being played."""
+
+import asyncio
+import logging
+from time import monotonic
+
+from discord.ext.commands import Bot
+
+from discord_against_humanity.domain.cards import render_cache_info
+from discord_against_humanity.domain.document import save_info
+from discord_against_humanity.domain.game import Game
+from discord_against_humanity.ports.lease import Leases
+from discord_against_humanity.utils.metrics import ACTIVE_GAMES
+
+logger = logging.getLogger(__name__)
+
+
+class GameRunner:
+    """Own one background task per game being played.
+
+    Round loops run here instead of inside the ``/start`` interaction,
+    so the interaction is answered straight away and games that were
+    being played when the bot went down are resumed when it comes back.
+
+    With leases, several processes can run the same games: each game is
+    only played by the process holding its lease, and the other
+    processes keep looking for games whose lease expired, so the games
+    of a process that died are taken over by another one.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        shard_ids: list[int] | None = None,
+        shard_count: int = 1,
+        leases: Leases | None = None,
+        lease_ttl: float = 30,
+    ) -> None:
+        """Create a runner with no games.
+
+        Args:
+            bot: The Discord bot instance.
+            shard_ids: The gateway shards run by this process, or None
+                when it runs all of them.
+            shard_count: The total number of shards of the bot.
+            leases: Leases to hold while playing a game, or None when
+                no other process plays games.
+            lease_ttl: Seconds a game's lease lasts unless renewed.
+        """
+        self._bot = bot
+        self._leases = leases
+        self._lease_ttl = lease_ttl
+        self._shard_ids = None if shard_ids is None else set(shard_ids)
+        self._shard_count = shard_count
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._resume_task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> set[str]:
+        """Get the IDs of the games currently being run.
+
+        Returns:
+            The game IDs with a live task.
+        """
+        return set(self._tasks)
+
+    async def start(self) -> None:
+        """Resume every game still playing or being torn down.
+
+        Games are resumed in the background once the bot is connected,
+        since channels and members cannot be resolved before that.
+        """
+        self._resume_task = asyncio.create_task(self._resume_all())
+
+    async def stop(self) -> None:
+        """Cancel every game task, leaving their state for the next start."""
+        tasks = list(self._tasks.values())
+        if self._resume_task is not None:
+            tasks.append(self._resume_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        ACTIVE_GAMES.set(0)
+        self._resume_task = None
+
+    def run(self, game: Game) -> None:
+        """Play *game* in the background until it ends.
+
+        Does nothing if the game is already being run.
+
+        Args:
+            game: The game to run.
+        """
+        game_id = game.document_id
+        if game_id is None or game_id in self._tasks:
+            return
+        task = asyncio.create_task(self._play(game), name=f"game-{game_id}")
+        self._tasks[game_id] = task
+        ACTIVE_GAMES.set(len(self._tasks))
+
+        def forget(done: asyncio.Task[None]) -> None:
+            if self._tasks.get(game_id) is done:
+                del self._tasks[game_id]
+                ACTIVE_GAMES.set(len(self._tasks))
+
+        task.add_done_callback(forget)
+
+    def owns(self, guild_id: int) -> bool:
+        """Tell whether this process runs the games of a guild.
+
+        A guild's events are all received by the process running its
+        gateway shard, so that process is the one running its games.
+
+        Args:
+            guild_id: The ID of the guild.
+
+        Returns:
+            True if the guild's shard is run by this process.
+        """
+        if self._shard_ids is None:
+            return True
+        return (guild_id >> 22) % self._shard_count in self._shard_ids
+
+    async def cancel(self, game_id: str) -> None:
+        """Stop running a game and wait for its task to end.
+
+        The game is left as is; use this before tearing a game down
+        from outside the runner, so its round loop does not carry on
+        with a deleted game.
+
+        Args:
+            game_id: The ID of the game to stop.
+        """
+        task = self._tasks.pop(game_id, None)
+        ACTIVE_GAMES.set(len(self._tasks))
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _resume_all(self) -> None:
+        """Wait for the bot to connect, then run every unfinished game.
+
+        Only the games of guilds whose shard this process runs are
+        resumed; the other processes resume the rest.  With leases, the
+        games are looked for again every lease period, to take over the
+        games of processes that stopped renewing their leases.
+        """
+        await self._bot.wait_until_ready()
+        repo_factory = self._bot.repo_factory  # type: ignore[attr-defined]
+        while True:
+            for document in await repo_factory("games").find_all():
+                if not (document.get("playing") or document.get("closing")):
+                    continue
+                if document["_id"] in self._tasks:
+                    continue
+                if not self.owns(document.get("guild", 0)):
+                    continue
+                game = Game.from_document(self._bot, repo_factory, document)
+                logger.info("Resuming game %s in %s", game.document_id, game.phase)
+                self.run(game)
+            if self._leases is None:
+                return
+            await asyncio.sleep(self._lease_ttl)
+
+    async def _keep_lease(
+        self, key: str, token: int, deadline: float, task: asyncio.Task[None]
+    ) -> None:
+        """Renew a game's lease until *task* ends, cancelling it if lost.
+
+        The lease is renewed three times per period.  The game is
+        stopped as soon as another process took the lease, or once the
+        lease may have expired because it could not be renewed.
+
+        Args:
+            key: The leased key.
+            token: The fencing token of the lease.
+            deadline: When the lease expires, on the monotonic clock.
+            task: The task playing the game.
+        """
+        assert self._leases is not None
+        while True:
+            await asyncio.sleep(self._lease_ttl / 3)
+            sent = monotonic()
+            try:
+                renewed = await self._leases.renew(key, token, self._lease_ttl)
+            except Exception:
+                logger.exception("Could not renew lease %s", key)
+                if deadline - monotonic() > self._lease_ttl / 3:
+                    continue
+                renewed = False
+            if not renewed:
+                logger.warning("Lost lease %s (token %d), stopping", key, token)
+                task.cancel()
+                return
+            deadline = sent + self._lease_ttl
+
+    async def _play(self, game: Game) -> None:
+        """Play a game while holding its lease, if there are leases.
+
+        Nothing is done if another process holds the game's lease.
+
+        Args:
+            game: The game to play.
+        """
+        if self._leases is None:
+            await self._drive(game)
+            return
+        key = f"game:{game.document_id}"
+        deadline = monotonic() + self._lease_ttl
+        token = await self._leases.acquire(key, self._lease_ttl)
+        if token is None:
+            logger.debug("Game %s is played by another process", game.document_id)
+            return
+        task = asyncio.current_task()
+        assert task is not None
+        keeper = asyncio.create_task(self._keep_lease(key, token, deadline, task))
+        try:
+            await self._drive(game)
+        finally:
+            keeper.cancel()
+            await self._leases.release(key, token)
+
+    async def _drive(self, game: Game) -> None:
+        """Play a game to the end, then tear it down.
+
+        A game whose teardown was interrupted only finishes its
+        teardown.  A game torn down by someone else (``/delete``) is
+        left alone.  A game that fails is logged and left as is, so it
+        can be resumed by the next start or deleted with ``/delete``.
+
+        Args:
+            game: The game to play.
+        """
+        try:
+            if game.closing:
+                await game.teardown()
+                return
+            await game.play()
+            if not game.closing:
+                await game.teardown()
+        except Exception:
+            logger.exception("Game %s stopped unexpectedly", game.document_id)
+        finally:
+            info = render_cache_info()
+            logger.info(
+                "Card render cache: %d hits, %d misses, %d/%s entries",
+                info.hits,
+                info.misses,
+                info.currsize,
+                info.maxsize,
+            )
+            saves = save_info()
+            logger.info(
+                "Document saves: %d written, %d skipped",
+                saves.written,
+                saves.skipped,
+            )
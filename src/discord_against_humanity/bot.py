@@ -3,18 +3,50 @@
 import json
 import logging
 import logging.config
+import multiprocessing
+import signal
+import sys
 from importlib import resources
+from multiprocessing.connection import wait
 from os import environ
+from pathlib import Path
+from time import perf_counter
 from traceback import print_tb
 from typing import Any
 
 import discord
 import valkey.asyncio as valkey
+from aiohttp import web
 from discord import Color, app_commands
-from discord.ext.commands import Bot
+from discord.ext.commands import AutoShardedBot, Bot
 
-from discord_against_humanity.ports.valkey import create_repo_factory
+from discord_against_humanity.adapters.runner import GameRunner
+from discord_against_humanity.domain.cards import (
+    CardCatalog,
+    configure_render_cache,
+)
+from discord_against_humanity.domain.phase import Phase
+from discord_against_humanity.ports.lease import Leases
+from discord_against_humanity.ports.local import (
+    LocalLeases,
+    LocalNotifier,
+    LocalScheduler,
+)
+from discord_against_humanity.ports.memory import MemoryStore
+from discord_against_humanity.ports.valkey import (
+    ValkeyLeases,
+    ValkeyNotifier,
+    backfill_index_refs,
+    convert_to_hashes,
+    create_repo_factory,
+)
 from discord_against_humanity.utils.embed import create_embed
+from discord_against_humanity.utils.metrics import (
+    COMMAND_SECONDS,
+    http_trace,
+    start_server,
+)
+from discord_against_humanity.utils.tracing import tracer
 
 logger = logging.getLogger("discord_against_humanity.bot")
 
@@ -30,9 +62,114 @@ def init_logger() -> None:
             logging.config.dictConfig(data)
 
 
-def create_bot() -> Bot:
+def _timeout(name: str, default: str = "300") -> float | None:
+    """Read a phase time limit from the environment.
+
+    Args:
+        name: The environment variable holding the limit in seconds.
+        default: The value used when the variable is not set.
+
+    Returns:
+        The limit in seconds, or None when set to 0 (no limit).
+    """
+    return float(environ.get(name, default)) or None
+
+
+def _observe_command(
+    interaction: discord.Interaction,
+    outcome: str,
+    error: BaseException | None = None,
+) -> None:
+    """Observe how long a slash command took, from its first check.
+
+    Also ends the command's root span when tracing is on.
+
+    Args:
+        interaction: The interaction of the command.
+        outcome: ``"ok"`` or ``"error"``.
+        error: The error the command raised, if any.
+    """
+    span = interaction.extras.get("span")
+    if tracer is not None and span is not None:
+        tracer.end(span, error)
+    started = interaction.extras.get("started")
+    if started is None or interaction.command is None:
+        return
+    COMMAND_SECONDS.observe(
+        perf_counter() - started,
+        command=interaction.command.qualified_name,
+        outcome=outcome,
+    )
+
+
+class MeteredTree(app_commands.CommandTree):
+    """Command tree noting when each command starts being handled."""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Note the start time of the interaction, before any check.
+
+        When tracing is on, also starts the root span of the command,
+        parent of the spans of its checks and callback.
+
+        Args:
+            interaction: The interaction to handle.
+
+        Returns:
+            Always True.
+        """
+        interaction.extras["started"] = perf_counter()
+        if tracer is not None and interaction.command is not None:
+            interaction.extras["span"] = tracer.start(
+                f"/{interaction.command.qualified_name}"
+            )
+        return True
+
+
+class CardsBot(Bot):
+    """Bot that stops its background services when it is closed."""
+
+    metrics_server: web.AppRunner | None = None
+    store: MemoryStore | None = None
+
+    async def close(self) -> None:
+        """Stop games, timers and notifications, then disconnect.
+
+        Games are cancelled without being torn down, so they are
+        resumed by the next start.
+        """
+        await self.game_runner.stop()  # type: ignore[attr-defined]
+        await self.scheduler.stop()  # type: ignore[attr-defined]
+        await self.notifier.stop()  # type: ignore[attr-defined]
+        if self.store is not None:
+            await self.store.stop()
+        if self.metrics_server is not None:
+            await self.metrics_server.cleanup()
+        if tracer is not None:
+            await tracer.shutdown()
+        await super().close()
+        if self.valkey is not None:  # type: ignore[attr-defined]
+            await self.valkey.aclose()  # type: ignore[attr-defined]
+
+
+class ShardedCardsBot(CardsBot, AutoShardedBot):
+    """Bot running a range of the gateway shards in one connection pool."""
+
+
+def create_bot(
+    shard_ids: list[int] | None = None, shard_count: int | None = None
+) -> Bot:
     """Create and configure the Discord bot instance.
 
+    With ``STORE`` set to ``memory``, the bot keeps its data in process
+    memory instead of Valkey, saving it to ``STORE_SNAPSHOT`` when set;
+    its card decks are then loaded from the seed files in ``SEED_DIR``.
+
+    Args:
+        shard_ids: The gateway shards to run, or None to run the bot
+            unsharded.
+        shard_count: The total number of shards, required with
+            *shard_ids*.
+
     Returns:
         The configured Bot instance.
     """
@@ -40,13 +177,59 @@ def create_bot() -> Bot:
     intents.message_content = True
     intents.members = True
 
-    bot = Bot(command_prefix="!", intents=intents)
-    bot.valkey = valkey.Valkey(  # type: ignore[attr-defined]
-        host=environ.get("VALKEY_HOST", "localhost"),
-        port=int(environ.get("VALKEY_PORT", "6379")),
-        decode_responses=True,
+    if shard_ids is None:
+        bot: Bot = CardsBot(
+            command_prefix="!",
+            intents=intents,
+            tree_cls=MeteredTree,
+            http_trace=http_trace(),
+        )
+    else:
+        bot = ShardedCardsBot(
+            command_prefix="!",
+            intents=intents,
+            tree_cls=MeteredTree,
+            http_trace=http_trace(),
+            shard_ids=shard_ids,
+            shard_count=shard_count,
+        )
+    configure_render_cache(
+        int(environ.get("CARD_RENDER_CACHE_SIZE", "4096"))
+    )
+    leases: Leases
+    if environ.get("STORE", "valkey") == "memory":
+        store = MemoryStore(
+            environ.get("STORE_SNAPSHOT") or None,
+            float(environ.get("STORE_SNAPSHOT_INTERVAL", "60")),
+        )
+        bot.store = store  # type: ignore[attr-defined]
+        bot.valkey = None  # type: ignore[attr-defined]
+        bot.repo_factory = store.repository  # type: ignore[attr-defined]
+        bot.notifier = LocalNotifier()  # type: ignore[attr-defined]
+        leases = LocalLeases()
+    else:
+        client = valkey.Valkey(
+            host=environ.get("VALKEY_HOST", "localhost"),
+            port=int(environ.get("VALKEY_PORT", "6379")),
+            decode_responses=True,
+        )
+        bot.valkey = client  # type: ignore[attr-defined]
+        bot.repo_factory = create_repo_factory(client)  # type: ignore[attr-defined]
+        bot.notifier = ValkeyNotifier(client)  # type: ignore[attr-defined]
+        leases = ValkeyLeases(client)
+    bot.catalog = None  # type: ignore[attr-defined]
+    bot.game_runner = GameRunner(  # type: ignore[attr-defined]
+        bot,
+        shard_ids,
+        shard_count or 1,
+        leases,
+        float(environ.get("GAME_LEASE_TTL", "30")),
     )
-    bot.repo_factory = create_repo_factory(bot.valkey)  # type: ignore[attr-defined]
+    bot.scheduler = LocalScheduler()  # type: ignore[attr-defined]
+    bot.round_timeouts = {  # type: ignore[attr-defined]
+        Phase.PLAYERS_VOTING: _timeout("PLAYERS_VOTE_TIMEOUT"),
+        Phase.TSAR_VOTING: _timeout("TSAR_VOTE_TIMEOUT"),
+    }
 
     @bot.event
     async def on_ready() -> None:
@@ -56,6 +239,18 @@ def create_bot() -> Bot:
         logging.info("ID: %s", bot.user.id if bot.user else "Unknown")
         logging.info("------")
 
+    @bot.event
+    async def on_app_command_completion(
+        interaction: discord.Interaction, command: Any
+    ) -> None:
+        """Observe how long a successful slash command took.
+
+        Args:
+            interaction: The interaction of the command.
+            command: The command that completed.
+        """
+        _observe_command(interaction, "ok")
+
     @bot.tree.error
     async def on_app_command_error(
         interaction: discord.Interaction,
@@ -68,6 +263,7 @@ def create_bot() -> Bot:
             error: The error that was raised.
         """
         content: dict[str, Any] = {"colour": Color.dark_red()}
+        _observe_command(interaction, "error", error)
         logger.critical("%s %s", interaction.command, error)
         field: dict[str, Any] = {"name": "Error", "inline": False}
 
@@ -122,22 +318,221 @@ async def load_extensions(bot: Bot) -> None:
             logger.critical("Failed to load extension %s\n%s", extension, exc)
 
 
-def main() -> None:
-    """Run the Discord Against Humanity bot."""
-    init_logger()
-    bot = create_bot()
+async def seed_cards(store: MemoryStore, seed_dir: Path) -> None:
+    """Fill the empty card collections of a memory store from seed files.
+
+    Reads ``black_cards.json`` and ``white_cards.json``, the files
+    ``scripts/seed_valkey.py`` seeds Valkey with.
+
+    Args:
+        store: The memory store holding the bot's data.
+        seed_dir: The directory holding the seed files.
+    """
+    for collection in ("black_cards", "white_cards"):
+        repo = store.repository(collection)
+        path = seed_dir / f"{collection}.json"
+        if await repo.count() or not path.exists():
+            continue
+        with open(path, encoding="utf-8") as file:
+            cards = json.load(file)
+        for card in cards:
+            card.pop("_id", None)
+            await repo.insert(card)
+        logger.info("Seeded %d documents into '%s'", len(cards), collection)
+
+
+def parse_shards(value: str, shard_count: int) -> range:
+    """Parse the range of shards a pod runs.
+
+    Args:
+        value: A shard (``"3"``), an inclusive range (``"0-7"``) or an
+            empty string for every shard.
+        shard_count: The total number of shards.
+
+    Returns:
+        The shards to run.
+
+    Raises:
+        ValueError: If the range is malformed or out of bounds.
+    """
+    if not value:
+        return range(shard_count)
+    first, _, last = value.partition("-")
+    shards = range(int(first), int(last or first) + 1)
+    if not shards or shards.start < 0 or shards.stop > shard_count:
+        raise ValueError(
+            f"Shards {value!r} are not within the {shard_count} shards"
+        )
+    return shards
+
+
+def split_shards(shards: range, workers: int) -> list[range]:
+    """Split shards into contiguous, evenly sized ranges.
+
+    Args:
+        shards: The shards to split.
+        workers: The number of ranges wanted.
+
+    Returns:
+        One range per worker, fewer when there are fewer shards than
+        workers.
+    """
+    workers = max(1, min(workers, len(shards)))
+    size, extra = divmod(len(shards), workers)
+    ranges: list[range] = []
+    start = shards.start
+    for index in range(workers):
+        stop = start + size + (index < extra)
+        ranges.append(range(start, stop))
+        start = stop
+    return ranges
+
+
+def run_bot(
+    token: str,
+    shard_ids: list[int] | None = None,
+    shard_count: int | None = None,
+    metrics_port: int = 0,
+) -> None:
+    """Run the bot until it is closed.
+
+    Args:
+        token: The Discord bot token.
+        shard_ids: The gateway shards to run, or None to run the bot
+            unsharded.
+        shard_count: The total number of shards, required with
+            *shard_ids*.
+        metrics_port: Port serving the metrics on ``/metrics``, or 0
+            not to serve them.
+    """
+    bot = create_bot(shard_ids, shard_count)
 
     @bot.event
     async def setup_hook() -> None:
-        """Load extensions and sync slash commands when the bot starts."""
+        """Migrate data, load cards and extensions, sync and resume games.
+
+        Commands are synced by a single worker when the bot is sharded.
+        """
+        if bot.store is not None:  # type: ignore[attr-defined]
+            await bot.store.start()  # type: ignore[attr-defined]
+            await seed_cards(
+                bot.store,  # type: ignore[attr-defined]
+                Path(environ.get("SEED_DIR", "/app/seed")),
+            )
+        else:
+            await convert_to_hashes(bot.valkey)  # type: ignore[attr-defined]
+            await backfill_index_refs(bot.valkey)  # type: ignore[attr-defined]
+        await bot.notifier.start()  # type: ignore[attr-defined]
+        if metrics_port:
+            bot.metrics_server = await start_server(  # type: ignore[attr-defined]
+                metrics_port
+            )
+        bot.catalog = await CardCatalog.load(  # type: ignore[attr-defined]
+            bot.repo_factory  # type: ignore[attr-defined]
+        )
         await load_extensions(bot)
-        await bot.tree.sync()
+        if shard_ids is None or 0 in shard_ids:
+            await bot.tree.sync()
+        await bot.game_runner.start()  # type: ignore[attr-defined]
+
+    bot.run(token)
 
+
+def _run_worker(shard_ids: list[int], shard_count: int, metrics_port: int) -> None:
+    """Run the bot for a range of shards in a worker process.
+
+    Args:
+        shard_ids: The gateway shards to run.
+        shard_count: The total number of shards.
+        metrics_port: Port serving the worker's metrics, or 0.
+    """
+    init_logger()
+    run_bot(environ["DISCORD_TOKEN"], shard_ids, shard_count, metrics_port)
+
+
+def launch_workers(
+    ranges: list[range], shard_count: int, metrics_port: int = 0
+) -> int:
+    """Run one worker process per shard range until one of them stops.
+
+    The other workers are then stopped too, so that the pod restarts
+    as a whole.  ``SIGTERM`` is forwarded to every worker.
+
+    Args:
+        ranges: The shards of each worker.
+        shard_count: The total number of shards.
+        metrics_port: Port serving the metrics of the first worker, the
+            next workers using the next ports; 0 not to serve them.
+
+    Returns:
+        The exit code of the first worker to stop.
+    """
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=_run_worker,
+            args=(
+                list(shards),
+                shard_count,
+                metrics_port + index if metrics_port else 0,
+            ),
+            name=f"shards-{shards.start}-{shards.stop - 1}",
+        )
+        for index, shards in enumerate(ranges)
+    ]
+    for process in processes:
+        process.start()
+        logger.info("Started worker %s (pid %s)", process.name, process.pid)
+
+    def stop(signum: int, frame: Any) -> None:
+        for process in processes:
+            process.terminate()
+
+    signal.signal(signal.SIGTERM, stop)
+    wait([process.sentinel for process in processes])
+    stopped = next(p for p in processes if p.exitcode is not None)
+    logger.info("Worker %s stopped, stopping the others", stopped.name)
+    stop(signal.SIGTERM, None)
+    for process in processes:
+        process.join()
+    return stopped.exitcode or 0
+
+
+def main() -> None:
+    """Run the Discord Against Humanity bot.
+
+    With ``SHARD_COUNT`` set, the bot is sharded: the shards listed in
+    ``SHARDS`` (every shard by default) are split between ``WORKERS``
+    processes, each running a contiguous range of them.  Every guild,
+    and so every game, is handled by the process running its shard.
+
+    With ``METRICS_PORT`` set, each process serves its metrics on
+    ``/metrics``, worker processes on consecutive ports.
+
+    A bot keeping its data in memory (``STORE=memory``) runs in a single
+    process, since worker processes would not share it.
+    """
+    init_logger()
     token = environ.get("DISCORD_TOKEN", "")
     if not token:
         logger.critical("DISCORD_TOKEN environment variable is not set")
         return
-    bot.run(token)
+    metrics_port = int(environ.get("METRICS_PORT", "0"))
+    shard_count = int(environ.get("SHARD_COUNT", "0"))
+    if not shard_count:
+        run_bot(token, metrics_port=metrics_port)
+        return
+    ranges = split_shards(
+        parse_shards(environ.get("SHARDS", ""), shard_count),
+        int(environ.get("WORKERS", "1")),
+    )
+    if len(ranges) == 1:
+        run_bot(token, list(ranges[0]), shard_count, metrics_port)
+        return
+    if environ.get("STORE", "valkey") == "memory":
+        logger.critical("STORE=memory cannot be shared by several WORKERS")
+        return
+    sys.exit(launch_workers(ranges, shard_count, metrics_port))
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 """Card document classes for Cards Against Humanity."""
 
 import logging
-from typing import Self
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, NamedTuple, Self
 
 from html2text import html2text
 
@@ -11,12 +14,180 @@ from discord_against_humanity.ports.repository import RepositoryFactory
 logger = logging.getLogger(__name__)
 
 _DEFAULT_PICK = 1
+_DEFAULT_RENDER_CACHE_SIZE = 4096
+
+
+def _html2text(text: str) -> str:
+    """Convert card HTML to Markdown (uncached)."""
+    return html2text(text)
+
+
+_cached_html2text: Callable[[str], str] = lru_cache(
+    maxsize=_DEFAULT_RENDER_CACHE_SIZE
+)(_html2text)
+
+
+class RenderCacheInfo(NamedTuple):
+    """Statistics for the shared card rendering cache."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+def configure_render_cache(maxsize: int | None) -> None:
+    """Resize the shared card rendering cache.
+
+    The cache is keyed by the raw HTML handed to ``html2text``, so each
+    distinct card is parsed at most once per process while it stays in
+    the cache.  Resizing discards the current entries and counters.
+
+    Args:
+        maxsize: Maximum number of rendered texts to keep; ``0``
+            disables caching and ``None`` makes the cache unbounded.
+    """
+    global _cached_html2text
+    _cached_html2text = lru_cache(maxsize=maxsize)(_html2text)
+
+
+def render_cache_info() -> RenderCacheInfo:
+    """Get statistics for the shared card rendering cache.
+
+    Returns:
+        The cache's hits, misses, maxsize and current size.
+    """
+    return RenderCacheInfo(
+        *_cached_html2text.cache_info()  # type: ignore[attr-defined]
+    )
+
+
+def _render_black(text: str, pick: int, cached: bool = True) -> str:
+    """Render black card HTML to Markdown with ``{}`` placeholders.
+
+    Args:
+        text: The raw card text, with ``_`` marking each blank.
+        pick: The number of answers the card expects.
+        cached: Whether to go through the shared render cache.
+
+    Returns:
+        The Markdown text, ready for ``str.format``.
+    """
+    render = _cached_html2text if cached else _html2text
+    if "_" not in text:
+        return render(text + "**{}**. " * pick)
+    return render(text.replace("_", "**{}**"))
+
+
+def _render_white(text: str, cached: bool = True) -> str:
+    """Render white card HTML to Markdown.
+
+    Args:
+        text: The raw card text.
+        cached: Whether to go through the shared render cache.
+
+    Returns:
+        The Markdown text.
+    """
+    render = _cached_html2text if cached else _html2text
+    return render(text).rstrip()
+
+
+class CatalogCard(NamedTuple):
+    """A pre-rendered card held by the :class:`CardCatalog`."""
+
+    text: str
+    pick: int = _DEFAULT_PICK
+
+
+class CardCatalog:
+    """Read-only, in-memory view of every black and white card.
+
+    Cards are static seed data, so they are loaded once at startup and
+    rendered to Markdown up front.  Lookups never touch the repository
+    and never re-run ``html2text``.
+    """
+
+    __slots__ = ("_black", "_white")
+
+    def __init__(
+        self,
+        black_cards: Iterable[dict[str, Any]] = (),
+        white_cards: Iterable[dict[str, Any]] = (),
+    ) -> None:
+        """Render and index the given card documents.
+
+        Cards bypass the shared render cache: the catalog keeps each
+        result itself, so caching it again would only double the memory
+        used and skew the cache statistics.
+
+        Args:
+            black_cards: Black card documents, each with an ``_id``.
+            white_cards: White card documents, each with an ``_id``.
+        """
+        black: dict[str, CatalogCard] = {}
+        for document in black_cards:
+            pick = document.get("pick") or _DEFAULT_PICK
+            black[document["_id"]] = CatalogCard(
+                _render_black(document["text"], pick, cached=False), pick
+            )
+        white: dict[str, CatalogCard] = {}
+        for document in white_cards:
+            white[document["_id"]] = CatalogCard(
+                _render_white(document["text"], cached=False)
+            )
+        self._black = MappingProxyType(black)
+        self._white = MappingProxyType(white)
+
+    @classmethod
+    async def load(cls, repo_factory: RepositoryFactory) -> Self:
+        """Load both decks from the repository.
+
+        Args:
+            repo_factory: Factory to create repositories.
+
+        Returns:
+            A catalog holding every card currently stored.
+        """
+        catalog = cls(
+            await repo_factory("black_cards").find_all(),
+            await repo_factory("white_cards").find_all(),
+        )
+        logger.info(
+            "Loaded card catalog: %d black, %d white",
+            len(catalog._black),
+            len(catalog._white),
+        )
+        return catalog
+
+    def black_card(self, card_id: str) -> CatalogCard | None:
+        """Look up a black card.
+
+        Args:
+            card_id: The card ID.
+
+        Returns:
+            The card, or None if it is not in the catalog.
+        """
+        return self._black.get(card_id)
+
+    def white_card(self, card_id: str) -> CatalogCard | None:
+        """Look up a white card.
+
+        Args:
+            card_id: The card ID.
+
+        Returns:
+            The card, or None if it is not in the catalog.
+        """
+        return self._white.get(card_id)
 
 
 class BlackCard(Document):
     """Data class for a Black Card (question) document."""
 
     _COLLECTION = "black_cards"
+    _rendered: str | None = None
 
     @property
     def text(self) -> str | None:
@@ -25,13 +196,12 @@ class BlackCard(Document):
         Returns:
             The card text with blanks formatted for display, or None.
         """
+        if self._rendered is not None:
+            return self._rendered
         try:
-            pick = self.pick or _DEFAULT_PICK
-            if "_" not in self._document["text"]:
-                return html2text(
-                    self._document["text"] + "**{}**. " * pick
-                )
-            return html2text(self._document["text"].replace("_", "**{}**"))
+            return _render_black(
+                self._document["text"], self.pick or _DEFAULT_PICK
+            )
         except KeyError:
             return None
 
@@ -49,12 +219,15 @@ class BlackCard(Document):
         cls,
         repo_factory: RepositoryFactory,
         document_id: str | None = None,
+        catalog: CardCatalog | None = None,
     ) -> Self:
         """Create a new BlackCard instance.
 
         Args:
             repo_factory: Factory to create repositories.
             document_id: Optional ID of the document to load.
+            catalog: Optional card catalog to serve the card from
+                without reading the repository.
 
         Returns:
             A new BlackCard instance.
@@ -63,7 +236,11 @@ class BlackCard(Document):
             repository=repo_factory("black_cards"),
             repo_factory=repo_factory,
         )
-        if document_id:
+        entry = catalog.black_card(document_id) if catalog and document_id else None
+        if entry is not None:
+            self._document = {"_id": document_id, "pick": entry.pick}
+            self._rendered = entry.text
+        elif document_id:
             await self.get(document_id)
         return self
 
@@ -72,6 +249,7 @@ class WhiteCard(Document):
     """Data class for a White Card (answer) document."""
 
     _COLLECTION = "white_cards"
+    _rendered: str | None = None
 
     @property
     def text(self) -> str | None:
@@ -80,8 +258,10 @@ class WhiteCard(Document):
         Returns:
             The card text converted from HTML, or None.
         """
+        if self._rendered is not None:
+            return self._rendered
         try:
-            return html2text(self._document["text"]).rstrip()
+            return _render_white(self._document["text"])
         except KeyError:
             return None
 
@@ -90,16 +270,22 @@ class WhiteCard(Document):
         cls,
         repo_factory: RepositoryFactory,
         document_id: str | None = None,
+        catalog: CardCatalog | None = None,
     ) -> Self:
         """Create a new WhiteCard instance.
 
         Args:
             repo_factory: Factory to create repositories.
             document_id: Optional ID of the document to load.
+            catalog: Optional card catalog to serve the card from
+                without reading the repository.
 
         Returns:
             A new WhiteCard instance.
         """
+        entry = catalog.white_card(document_id) if catalog and document_id else None
+        if entry is not None:
+            return cls.from_catalog(repo_factory, document_id, entry)  # type: ignore[arg-type]
         self = WhiteCard(
             repository=repo_factory("white_cards"),
             repo_factory=repo_factory,
@@ -107,3 +293,95 @@ class WhiteCard(Document):
         if document_id:
             await self.get(document_id)
         return self
+
+    @classmethod
+    async def create_many(
+        cls,
+        repo_factory: RepositoryFactory,
+        document_ids: list[str],
+        catalog: CardCatalog | None = None,
+    ) -> list[Self]:
+        """Load several WhiteCards with at most one repository read.
+
+        Cards present in *catalog* are served from memory; only the
+        remaining ones are fetched from the repository.
+
+        Args:
+            repo_factory: Factory to create repositories.
+            document_ids: IDs of the cards to load.
+            catalog: Optional card catalog to serve cards from.
+
+        Returns:
+            The cards found, in the order of *document_ids*.  Missing
+            cards are skipped.
+        """
+        found: dict[str, Self] = {}
+        if catalog is not None:
+            for document_id in document_ids:
+                entry = catalog.white_card(document_id)
+                if entry is not None:
+                    found[document_id] = cls.from_catalog(
+                        repo_factory, document_id, entry
+                    )
+        missing = [doc_id for doc_id in document_ids if doc_id not in found]
+        if missing:
+            documents = await repo_factory("white_cards").find_many(missing)
+            for document_id, document in zip(missing, documents):
+                if document is not None:
+                    found[document_id] = cls.from_document(
+                        repo_factory, document
+                    )
+        cards: list[Self] = []
+        for document_id in document_ids:
+            if document_id not in found:
+                logger.warning("White card %s not found", document_id)
+                continue
+            cards.append(found[document_id])
+        return cards
+
+    @classmethod
+    def from_document(
+        cls,
+        repo_factory: RepositoryFactory,
+        document: dict[str, Any],
+    ) -> Self:
+        """Build a WhiteCard from an already-fetched document.
+
+        Args:
+            repo_factory: Factory to create repositories.
+            document: The card document, including its ``_id``.
+
+        Returns:
+            A new WhiteCard instance.
+        """
+        self = cls(
+            repository=repo_factory("white_cards"),
+            repo_factory=repo_factory,
+        )
+        self._document = document
+        return self
+
+    @classmethod
+    def from_catalog(
+        cls,
+        repo_factory: RepositoryFactory,
+        document_id: str,
+        entry: CatalogCard,
+    ) -> Self:
+        """Build a WhiteCard from a pre-rendered catalog entry.
+
+        Args:
+            repo_factory: Factory to create repositories.
+            document_id: The card ID.
+            entry: The catalog entry for the card.
+
+        Returns:
+            A new WhiteCard instance.
+        """
+        self = cls(
+            repository=repo_factory("white_cards"),
+            repo_factory=repo_factory,
+        )
+        self._document = {"_id": document_id}
+        self._rendered = entry.text
+        return self
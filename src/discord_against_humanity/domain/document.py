@@ -2,16 +2,47 @@
 
 import logging
 from abc import abstractmethod
-from typing import Any, Self
+from collections import Counter
+from copy import deepcopy
+from typing import Any, NamedTuple, Self
 
 from discord_against_humanity.ports.repository import (
     Repository,
     RepositoryFactory,
 )
-from discord_against_humanity.utils.debug import async_log_event
+from discord_against_humanity.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+IdentityMap = dict[tuple[str, Any], "Document"]
+"""A request-scoped cache of loaded documents.
+
+Keys are ``(collection, lookup)`` pairs, where *lookup* is whatever
+natural key the document was loaded by (e.g. a guild ID).  Passing the
+same map to several ``create`` calls guarantees each document is read
+from the store at most once and that every caller shares the same
+instance.
+"""
+
+
+_saves: Counter[str] = Counter()
+
+
+class SaveInfo(NamedTuple):
+    """Statistics for document saves."""
+
+    written: int
+    skipped: int
+
+
+def save_info() -> SaveInfo:
+    """Get how many document saves were written and skipped.
+
+    Returns:
+        The counts of saves since the process started.
+    """
+    return SaveInfo(_saves["written"], _saves["skipped"])
+
 
 class Document:
     """Abstract base class for persistable domain documents.
@@ -46,6 +77,7 @@ class Document:
         self._repo = repository
         self._repo_factory = repo_factory
         self._document: dict[str, Any] = {}
+        self._stored: dict[str, Any] | None = None
 
     @property
     def document_id(self) -> str | None:
@@ -70,7 +102,32 @@ class Document:
             raise TypeError("document_id must be a str")
         self._document["_id"] = value
 
-    @async_log_event
+    @property
+    def dirty_fields(self) -> set[str]:
+        """Get the fields changed since the document was loaded or saved.
+
+        Returns:
+            The names of the changed or removed fields; every field when
+            the stored version is unknown.
+        """
+        if self._stored is None:
+            return set(self._document) | {"_id"}
+        return {
+            field
+            for field in self._document.keys() | self._stored.keys()
+            if self._document.get(field) != self._stored.get(field)
+        }
+
+    def _load(self, document: dict[str, Any]) -> None:
+        """Use *document* as both the current and the stored version.
+
+        Args:
+            document: The document as it is in the store.
+        """
+        self._document = document
+        self._stored = deepcopy(document)
+
+    @traced
     async def get(self, document_id: str | None = None) -> None:
         """Load the document from the store.
 
@@ -83,24 +140,81 @@ class Document:
             return
         result = await self._repo.find_by_id(target_id)
         if result is not None:
-            self._document = result
+            self._load(result)
 
-    @async_log_event
+    @traced
     async def save(self) -> None:
-        """Save the document to the store (insert or replace)."""
+        """Save the document to the store (insert, update or replace).
+
+        Nothing is written when no field changed since the document was
+        loaded or last saved.  When only some fields changed, only those
+        are written; the document is replaced whole when fields were
+        removed or the stored version is unknown.
+        """
         if not self.document_id:
-            inserted_id = await self._repo.insert(self._document)
-            self.document_id = inserted_id
+            await self.insert()
+            return
+        dirty = self.dirty_fields
+        if not dirty:
+            _saves["skipped"] += 1
+            return
+        if self._stored is not None and dirty <= self._document.keys():
+            fields = {field: self._document[field] for field in dirty}
+            await self._repo.update_fields(self.document_id, fields)
+            self._stored.update(deepcopy(fields))
         else:
-            self._document = await self._repo.replace(
-                self.document_id, self._document
+            self._load(
+                await self._repo.replace(self.document_id, self._document)
             )
+        _saves["written"] += 1
+
+    @traced
+    async def increment(
+        self,
+        field: str,
+        amount: int = 1,
+        once: tuple[str, Any] | None = None,
+    ) -> int:
+        """Atomically add to an integer field of the stored document.
+
+        Args:
+            field: The field to increment.
+            amount: How much to add.
+            once: Optional ``(marker, token)`` pair: the increment is
+                skipped when the *marker* field already holds *token*,
+                so retrying it is safe.
+
+        Returns:
+            The value of the field after the call.
+        """
+        value = await self._repo.increment(
+            self.document_id, field, amount, once  # type: ignore[arg-type]
+        )
+        changed: dict[str, Any] = {field: value}
+        if once is not None:
+            changed[once[0]] = once[1]
+        self._document.update(changed)
+        if self._stored is not None:
+            self._stored.update(deepcopy(changed))
+        return value
+
+    @traced
+    async def insert(self) -> None:
+        """Insert the document as a new one, keeping any ID set on it.
+
+        Setting the ID up front lets other documents refer to this one
+        before it is written.
+        """
+        self.document_id = await self._repo.insert(self._document)
+        self._stored = deepcopy(self._document)
+        _saves["written"] += 1
 
-    @async_log_event
+    @traced
     async def delete(self) -> None:
         """Delete the document from the store."""
         if self.document_id:
             await self._repo.delete_by_id(self.document_id)
+            self._stored = None
 
     @classmethod
     @abstractmethod
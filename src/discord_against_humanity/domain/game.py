@@ -1,30 +1,47 @@
 """Game state and logic for Cards Against Humanity."""
 
+import asyncio
 import logging
-from asyncio import sleep
-from random import sample, shuffle
+from random import randint, sample, shuffle
+from time import time
 from typing import Any, Self
+from uuid import uuid4
 
 from discord import CategoryChannel, Guild, TextChannel
 from discord.ext.commands import Bot
 
-from discord_against_humanity.domain.cards import BlackCard
-from discord_against_humanity.domain.document import Document
+from discord_against_humanity.domain.cards import (
+    BlackCard,
+    CardCatalog,
+    WhiteCard,
+)
+from discord_against_humanity.domain.document import Document, IdentityMap
+from discord_against_humanity.domain.phase import LEGACY_VOTING, Phase
 from discord_against_humanity.domain.player import Player
-from discord_against_humanity.ports.repository import RepositoryFactory
-from discord_against_humanity.utils.debug import async_log_event
+from discord_against_humanity.domain.pool import ChannelPool
+from discord_against_humanity.ports.notifier import Notifier
+from discord_against_humanity.ports.repository import (
+    DocumentNotFoundError,
+    RepositoryFactory,
+)
+from discord_against_humanity.ports.scheduler import Scheduler
 from discord_against_humanity.utils.embed import create_embed
+from discord_against_humanity.utils.fanout import fan_out, record_latencies
+from discord_against_humanity.utils.metrics import PHASE_SECONDS
+from discord_against_humanity.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
-_MAX_DRAW_ATTEMPTS = 200
-_POLL_INTERVAL = 5
+# Safety net only: round progress is driven by notifications, this is
+# how long a waiting round goes without one before re-checking anyway.
+_RECHECK_INTERVAL = 300
 
 
 class Game(Document):
     """Document class for a Cards Against Humanity game."""
 
     _COLLECTION = "games"
+    _bot: Bot
 
     # Properties
     # -------------------------------------------------------------------------
@@ -166,33 +183,61 @@ class Game(Document):
         self._document["playing"] = value
 
     @property
-    def voting(self) -> str | None:
-        """Get the current voting status.
+    def closing(self) -> bool:
+        """Check whether the game is being torn down.
 
         Returns:
-            Who is currently voting ('players', 'tsar', or 'nobody'), or None.
+            True once :meth:`teardown` has started.
+        """
+        return self._document.get("closing", False)
+
+    @property
+    def phase(self) -> Phase:
+        """Get the phase of the current round.
+
+        Games saved before phases existed are read from their legacy
+        ``voting`` field.
+
+        Returns:
+            The current Phase.
         """
         try:
-            return self._document["voting"]
+            return Phase(self._document["phase"])
         except KeyError:
-            return None
+            voting = self._document.get("voting", "nobody")
+            return LEGACY_VOTING.get(voting, Phase.IDLE)
 
-    @voting.setter
-    def voting(self, value: str) -> None:
-        """Set the current voting status.
+    @property
+    def phase_since(self) -> float | None:
+        """Get when the current phase started.
 
-        Args:
-            value: Who should vote ('players', 'tsar', or 'nobody').
+        Returns:
+            The start time as a Unix timestamp, or None.
+        """
+        return self._document.get("phase_since")
 
-        Raises:
-            TypeError: If value is not a str.
-            ValueError: If value is not a valid voting status.
+    @property
+    def deadline(self) -> float | None:
+        """Get when the current phase times out.
+
+        Returns:
+            The deadline as a Unix timestamp, or None if the phase has
+            no time limit.
         """
-        if not isinstance(value, str):
-            raise TypeError(f"Wrong type for value: {type(value)}")
-        if value not in ("players", "tsar", "nobody"):
-            raise ValueError("Wrong value for voting")
-        self._document["voting"] = value
+        return self._document.get("deadline")
+
+    @property
+    def voting(self) -> str:
+        """Get who is currently voting, derived from the phase.
+
+        Returns:
+            'players', 'tsar', or 'nobody'.
+        """
+        if self.phase is Phase.PLAYERS_VOTING:
+            return "players"
+        if self.phase is Phase.TSAR_VOTING:
+            return "tsar"
+        return "nobody"
 
     @property
     def players_id(self) -> list[Any] | None:
@@ -208,10 +253,13 @@ class Game(Document):
 
     @property
     def black_cards_id(self) -> list[Any] | None:
-        """Get the list of used Black Card IDs.
+        """Get the Black Card IDs of the game.
+
+        The last one is the card in play.  Games started before draw
+        piles existed also list every card used before.
 
         Returns:
-            List of used black card IDs, or None.
+            List of black card IDs, or None.
         """
         try:
             return self._document["black_cards"]
@@ -220,7 +268,10 @@ class Game(Document):
 
     @property
     def white_cards_id(self) -> list[Any] | None:
-        """Get the list of used White Card IDs.
+        """Get the White Card IDs used before draw piles existed.
+
+        Only games started before then have any; they are left out of
+        the game's pile by :meth:`restore_decks`, then cleared.
 
         Returns:
             List of used white card IDs, or None.
@@ -242,6 +293,36 @@ class Game(Document):
         except KeyError:
             return None
 
+    @property
+    def _notifier(self) -> Notifier:
+        """Get the notifier used to wake up the round loop.
+
+        Returns:
+            The bot's Notifier.
+        """
+        notifier: Notifier = self._bot.notifier  # type: ignore[attr-defined]
+        return notifier
+
+    @property
+    def _scheduler(self) -> Scheduler:
+        """Get the scheduler that fires phase deadlines.
+
+        Returns:
+            The bot's Scheduler.
+        """
+        scheduler: Scheduler = self._bot.scheduler  # type: ignore[attr-defined]
+        return scheduler
+
+    @property
+    def _catalog(self) -> CardCatalog | None:
+        """Get the in-memory card catalog, if the bot has loaded one.
+
+        Returns:
+            The bot's CardCatalog, or None before it is loaded.
+        """
+        catalog: CardCatalog | None = self._bot.catalog  # type: ignore[attr-defined]
+        return catalog
+
     # Class methods
     # -------------------------------------------------------------------------
 
@@ -251,6 +332,7 @@ class Game(Document):
         discord_bot: Bot,
         repo_factory: RepositoryFactory,
         guild: Guild,
+        identity_map: IdentityMap | None = None,
     ) -> Self:
         """Create a new Game instance.
 
@@ -258,10 +340,16 @@ class Game(Document):
             discord_bot: The Discord bot instance.
             repo_factory: Factory to create repositories.
             guild: The Discord guild for this game.
+            identity_map: Optional request-scoped cache.  When the
+                guild's game is already in it, that instance is returned
+                without touching the store.
 
         Returns:
             A new Game instance.
         """
+        key = (cls._COLLECTION, guild.id)
+        if identity_map is not None and key in identity_map:
+            return identity_map[key]  # type: ignore[return-value]
         self = Game(
             repository=repo_factory("games"),
             repo_factory=repo_factory,
@@ -269,6 +357,33 @@ class Game(Document):
         self._bot = discord_bot
         self._set_default_values()
         await self._get(guild.id)
+        if identity_map is not None:
+            identity_map[key] = self
+        return self
+
+    @classmethod
+    def from_document(
+        cls,
+        discord_bot: Bot,
+        repo_factory: RepositoryFactory,
+        document: dict[str, Any],
+    ) -> Self:
+        """Build a Game from an already-fetched document.
+
+        Args:
+            discord_bot: The Discord bot instance.
+            repo_factory: Factory to create repositories.
+            document: The game document, including its ``_id``.
+
+        Returns:
+            A new Game instance.
+        """
+        self = cls(
+            repository=repo_factory("games"),
+            repo_factory=repo_factory,
+        )
+        self._bot = discord_bot
+        self._load(document)
         return self
 
     # Private methods
@@ -282,7 +397,7 @@ class Game(Document):
         """
         document = await self._repo.find_one({"guild": guild})
         if document:
-            self._document = document
+            self._load(document)
 
     def _set_default_values(self) -> None:
         """Set default values for a new game document."""
@@ -294,8 +409,13 @@ class Game(Document):
         self._document["white_cards"] = []
         self._document["points"] = 5
         self._document["playing"] = False
-        self._document["voting"] = "nobody"
+        self._document["closing"] = False
+        self._document["decks"] = False
+        self._document["phase"] = Phase.IDLE
+        self._document["phase_since"] = None
+        self._document["deadline"] = None
         self._document["results"] = []
+        self._document["winner"] = None
         self._document["tsar"] = 0
 
     async def _reload(self) -> None:
@@ -303,25 +423,117 @@ class Game(Document):
         if self.document_id:
             await self.get(self.document_id)
 
+    async def _white_cards(self, card_ids: list[str]) -> dict[str, WhiteCard]:
+        """Load white cards with one read and index them by ID.
+
+        Args:
+            card_ids: IDs of the cards to load.
+
+        Returns:
+            Mapping of card ID to WhiteCard for the cards found.
+        """
+        cards = await WhiteCard.create_many(
+            self._repo_factory, card_ids, self._catalog
+        )
+        return {card.document_id: card for card in cards}  # type: ignore[misc]
+
+    def _round_timeout(self, phase: Phase) -> float | None:
+        """Get the configured time limit for a voting phase.
+
+        Args:
+            phase: The phase to look up.
+
+        Returns:
+            The limit in seconds, or None if the phase has no limit.
+        """
+        timeouts: dict[Phase, float | None] = self._bot.round_timeouts  # type: ignore[attr-defined]
+        return timeouts.get(phase)
+
+    def _arm_deadline(self) -> None:
+        """Have the scheduler wake the round loop at the phase deadline."""
+        if self.deadline is not None and self.document_id:
+            self._scheduler.schedule(
+                self.document_id, self.deadline, self.notify
+            )
+
+    def _deadline_passed(self) -> bool:
+        """Check whether the current phase has timed out.
+
+        Returns:
+            True if the phase has a deadline and it has been reached.
+        """
+        return self.deadline is not None and time() >= self.deadline
+
+    async def _auto_play(self) -> None:
+        """Play random cards for every player who has not answered.
+
+        Players whose hand is too small to answer, or who have left the
+        guild, are left out of the round.
+        """
+        pick = (await self.get_black_card()).pick
+        mentions: list[str] = []
+        for player in await self.get_players():
+            if player.document_id == self.tsar_id or player.answers_id:
+                continue
+            user = player.user
+            if user is None:
+                # The member left the guild: they sit this round out.
+                continue
+            hand_size = len(player.white_cards_id or [])
+            if hand_size < pick:
+                continue
+            await player.add_answers(sample(range(1, hand_size + 1), pick))
+            mentions.append(user.mention)
+        if mentions:
+            await self.board.send(  # type: ignore[union-attr]
+                f"Time's up! Random cards were played for {', '.join(mentions)}."
+            )
+
+    def is_proposal(self, answer: int) -> bool:
+        """Check whether *answer* numbers one of the round's proposals.
+
+        Players who did not answer are left out of the proposals, so
+        there can be fewer of them than players besides the tsar.
+
+        Args:
+            answer: The 1-based proposal number picked by the tsar.
+
+        Returns:
+            True if a proposal has that number.
+        """
+        return 1 <= answer <= len(self._document.get("results") or [])
+
+    async def _auto_choose(self) -> None:
+        """Choose a random winning proposal on the tsar's behalf."""
+        tsar = await self.get_tsar()
+        tsar.tsar_choice = randint(1, len(self._document["results"]))
+        await tsar.save()
+        await self.board.send(  # type: ignore[union-attr]
+            "Time's up! A random winner was chosen for the tsar."
+        )
+
+    async def _wait_for_change(self) -> None:
+        """Wait until the game is notified, then reload it."""
+        await self._notifier.wait(
+            self.document_id, _RECHECK_INTERVAL  # type: ignore[arg-type]
+        )
+        await self._reload()
+
     # Public methods
     # -------------------------------------------------------------------------
 
-    @async_log_event
+    @traced
     async def get_players(self) -> list[Player]:
         """Get all players in this game.
 
         Returns:
             List of Player instances.
         """
-        players: list[Player] = []
-        for player_id in self.players_id:  # type: ignore[union-attr]
-            player = await Player.create(
-                self._bot, self._repo_factory, player_id
-            )
-            players.append(player)
-        return players
+        return await Player.create_many(
+            self._bot, self._repo_factory, self.players_id or []
+        )
 
-    @async_log_event
+    @traced
     async def add_player(self, player: Player) -> None:
         """Add a player to the game.
 
@@ -336,7 +548,30 @@ class Game(Document):
         self._document["players"].append(player.document_id)
         await self.save()
 
-    @async_log_event
+    @traced
+    async def join(self, player: Player) -> None:
+        """Save a joining player and add it to the game.
+
+        A new player gets its ID before being written, so the player
+        and the game are written concurrently.
+
+        Args:
+            player: The joining player.
+
+        Raises:
+            TypeError: If player is not a Player.
+        """
+        if not isinstance(player, Player):
+            raise TypeError("Wrong type for player")
+        if player.document_id:
+            write = player.save()
+        else:
+            player.document_id = str(uuid4())
+            write = player.insert()
+        self._document["players"].append(player.document_id)
+        await asyncio.gather(write, self.save())
+
+    @traced
     async def delete_player(self, player: Player) -> None:
         """Remove a player from the game.
 
@@ -351,7 +586,42 @@ class Game(Document):
         self._document["players"].remove(player.document_id)
         await self.save()
 
-    @async_log_event
+    @traced
+    async def transition(
+        self, phase: Phase, timeout: float | None = None
+    ) -> None:
+        """Move the round to *phase* and persist it in one write.
+
+        Args:
+            phase: The phase to move to.
+            timeout: Optional time limit for the new phase, in seconds.
+
+        Raises:
+            ValueError: If the round cannot move to *phase* from the
+                current phase.
+        """
+        if not self.phase.can_become(phase):
+            raise ValueError(f"Cannot move from {self.phase} to {phase}")
+        now = time()
+        if self.phase_since is not None:
+            PHASE_SECONDS.observe(now - self.phase_since, phase=self.phase)
+        self._document.pop("voting", None)
+        self._document["phase"] = phase
+        self._document["phase_since"] = now
+        self._document["deadline"] = None if timeout is None else now + timeout
+        await self.save()
+
+    @traced
+    async def notify(self) -> None:
+        """Wake up the round loop waiting on this game.
+
+        Call after any change the loop waits for: a player or tsar
+        vote, a player leaving, or the game being stopped.
+        """
+        if self.document_id:
+            await self._notifier.notify(self.document_id)
+
+    @traced
     async def get_players_answers(self) -> int:
         """Count the number of players who have answered.
 
@@ -366,7 +636,7 @@ class Game(Document):
                     count += 1
         return count
 
-    @async_log_event
+    @traced
     async def get_players_score(self) -> list[list[Any]]:
         """Get all players and their scores.
 
@@ -379,7 +649,7 @@ class Game(Document):
             scores.append([player, player.score])
         return scores
 
-    @async_log_event
+    @traced
     async def is_points_max(self) -> bool:
         """Check if any player has reached the maximum score.
 
@@ -389,7 +659,7 @@ class Game(Document):
         scores = await self.get_players_score()
         return not all(score < self.points for _player, score in scores)
 
-    @async_log_event
+    @traced
     async def score(self) -> None:
         """Display the current scoreboard in the board channel."""
         scores = await self.get_players_score()
@@ -405,7 +675,7 @@ class Game(Document):
         message = create_embed({"title": "Score", "fields": fields})
         await self.board.send(embed=message)  # type: ignore[union-attr]
 
-    @async_log_event
+    @traced
     async def get_black_card(self) -> BlackCard:
         """Get the last drawn black card.
 
@@ -414,36 +684,83 @@ class Game(Document):
         """
         black_card_id = self.black_cards_id[-1]  # type: ignore[index]
         black_card = await BlackCard.create(
-            self._repo_factory, black_card_id
+            self._repo_factory, black_card_id, self._catalog
         )
         return black_card
 
-    @async_log_event
+    @traced
+    async def build_decks(self) -> None:
+        """Shuffle fresh black and white card draw piles for this game.
+
+        Must be called once when the game starts, before any card is
+        drawn.  The game is marked as having piles, but not saved.
+        """
+        self._document["decks"] = True
+        for collection in ("black_cards", "white_cards"):
+            size = await self._repo_factory(collection).create_pile(
+                self.document_id  # type: ignore[arg-type]
+            )
+            logger.debug("Built %s deck of %d cards", collection, size)
+
+    @traced
+    async def restore_decks(self) -> None:
+        """Build the draw piles of a game started before they existed.
+
+        Such games have no piles, so every draw would come back empty.
+        Their piles are built from every card that is not already used,
+        held in a hand or played as an answer.  Does nothing for games
+        whose piles were built by :meth:`build_decks`.
+        """
+        if self._document.get("decks"):
+            return
+        used_white = list(self.white_cards_id or [])
+        for player in await self.get_players():
+            used_white.extend(player.white_cards_id or [])
+            used_white.extend(player.answers_id or [])
+        in_play = {
+            "black_cards": list(self.black_cards_id or []),
+            "white_cards": used_white,
+        }
+        for collection, exclude in in_play.items():
+            size = await self._repo_factory(collection).create_pile(
+                self.document_id, exclude  # type: ignore[arg-type]
+            )
+            logger.info(
+                "Restored %s deck of %d cards for game %s",
+                collection,
+                size,
+                self.document_id,
+            )
+        self._document["decks"] = True
+        self._document["white_cards"] = []
+        await self.save()
+
+    @traced
     async def draw_black_card(self) -> Any:
         """Draw a new black card and return its embed message.
 
+        The previous black card goes to the discard pile, which is
+        reshuffled into the deck once the deck runs out.
+
         Returns:
             A Discord Embed with the black card question.
 
         Raises:
-            RuntimeError: If no new card can be drawn after max attempts.
+            RuntimeError: If the deck and discard pile are both empty.
         """
-        attempts = 0
-        card_number = len(self.black_cards_id)  # type: ignore[arg-type]
         bc_repo = self._repo_factory("black_cards")
-        while len(self.black_cards_id) == card_number:  # type: ignore[arg-type]
-            attempts += 1
-            if attempts > _MAX_DRAW_ATTEMPTS:
-                raise RuntimeError(
-                    "Could not draw a new black card: "
-                    "deck may be exhausted"
-                )
-            document = await bc_repo.random_member()
-            if document is not None:
-                if document["_id"] not in self.black_cards_id:  # type: ignore[operator]
-                    self._document["black_cards"].append(
-                        document["_id"]
-                    )
+        if self.black_cards_id:
+            await bc_repo.discard_to_pile(
+                self.document_id,  # type: ignore[arg-type]
+                [self.black_cards_id[-1]],
+            )
+        drawn = await bc_repo.draw_from_pile(self.document_id)  # type: ignore[arg-type]
+        if not drawn:
+            raise RuntimeError(
+                "Could not draw a new black card: deck is exhausted"
+            )
+        # Only the card in play is kept: the pile tracks the rest.
+        self._document["black_cards"] = [drawn[0]]
         await self.save()
 
         black_card = await self.get_black_card()
@@ -455,7 +772,49 @@ class Game(Document):
         )
         return message
 
-    @async_log_event
+    @traced
+    async def deal_round(self, players: list[Player]) -> None:
+        """Top up every player's hand and send them their cards.
+
+        The whole table is dealt with one pile draw, the updated players
+        are persisted with one batched replace, and every card in every
+        hand is fetched with one batched read, regardless of the number
+        of players.  Hands are then sent to every player concurrently.
+
+        Args:
+            players: The players to deal to.
+        """
+        missing = [player.missing_white_cards for player in players]
+        drawn = await self._repo_factory("white_cards").draw_from_pile(
+            self.document_id, sum(missing)  # type: ignore[arg-type]
+        )
+        if len(drawn) < sum(missing):
+            logger.warning("Could not fill hands: deck is exhausted")
+        for player, count in zip(players, missing):
+            player.white_cards_id.extend(drawn[:count])  # type: ignore[union-attr]
+            drawn = drawn[count:]
+
+        replaced = await self._repo_factory("players").replace_many(
+            [player._document for player in players]
+        )
+        for player, document in zip(players, replaced):
+            player._load(document)
+
+        hands = [player.white_cards_id or [] for player in players]
+        cards = await self._white_cards(
+            [card_id for hand in hands for card_id in hand]
+        )
+        await fan_out(
+            "hands",
+            (
+                player.send_hand(
+                    [cards[card_id] for card_id in hand if card_id in cards]
+                )
+                for player, hand in zip(players, hands)
+            ),
+        )
+
+    @traced
     async def get_tsar(self) -> Player:
         """Get the current tsar player.
 
@@ -467,7 +826,7 @@ class Game(Document):
         )
         return player
 
-    @async_log_event
+    @traced
     async def set_random_tsar(self) -> None:
         """Set a new random tsar from the player list.
 
@@ -479,7 +838,7 @@ class Game(Document):
         self._document["tsar"] = sample(self.players_id, 1)[0]
         await self.save()
 
-    @async_log_event
+    @traced
     async def get_tsar_answer(self) -> bool:
         """Check if the tsar has voted.
 
@@ -491,31 +850,47 @@ class Game(Document):
             return True
         return False
 
-    @async_log_event
+    @traced
     async def send_answers(self) -> Any:
         """Combine player answers with the black card and send proposals.
 
+        All answer cards are fetched with one read and every player's
+        answers are cleared with one batched write.
+
         Returns:
             A Discord Embed with the shuffled proposals.
         """
         results: list[list[Any]] = []
         black_card = await self.get_black_card()
-        players = await self.get_players()
+        players = [
+            player
+            for player in await self.get_players()
+            if player.document_id != self.tsar_id and player.answers_id
+        ]
+        played = [
+            card_id for player in players for card_id in player.answers_id  # type: ignore[union-attr]
+        ]
+        cards = await self._white_cards(played)
         for player in players:
-            if player.document_id != self.tsar_id:
-                answers: list[str] = []
-                player_answers = await player.get_answers()
-                for answer in player_answers:
-                    self._document["white_cards"].append(
-                        answer.document_id
-                    )
-                    answers.append(answer.text)
-                result = black_card.text.format(*answers)
-                results.append([player.document_id, result])
-                await player.delete_answers()
+            answers = [
+                cards[card_id].text
+                for card_id in player.answers_id  # type: ignore[union-attr]
+                if card_id in cards
+            ]
+            result = black_card.text.format(*answers)  # type: ignore[union-attr]
+            results.append([player.document_id, result])
+            player._document["answers"] = []
+        replaced = await self._repo_factory("players").replace_many(
+            [player._document for player in players]
+        )
+        for player, document in zip(players, replaced):
+            player._load(document)
         shuffle(results)
         self._document["results"] = results
         await self.save()
+        await self._repo_factory("white_cards").discard_to_pile(
+            self.document_id, played  # type: ignore[arg-type]
+        )
 
         proposals = ""
         for index, value in enumerate(self._document["results"]):
@@ -531,70 +906,246 @@ class Game(Document):
         )
         return message
 
-    @async_log_event
+    @traced
     async def wait_for_players_answers(self) -> None:
         """Wait for all non-tsar players to vote.
 
-        Exits early if the game is stopped.
+        Re-checks the votes each time the game is notified (see
+        :meth:`notify`) rather than polling.  When the phase deadline
+        passes, random cards are played for the players who have not
+        answered.  Exits early if the game is stopped.
         """
-        self.voting = "players"
-        await self.save()
-
         await self.board.send(  # type: ignore[union-attr]
             "Time to vote! Vote in your private channel by using `/vote`"
         )
 
-        number_of_answers = await self.get_players_answers()
-        while number_of_answers != len(self.players_id) - 1:  # type: ignore[arg-type]
-            await sleep(_POLL_INTERVAL)
-            await self._reload()
-            if not self.playing:
-                break
+        self._arm_deadline()
+        try:
             number_of_answers = await self.get_players_answers()
-
-        self.voting = "nobody"
-        await self.save()
-
-    @async_log_event
+            while number_of_answers != len(self.players_id) - 1:  # type: ignore[arg-type]
+                if self._deadline_passed():
+                    await self._auto_play()
+                    break
+                await self._wait_for_change()
+                if not self.playing:
+                    break
+                number_of_answers = await self.get_players_answers()
+        finally:
+            self._scheduler.cancel(self.document_id)  # type: ignore[arg-type]
+
+    @traced
     async def wait_for_tsar_answer(self) -> None:
         """Wait for the tsar to vote.
 
+        Re-checks the tsar's choice each time the game is notified.
+        When the phase deadline passes, a random winner is chosen.
         Exits early if the game is stopped.
         """
-        self.voting = "tsar"
-        await self.save()
-
         await self.board.send(  # type: ignore[union-attr]
             "Time for tsar to decide! Vote in your private channel "
             "by using `/tsar`"
         )
 
-        tsar_answer = await self.get_tsar_answer()
-        while not tsar_answer:
-            await sleep(_POLL_INTERVAL)
+        self._arm_deadline()
+        try:
+            tsar_answer = await self.get_tsar_answer()
+            while not tsar_answer:
+                if self._deadline_passed():
+                    await self._auto_choose()
+                    break
+                await self._wait_for_change()
+                if not self.playing:
+                    break
+                tsar_answer = await self.get_tsar_answer()
+        finally:
+            self._scheduler.cancel(self.document_id)  # type: ignore[arg-type]
+
+    @traced
+    async def play(self) -> None:
+        """Play rounds until a player reaches the points goal.
+
+        Resumes from the persisted phase, so a game picked up after a
+        restart carries on with the round in progress.  Returns early
+        if the game is stopped.
+        """
+        await self._reload()
+        await self.restore_decks()
+        while self.playing and not await self.is_points_max():
+            await self.play_round()
             await self._reload()
+
+    @traced
+    async def play_round(self) -> None:
+        """Play one round, starting from the current phase.
+
+        Each step moves the round to its next phase, so a round
+        interrupted at any point resumes from the last phase reached.
+        A round resumed while scoring is scored before it ends; it then
+        goes back to idle.  The time spent in Discord fan-outs is logged
+        once the round returns.
+        """
+        with record_latencies() as latencies:
+            try:
+                await self._play_round()
+            finally:
+                if latencies:
+                    logger.info(
+                        "Round of game %s: fan-out latency %s",
+                        self.document_id,
+                        ", ".join(
+                            f"{label} {elapsed:.1f} ms"
+                            for label, elapsed in latencies.items()
+                        ),
+                    )
+
+    async def _play_round(self) -> None:
+        """Run the steps of :meth:`play_round`."""
+        if self.phase is Phase.IDLE:
+            await self.transition(Phase.DEALING)
+        tsar = await self.get_tsar()
+        if self.phase is Phase.DEALING:
+            await self.board.send(  # type: ignore[union-attr]
+                f"{tsar.user.mention}! You're the tsar!"
+            )
+            question = await self.draw_black_card()
+            players = await self.get_players()
+            channels = [self.board] + [player.channel for player in players]
+            await fan_out(
+                "question",
+                (
+                    channel.send(embed=question)
+                    for channel in channels
+                    if channel is not None
+                ),
+            )
+            await self.deal_round(players)
+            await self.transition(
+                Phase.PLAYERS_VOTING,
+                self._round_timeout(Phase.PLAYERS_VOTING),
+            )
+        if self.phase is Phase.PLAYERS_VOTING:
+            await self.wait_for_players_answers()
             if not self.playing:
-                break
-            tsar_answer = await self.get_tsar_answer()
+                return
+            proposals = await self.send_answers()
+            if not self._document["results"]:
+                await self.board.send(  # type: ignore[union-attr]
+                    "Nobody answered, skipping this round."
+                )
+                await self.transition(Phase.IDLE)
+                return
+            await fan_out(
+                "proposals",
+                (
+                    channel.send(embed=proposals)
+                    for channel in (self.board, tsar.channel)
+                    if channel is not None
+                ),
+            )
+            await self.transition(
+                Phase.TSAR_VOTING, self._round_timeout(Phase.TSAR_VOTING)
+            )
+        if self.phase is Phase.TSAR_VOTING:
+            await self.wait_for_tsar_answer()
+            if not self.playing:
+                return
+            await self.transition(Phase.SCORING)
+        if self.phase is Phase.SCORING:
+            await self.select_winner()
+            await self.score()
+            await self.transition(Phase.IDLE)
+
+    @traced
+    async def teardown(self) -> None:
+        """Delete the game and its players, pooling their channels.
+
+        The game is first marked as closing, which stops its round loop.
+        Channels are then released to the guild's :class:`ChannelPool`
+        concurrently, and player documents deleted with one batched
+        delete.  The game document goes last, so an interrupted teardown
+        can simply be run again: releasing a channel twice is harmless
+        and players already gone are skipped.
 
-        self.voting = "nobody"
-        await self.save()
+        Raises:
+            RuntimeError: If some channels could not be released.  The
+                game is kept so the teardown can be retried.
+        """
+        if not self.closing:
+            self.playing = False
+            self._document["closing"] = True
+            try:
+                await self.save()
+            except DocumentNotFoundError:
+                logger.debug("Game %s is already deleted", self.document_id)
+                return
+            await self.notify()
 
-    @async_log_event
+        players = await self.get_players()
+        pool = ChannelPool(self._repo_factory, self._document["guild"])
+        results = await fan_out(
+            "teardown",
+            [
+                pool.release(self.board, board=True),
+                *(pool.release(player.channel) for player in players),
+            ],
+        )
+        deleted = [
+            player.document_id
+            for player, result in zip(players, results[1:])
+            if result is True
+        ]
+        await self._repo_factory("players").delete_many(deleted)  # type: ignore[arg-type]
+        if len(deleted) < len(players) or results[0] is not True:
+            self._document["players"] = [
+                player_id
+                for player_id in self.players_id or []
+                if player_id not in deleted
+            ]
+            await self.save()
+            raise RuntimeError(
+                f"Could not release every channel of game {self.document_id}"
+            )
+        await self.delete()
+
+    @traced
+    async def delete(self) -> None:
+        """Delete the game along with its draw piles."""
+        if self.document_id:
+            for collection in ("black_cards", "white_cards"):
+                await self._repo_factory(collection).delete_pile(
+                    self.document_id
+                )
+        await super().delete()
+
+    @traced
     async def select_winner(self) -> None:
-        """Award a point to the winner and make them the next tsar."""
-        tsar = await self.get_tsar()
-        tsar_choice = tsar.tsar_choice
-        await tsar.delete_choice()
+        """Award a point to the winner and make them the next tsar.
+
+        Safe to run again after an interruption at any point.  The
+        winner is saved on the game, with an ID for the win, before
+        anything else.  The point is awarded with one atomic increment
+        that records that ID on the winner's document, so it is awarded
+        once, and the tsar's choice is only cleared after that.  Does
+        nothing once the new tsar is in place.
+        """
+        if self._document.get("winner") is None:
+            tsar = await self.get_tsar()
+            if not tsar.tsar_choice:
+                return
+            winner_id = self._document["results"][tsar.tsar_choice - 1][0]
+            self._document["winner"] = [winner_id, uuid4().hex]
+            await self.save()
+        player_id, win_id = self._document["winner"]
 
-        player_id = self._document["results"][tsar_choice - 1][0]
         player = await Player.create(
             self._bot, self._repo_factory, player_id
         )
-        player.score += 1
-        await player.save()
+        await player.increment("score", once=("win", win_id))
 
+        tsar = await self.get_tsar()
+        await tsar.delete_choice()
         self._document["tsar"] = player_id
+        self._document["winner"] = None
         await self.save()
         await self.board.send(  # type: ignore[union-attr]
             f"{player.user.mention} has won this round!"
@@ -0,0 +1,45 @@
+"""Round phases of a Cards Against Humanity game."""
+
+from enum import StrEnum
+
+
+class Phase(StrEnum):
+    """The phase a game's current round is in.
+
+    A round goes ``dealing`` → ``players_voting`` → ``tsar_voting`` →
+    ``scoring``, then back to ``dealing`` for the next one.  ``idle``
+    means no round is in progress; any phase may fall back to it.
+    """
+
+    IDLE = "idle"
+    DEALING = "dealing"
+    PLAYERS_VOTING = "players_voting"
+    TSAR_VOTING = "tsar_voting"
+    SCORING = "scoring"
+
+    def can_become(self, phase: "Phase") -> bool:
+        """Check whether a round may move from this phase to *phase*.
+
+        Args:
+            phase: The phase to move to.
+
+        Returns:
+            True if the transition is allowed.
+        """
+        return phase is Phase.IDLE or phase in _TRANSITIONS[self]
+
+
+_TRANSITIONS: dict[Phase, frozenset[Phase]] = {
+    Phase.IDLE: frozenset({Phase.DEALING}),
+    Phase.DEALING: frozenset({Phase.PLAYERS_VOTING}),
+    Phase.PLAYERS_VOTING: frozenset({Phase.TSAR_VOTING}),
+    Phase.TSAR_VOTING: frozenset({Phase.SCORING}),
+    Phase.SCORING: frozenset({Phase.DEALING}),
+}
+
+# Phase stored by games saved before phases existed, keyed by their
+# ``voting`` field.
+LEGACY_VOTING: dict[str, Phase] = {
+    "players": Phase.PLAYERS_VOTING,
+    "tsar": Phase.TSAR_VOTING,
+}
@@ -7,11 +7,11 @@ import discord
 from discord import Guild, Member, TextChannel
 from discord.ext.commands import Bot
 
-from discord_against_humanity.domain.cards import WhiteCard
-from discord_against_humanity.domain.document import Document
+from discord_against_humanity.domain.cards import CardCatalog, WhiteCard
+from discord_against_humanity.domain.document import Document, IdentityMap
 from discord_against_humanity.ports.repository import RepositoryFactory
-from discord_against_humanity.utils.debug import async_log_event
 from discord_against_humanity.utils.embed import create_embed
+from discord_against_humanity.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,7 @@ class Player(Document):
     """Document class for a Cards Against Humanity player."""
 
     _COLLECTION = "players"
+    _bot: Bot
 
     # Properties
     # -------------------------------------------------------------------------
@@ -186,6 +187,25 @@ class Player(Document):
         except KeyError:
             return None
 
+    @property
+    def missing_white_cards(self) -> int:
+        """Get the number of white cards needed to fill the hand.
+
+        Returns:
+            How many cards the player must draw to hold a full hand.
+        """
+        return max(0, _WHITE_CARDS_NUMBER - len(self.white_cards_id or []))
+
+    @property
+    def _catalog(self) -> CardCatalog | None:
+        """Get the in-memory card catalog, if the bot has loaded one.
+
+        Returns:
+            The bot's CardCatalog, or None before it is loaded.
+        """
+        catalog: CardCatalog | None = self._bot.catalog  # type: ignore[attr-defined]
+        return catalog
+
     # Class methods
     # -------------------------------------------------------------------------
 
@@ -197,6 +217,7 @@ class Player(Document):
         document_id: str | None = None,
         user: Member | discord.User | None = None,
         guild: Guild | None = None,
+        identity_map: IdentityMap | None = None,
     ) -> Self:
         """Create a new Player instance.
 
@@ -206,10 +227,19 @@ class Player(Document):
             document_id: Optional ID to load an existing player.
             user: Optional Discord Member/User to look up an existing player.
             guild: Optional Discord Guild to resolve member from user.
+            identity_map: Optional request-scoped cache for look-ups by
+                user.  When the player is already in it, that instance is
+                returned without touching the store.
 
         Returns:
             A new Player instance.
         """
+        key = None
+        if user and not document_id:
+            guild_id = guild.id if guild is not None else None
+            key = (cls._COLLECTION, (guild_id, user.id))
+            if identity_map is not None and key in identity_map:
+                return identity_map[key]  # type: ignore[return-value]
         self = Player(
             repository=repo_factory("players"),
             repo_factory=repo_factory,
@@ -227,9 +257,44 @@ class Player(Document):
                     member = resolved
             if isinstance(member, Member):
                 await self._get(member)
+        if identity_map is not None and key is not None:
+            identity_map[key] = self
         logger.debug("Player Document: %s", self._document)
         return self
 
+    @classmethod
+    async def create_many(
+        cls,
+        discord_bot: Bot,
+        repo_factory: RepositoryFactory,
+        document_ids: list[str],
+    ) -> list[Self]:
+        """Load several Players with a single repository read.
+
+        Args:
+            discord_bot: The Discord bot instance.
+            repo_factory: Factory to create repositories.
+            document_ids: IDs of the players to load.
+
+        Returns:
+            The players found, in the order of *document_ids*.  Missing
+            players are skipped.
+        """
+        documents = await repo_factory("players").find_many(document_ids)
+        players: list[Self] = []
+        for document_id, document in zip(document_ids, documents):
+            if document is None:
+                logger.warning("Player %s not found", document_id)
+                continue
+            self = cls(
+                repository=repo_factory("players"),
+                repo_factory=repo_factory,
+            )
+            self._bot = discord_bot
+            self._load(document)
+            players.append(self)
+        return players
+
     # Private methods
     # -------------------------------------------------------------------------
 
@@ -248,7 +313,7 @@ class Player(Document):
             {"user": user.id, "guild": user.guild.id}
         )
         if document:
-            self._document = document
+            self._load(document)
 
     def _set_default_values(self) -> None:
         """Set default values for a new player document."""
@@ -263,53 +328,49 @@ class Player(Document):
     # Public methods
     # -------------------------------------------------------------------------
 
-    @async_log_event
+    @traced
     async def get_white_cards(self) -> list[WhiteCard]:
         """Get the white cards in this player's hand.
 
         Returns:
             List of WhiteCard instances.
         """
-        cards: list[WhiteCard] = []
-        for card_id in self.white_cards_id:  # type: ignore[union-attr]
-            card = await WhiteCard.create(self._repo_factory, card_id)
-            cards.append(card)
-        return cards
-
-    @async_log_event
-    async def draw_white_cards(self, used_cards: list[Any]) -> None:
+        return await WhiteCard.create_many(
+            self._repo_factory, self.white_cards_id or [], self._catalog
+        )
+
+    @traced
+    async def draw_white_cards(self, deck: str) -> None:
         """Draw white cards until the player has a full hand.
 
-        Prevents drawing duplicates already in hand or in
-        the global used-cards list.  Stops after a maximum number
-        of attempts to avoid an infinite loop when the deck is
-        nearly exhausted.
+        All missing cards are drawn from the game's white card pile in
+        a single call, so they can never duplicate a card already in
+        play.
 
         Args:
-            used_cards: List of IDs for already-used cards.
+            deck: Name of the game's draw pile (the game ID).
         """
-        max_attempts = 200
-        attempts = 0
-        wc_repo = self._repo_factory("white_cards")
-        while len(self.white_cards_id) != _WHITE_CARDS_NUMBER:  # type: ignore[arg-type]
-            attempts += 1
-            if attempts > max_attempts:
+        missing = self.missing_white_cards
+        if missing > 0:
+            wc_repo = self._repo_factory("white_cards")
+            drawn = await wc_repo.draw_from_pile(deck, missing)
+            if len(drawn) < missing:
                 logger.warning(
-                    "Could not fill hand: deck may be exhausted"
+                    "Could not fill hand: deck is exhausted"
                 )
-                break
-            document = await wc_repo.random_member()
-            if document is not None:
-                card_id = document["_id"]
-                if (
-                    card_id not in used_cards
-                    and card_id not in self.white_cards_id  # type: ignore[operator]
-                ):
-                    self._document["white_cards"].append(card_id)
+            self._document["white_cards"].extend(drawn)
         await self.save()
 
+        await self.send_hand(await self.get_white_cards())
+
+    @traced
+    async def send_hand(self, white_cards: list[WhiteCard]) -> None:
+        """Send the player's hand to their private channel.
+
+        Args:
+            white_cards: The cards in hand, in hand order.
+        """
         proposals = ""
-        white_cards = await self.get_white_cards()
         for index, card in enumerate(white_cards):
             proposals += f"{index + 1}. {card.text}\n"
         embed = create_embed(
@@ -323,20 +384,18 @@ class Player(Document):
         )
         await self.channel.send(embed=embed)  # type: ignore[union-attr]
 
-    @async_log_event
+    @traced
     async def get_answers(self) -> list[WhiteCard]:
         """Get the white cards selected as answers.
 
         Returns:
             List of WhiteCard instances.
         """
-        cards: list[WhiteCard] = []
-        for card_id in self.answers_id:  # type: ignore[union-attr]
-            card = await WhiteCard.create(self._repo_factory, card_id)
-            cards.append(card)
-        return cards
+        return await WhiteCard.create_many(
+            self._repo_factory, self.answers_id or [], self._catalog
+        )
 
-    @async_log_event
+    @traced
     async def add_answers(self, answers: list[int]) -> None:
         """Store the player's answer choices and remove cards from hand.
 
@@ -349,13 +408,13 @@ class Player(Document):
             del self.white_cards_id[answer - 1]  # type: ignore[index]
         await self.save()
 
-    @async_log_event
+    @traced
     async def delete_answers(self) -> None:
         """Clear the player's stored answers."""
         self._document["answers"] = []
         await self.save()
 
-    @async_log_event
+    @traced
     async def delete_choice(self) -> None:
         """Clear the tsar's choice."""
         self.tsar_choice = 0
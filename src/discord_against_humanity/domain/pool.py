@@ -0,0 +1,133 @@
+"""Per-guild pool of game channels, recycled between games."""
+
+import logging
+
+import discord
+from discord import CategoryChannel, Guild, PermissionOverwrite, TextChannel
+
+from discord_against_humanity.ports.repository import RepositoryFactory
+
+logger = logging.getLogger(__name__)
+
+Overwrites = dict[discord.Role | discord.Member | discord.Object, PermissionOverwrite]
+
+
+def default_overwrites(guild: Guild) -> Overwrites:
+    """Build the permissions of a game channel nobody has joined.
+
+    Args:
+        guild: The Discord guild.
+
+    Returns:
+        Overwrites hiding the channel from everyone but the bot.
+    """
+    return {
+        guild.default_role: PermissionOverwrite(read_messages=False),
+        guild.me: PermissionOverwrite(read_messages=True, send_messages=True),
+    }
+
+
+class ChannelPool:
+    """The spare game channels of a guild.
+
+    Creating channels is one of Discord's most rate-limited routes, so
+    the channels of a finished game are hidden, emptied and kept for the
+    next one instead of being deleted.  Spare boards keep their
+    category; spare player channels are moved to the category of the
+    game that takes them.
+
+    The IDs of spare channels live in draw piles of the ``channels``
+    collection, so taking a channel is atomic even when several
+    commands run at once.
+    """
+
+    _COLLECTION = "channels"
+
+    def __init__(self, repo_factory: RepositoryFactory, guild_id: int) -> None:
+        """Create the pool of a guild.
+
+        Args:
+            repo_factory: Factory to create repositories.
+            guild_id: ID of the guild whose channels are pooled.
+        """
+        self._repo = repo_factory(self._COLLECTION)
+        self._boards = f"{guild_id}:boards"
+        self._channels = f"{guild_id}:players"
+
+    async def _take(self, guild: Guild, pile: str) -> TextChannel | None:
+        """Take a spare channel that still exists out of a pile.
+
+        Args:
+            guild: The guild the channel belongs to.
+            pile: Name of the pile to draw from.
+
+        Returns:
+            The channel, or None once the pile is empty.
+        """
+        while drawn := await self._repo.draw_from_pile(pile):
+            channel = guild.get_channel(int(drawn[0]))
+            if isinstance(channel, TextChannel):
+                return channel
+            logger.debug("Spare channel %s is gone, skipping it", drawn[0])
+        return None
+
+    async def take_board(self, guild: Guild) -> TextChannel:
+        """Get a board for a new game, with its category.
+
+        Args:
+            guild: The guild of the game.
+
+        Returns:
+            A spare board, or a new one in a new category.
+        """
+        board = await self._take(guild, self._boards)
+        if board is not None and board.category is not None:
+            return board
+        if board is not None:
+            await board.delete()
+        category = await guild.create_category("Cards Against Humanity")
+        return await guild.create_text_channel(
+            "board", category=category, overwrites=default_overwrites(guild)
+        )
+
+    async def take_channel(
+        self, name: str, category: CategoryChannel, overwrites: Overwrites
+    ) -> TextChannel:
+        """Get a private channel for a new player.
+
+        Args:
+            name: Name of the channel.
+            category: Category of the player's game.
+            overwrites: Permissions of the channel.
+
+        Returns:
+            A spare channel set up in one edit, or a new channel.
+        """
+        channel = await self._take(category.guild, self._channels)
+        if channel is None:
+            return await category.create_text_channel(name, overwrites=overwrites)
+        await channel.edit(name=name, category=category, overwrites=overwrites)
+        return channel
+
+    async def release(self, channel: TextChannel | None, board: bool = False) -> bool:
+        """Hide and empty a channel, then keep it for another game.
+
+        Args:
+            channel: The channel to release, or None if it no longer
+                exists.
+            board: Whether the channel is a game's board.
+
+        Returns:
+            True once the channel is pooled or gone.
+        """
+        if channel is None:
+            return True
+        try:
+            await channel.edit(overwrites=default_overwrites(channel.guild))
+            await channel.purge(limit=None)
+        except discord.NotFound:
+            return True
+        await self._repo.discard_to_pile(
+            self._boards if board else self._channels, [str(channel.id)]
+        )
+        return True
@@ -1,17 +1,26 @@
 """Ports — repository contract and persistence adapters (output ports)."""
 
+from discord_against_humanity.ports.local import LocalNotifier, LocalScheduler
+from discord_against_humanity.ports.notifier import Notifier
 from discord_against_humanity.ports.repository import (
     DocumentNotFoundError,
     Repository,
 )
+from discord_against_humanity.ports.scheduler import Scheduler
 from discord_against_humanity.ports.valkey import (
+    ValkeyNotifier,
     ValkeyRepository,
     create_repo_factory,
 )
 
 __all__ = [
     "DocumentNotFoundError",
+    "LocalNotifier",
+    "LocalScheduler",
+    "Notifier",
     "Repository",
+    "Scheduler",
+    "ValkeyNotifier",
     "ValkeyRepository",
     "create_repo_factory",
 ]
@@ -0,0 +1,87 @@
+"""Codecs turning stored values into text and back for the Valkey adapter."""
+
+import json
+import logging
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+class JsonCodec:
+    """Encode values as compact JSON with the standard library."""
+
+    name = "json"
+
+    def dumps(self, value: Any) -> str:
+        """Encode a value.
+
+        Args:
+            value: A JSON-serializable value.
+
+        Returns:
+            The value as compact JSON text.
+        """
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+    def loads(self, data: str | bytes) -> Any:
+        """Decode a value.
+
+        Args:
+            data: JSON text, as written by any JSON codec.
+
+        Returns:
+            The decoded value.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Encode values as compact JSON with orjson.
+
+    The output is the same text :class:`JsonCodec` writes, so both
+    codecs read what the other wrote and switching between them needs
+    no migration.  Dict keys that are not strings are converted the
+    way the standard library does.
+    """
+
+    name = "orjson"
+
+    def dumps(self, value: Any) -> str:
+        """Encode a value.
+
+        Args:
+            value: A JSON-serializable value.
+
+        Returns:
+            The value as compact JSON text.
+        """
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, data: str | bytes) -> Any:
+        """Decode a value.
+
+        Args:
+            data: JSON text, as written by any JSON codec.
+
+        Returns:
+            The decoded value.
+        """
+        return orjson.loads(data)
+
+
+def default_codec() -> JsonCodec:
+    """Get the fastest codec available.
+
+    Returns:
+        An :class:`OrjsonCodec` when orjson is installed, a
+        :class:`JsonCodec` otherwise.
+    """
+    if orjson is None:
+        logger.debug("orjson is not installed, using the json module")
+        return JsonCodec()
+    return OrjsonCodec()
@@ -0,0 +1,56 @@
+"""Abstract lease port — gives one process at a time the right to act."""
+
+from abc import ABC, abstractmethod
+
+
+class Leases(ABC):
+    """Abstract base class for exclusive, expiring leases keyed by a string.
+
+    This is a *port* in the hexagonal architecture: a process acquires
+    the lease of a key (typically a game) before acting on it, renews it
+    while it does, and releases it when done.  A lease that is not
+    renewed expires, so another process can take over from one that
+    died.
+
+    Every acquisition returns a fencing token greater than any token
+    returned before it for any key.  Renewing or releasing a lease
+    requires its token, so a process whose lease expired and was taken
+    by another one cannot renew or release the new holder's lease.
+    """
+
+    @abstractmethod
+    async def acquire(self, key: str, ttl: float) -> int | None:
+        """Acquire the lease of *key* if nobody holds it.
+
+        Args:
+            key: The key to lease.
+            ttl: Seconds until the lease expires unless renewed.
+
+        Returns:
+            The fencing token of the new lease, or None if the lease is
+            held by someone else.
+        """
+
+    @abstractmethod
+    async def renew(self, key: str, token: int, ttl: float) -> bool:
+        """Extend a lease still held with *token*.
+
+        Args:
+            key: The leased key.
+            token: The fencing token returned by :meth:`acquire`.
+            ttl: Seconds from now until the lease expires.
+
+        Returns:
+            False if the lease expired or is held by someone else.
+        """
+
+    @abstractmethod
+    async def release(self, key: str, token: int) -> None:
+        """Give up a lease still held with *token*.
+
+        Does nothing if the lease expired or is held by someone else.
+
+        Args:
+            key: The leased key.
+            token: The fencing token returned by :meth:`acquire`.
+        """
@@ -0,0 +1,202 @@
+"""In-process adapters — concrete ports backed by process memory."""
+
+import asyncio
+import heapq
+import logging
+from collections import OrderedDict
+from itertools import count
+from time import monotonic, time
+
+from discord_against_humanity.ports.lease import Leases
+from discord_against_humanity.ports.notifier import Notifier
+from discord_against_humanity.ports.scheduler import Callback, Scheduler
+
+logger = logging.getLogger(__name__)
+
+
+class LocalNotifier(Notifier):
+    """Notifier backed by one :class:`asyncio.Event` per waited-on key.
+
+    Events only exist while a coroutine waits on their key.  A
+    notification nobody waits for is remembered in a bounded pending
+    set, so a waiter arriving just after it is not lost, while keys that
+    are never waited on (such as games run by other processes) cannot
+    accumulate: the oldest pending keys are dropped first.
+    """
+
+    _PENDING_LIMIT = 1024
+
+    def __init__(self) -> None:
+        """Initialize the notifier with no waiters."""
+        self._events: dict[str, asyncio.Event] = {}
+        self._waiters: dict[str, int] = {}
+        self._pending: OrderedDict[str, None] = OrderedDict()
+
+    def _wake(self, key: str) -> None:
+        """Set the event for *key*, or remember it if nobody waits yet."""
+        event = self._events.get(key)
+        if event is not None:
+            event.set()
+            return
+        self._pending[key] = None
+        self._pending.move_to_end(key)
+        if len(self._pending) > self._PENDING_LIMIT:
+            self._pending.popitem(last=False)
+
+    async def notify(self, key: str) -> None:
+        """Wake up every coroutine waiting on *key*."""
+        self._wake(key)
+
+    async def start(self) -> None:
+        """Do nothing: notifications never leave this process."""
+
+    async def stop(self) -> None:
+        """Do nothing: notifications never leave this process."""
+
+    async def wait(self, key: str, timeout: float | None = None) -> bool:
+        """Wait until *key* is notified or *timeout* expires."""
+        if key in self._pending:
+            del self._pending[key]
+            return True
+        event = self._events.setdefault(key, asyncio.Event())
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except TimeoutError:
+            return False
+        finally:
+            self._waiters[key] -= 1
+            if event.is_set() or not self._waiters[key]:
+                if self._events.get(key) is event:
+                    del self._events[key]
+            if not self._waiters[key]:
+                del self._waiters[key]
+        return True
+
+
+class LocalLeases(Leases):
+    """Leases held in process memory, for a bot running in one process."""
+
+    def __init__(self) -> None:
+        """Initialize with no leases."""
+        self._leases: dict[str, tuple[int, float]] = {}
+        self._tokens = count(1)
+
+    def _holder(self, key: str) -> int | None:
+        """Get the token of the unexpired lease of *key*, if any."""
+        lease = self._leases.get(key)
+        if lease is None or lease[1] <= monotonic():
+            return None
+        return lease[0]
+
+    async def acquire(self, key: str, ttl: float) -> int | None:
+        """Acquire the lease of *key* if nobody holds it."""
+        if self._holder(key) is not None:
+            return None
+        token = next(self._tokens)
+        self._leases[key] = (token, monotonic() + ttl)
+        return token
+
+    async def renew(self, key: str, token: int, ttl: float) -> bool:
+        """Extend a lease still held with *token*."""
+        if self._holder(key) != token:
+            return False
+        self._leases[key] = (token, monotonic() + ttl)
+        return True
+
+    async def release(self, key: str, token: int) -> None:
+        """Give up a lease still held with *token*."""
+        if self._holder(key) == token:
+            del self._leases[key]
+
+
+class LocalScheduler(Scheduler):
+    """Scheduler running every timer of the process from one task.
+
+    Timers are kept in a heap ordered by deadline, and a single
+    background task sleeps until the earliest one is due, so the cost
+    does not grow with the number of games.  Cancelled or replaced
+    timers are dropped lazily when they reach the top of the heap.
+    Due callbacks run in their own tasks, so a slow one does not delay
+    the timers of other games.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler with no timers."""
+        self._heap: list[tuple[float, int, str]] = []
+        self._timers: dict[str, tuple[int, Callback]] = {}
+        self._sequence = count()
+        self._changed = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._running: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        """Get the number of armed timers.
+
+        Returns:
+            How many timers are waiting to fire.
+        """
+        return len(self._timers)
+
+    def schedule(self, key: str, when: float, callback: Callback) -> None:
+        """Run *callback* once *when* is reached, replacing any timer."""
+        sequence = next(self._sequence)
+        self._timers[key] = (sequence, callback)
+        heapq.heappush(self._heap, (when, sequence, key))
+        if len(self._heap) > 2 * len(self._timers) + 64:
+            self._compact()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._changed.set()
+
+    def cancel(self, key: str) -> None:
+        """Cancel the timer for *key*, if any."""
+        self._timers.pop(key, None)
+
+    async def stop(self) -> None:
+        """Cancel the background task, running callbacks and every timer."""
+        self._timers.clear()
+        self._heap.clear()
+        tasks = list(self._running)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _compact(self) -> None:
+        """Drop heap entries whose timer was cancelled or replaced."""
+        self._heap = [
+            entry
+            for entry in self._heap
+            if self._timers.get(entry[2], (None,))[0] == entry[1]
+        ]
+        heapq.heapify(self._heap)
+
+    async def _fire(self, key: str, callback: Callback) -> None:
+        """Run a due callback, logging its failure."""
+        try:
+            await callback()
+        except Exception:
+            logger.exception("Timer %s failed", key)
+
+    async def _run(self) -> None:
+        """Fire due timers, then sleep until the next one."""
+        while True:
+            while self._heap and self._heap[0][0] <= time():
+                _when, sequence, key = heapq.heappop(self._heap)
+                timer = self._timers.get(key)
+                if timer is None or timer[0] != sequence:
+                    continue
+                del self._timers[key]
+                task = asyncio.create_task(self._fire(key, timer[1]))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+            self._changed.clear()
+            delay = self._heap[0][0] - time() if self._heap else None
+            try:
+                await asyncio.wait_for(self._changed.wait(), delay)
+            except TimeoutError:
+                pass
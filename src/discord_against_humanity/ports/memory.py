@@ -0,0 +1,437 @@
+"""In-memory adapter — concrete persistence held in process memory.
+
+Lets a bot running as a single process do without a Valkey server, and
+lets benchmarks measure the cost of the domain without network I/O.
+"""
+
+import asyncio
+import logging
+import os
+import random
+from typing import Any
+from uuid import uuid4
+
+from discord_against_humanity.ports.codec import JsonCodec, default_codec
+from discord_against_humanity.ports.repository import (
+    INDEX_FIELDS,
+    DocumentNotFoundError,
+    Repository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryRepository(Repository):
+    """Concrete repository keeping a collection in process memory.
+
+    Documents are stored encoded by a codec, exactly as
+    :class:`~discord_against_humanity.ports.valkey.ValkeyRepository`
+    stores them, so callers get the same fresh copies and the same JSON
+    types back, and changing a returned document never changes the
+    stored one.  Secondary indices map each indexed value to its
+    document and are re-pointed on every write, like the Valkey ones.
+
+    No method awaits anything, so every call is atomic with respect to
+    the other coroutines of the event loop.
+
+    IDs are kept in a list along with each one's position in it, so
+    that :meth:`random_member` and deletions cost O(1).  Draw piles are
+    lists shuffled when they are built, so a draw pops from their end.
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        index_fields: list[str] | None = None,
+        codec: JsonCodec | None = None,
+    ) -> None:
+        """Initialize an empty repository.
+
+        Args:
+            collection: Collection name, used in log messages.
+            index_fields: Fields to create secondary indices for
+                (used by ``find_one``).
+            codec: Codec encoding the stored documents; the standard
+                library's JSON by default.
+        """
+        self._collection = collection
+        self._index_fields = index_fields or []
+        self._codec = codec or JsonCodec()
+        self._documents: dict[str, str] = {}
+        self._ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._index: dict[str, str] = {}
+        self._refs: dict[str, dict[str, str]] = {}
+        self._piles: dict[str, list[str]] = {}
+        self._discards: dict[str, set[str]] = {}
+
+    def _index_key(self, field: str, value: Any) -> str:
+        """Build the key of a secondary index entry."""
+        return f"{field}:{value}"
+
+    def _decode(self, doc_id: str) -> dict[str, Any] | None:
+        """Decode a stored document, adding its ID."""
+        data = self._documents.get(doc_id)
+        if data is None:
+            return None
+        doc: dict[str, Any] = self._codec.loads(data)
+        doc["_id"] = doc_id
+        return doc
+
+    def _write(self, doc_id: str, document: dict[str, Any]) -> None:
+        """Store a document and re-point its secondary indices.
+
+        Index entries whose value changed are dropped when they still
+        point at this document.
+        """
+        refs = self._refs.setdefault(doc_id, {})
+        entries = {
+            field: self._index_key(field, document[field])
+            for field in self._index_fields
+            if field in document
+        }
+        for field, old in list(refs.items()):
+            if entries.get(field) != old:
+                if self._index.get(old) == doc_id:
+                    del self._index[old]
+                del refs[field]
+        for field, key in entries.items():
+            self._index[key] = doc_id
+            refs[field] = key
+        if not refs:
+            del self._refs[doc_id]
+        self._documents[doc_id] = self._codec.dumps(document)
+        if doc_id not in self._positions:
+            self._positions[doc_id] = len(self._ids)
+            self._ids.append(doc_id)
+
+    def _update(self, doc_id: str, action: str) -> dict[str, Any]:
+        """Decode a document about to be changed, without its ID.
+
+        Raises:
+            DocumentNotFoundError: If no document matches the ID.
+        """
+        doc = self._decode(doc_id)
+        if doc is None:
+            raise DocumentNotFoundError(f"Document {doc_id} not found for {action}")
+        del doc["_id"]
+        return doc
+
+    async def find_by_id(self, document_id: str) -> dict[str, Any] | None:
+        """Find a document by its ID."""
+        return self._decode(document_id)
+
+    async def find_many(self, document_ids: list[str]) -> list[dict[str, Any] | None]:
+        """Find several documents by ID."""
+        return [self._decode(doc_id) for doc_id in document_ids]
+
+    async def find_all(self) -> list[dict[str, Any]]:
+        """Return every document, ordered by ID like the Valkey adapter."""
+        return [
+            doc for doc in map(self._decode, sorted(self._documents)) if doc is not None
+        ]
+
+    async def find_one(self, query: dict[str, Any]) -> dict[str, Any] | None:
+        """Find a single document matching a query via secondary indices.
+
+        As with the Valkey adapter, only documents found through the
+        indexed fields of the query are candidates, and the first one
+        matching *all* query predicates is returned.
+        """
+        for field, value in query.items():
+            if field not in self._index_fields:
+                continue
+            doc_id = self._index.get(self._index_key(field, value))
+            if doc_id is None:
+                continue
+            doc = self._decode(doc_id)
+            if doc is not None and all(doc.get(k) == v for k, v in query.items()):
+                return doc
+        return None
+
+    async def insert(self, document: dict[str, Any]) -> str:
+        """Insert a new document and return its ID."""
+        doc_id = str(document.pop("_id", None) or uuid4())
+        self._write(doc_id, document)
+        return doc_id
+
+    async def replace(
+        self, document_id: str, document: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Replace an existing document.
+
+        Raises:
+            DocumentNotFoundError: If no document matches the ID.
+        """
+        if document_id not in self._documents:
+            raise DocumentNotFoundError(
+                f"Document {document_id} not found for replacement"
+            )
+        doc = {k: v for k, v in document.items() if k != "_id"}
+        self._write(document_id, doc)
+        return {**doc, "_id": document_id}
+
+    async def replace_many(
+        self, documents: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Replace several documents, each one that exists even if some don't.
+
+        Raises:
+            DocumentNotFoundError: If any document does not exist.
+        """
+        results: list[dict[str, Any]] = []
+        missing: list[str] = []
+        for document in documents:
+            doc = {k: v for k, v in document.items() if k != "_id"}
+            if document["_id"] in self._documents:
+                self._write(document["_id"], doc)
+            else:
+                missing.append(document["_id"])
+            results.append({**doc, "_id": document["_id"]})
+        if missing:
+            raise DocumentNotFoundError(
+                f"Documents {missing} not found for replacement"
+            )
+        return results
+
+    async def update_fields(self, document_id: str, fields: dict[str, Any]) -> None:
+        """Set some fields of a document.
+
+        Raises:
+            DocumentNotFoundError: If no document matches the ID.
+        """
+        if not fields:
+            return
+        doc = self._update(document_id, "update")
+        doc.update(fields)
+        self._write(document_id, doc)
+
+    async def increment(
+        self,
+        document_id: str,
+        field: str,
+        amount: int = 1,
+        once: tuple[str, Any] | None = None,
+    ) -> int:
+        """Add *amount* to an integer field of a document.
+
+        Raises:
+            DocumentNotFoundError: If no document matches the ID.
+        """
+        doc = self._update(document_id, "increment")
+        if once is None or doc.get(once[0]) != once[1]:
+            doc[field] = (doc.get(field) or 0) + amount
+            if once is not None:
+                doc[once[0]] = once[1]
+            self._write(document_id, doc)
+        return int(doc.get(field) or 0)
+
+    async def delete_by_id(self, document_id: str) -> None:
+        """Delete a document by its ID, along with its index entries."""
+        if self._documents.pop(document_id, None) is None:
+            return
+        for key in self._refs.pop(document_id, {}).values():
+            if self._index.get(key) == document_id:
+                del self._index[key]
+        position = self._positions.pop(document_id)
+        last = self._ids.pop()
+        if last != document_id:
+            self._ids[position] = last
+            self._positions[last] = position
+
+    async def delete_many(self, document_ids: list[str]) -> None:
+        """Delete several documents, ignoring the missing ones."""
+        for doc_id in document_ids:
+            await self.delete_by_id(doc_id)
+
+    async def random_member(self) -> dict[str, Any] | None:
+        """Get a random document from the collection."""
+        if not self._ids:
+            return None
+        return self._decode(random.choice(self._ids))
+
+    async def create_pile(self, pile: str, exclude: list[str] | None = None) -> int:
+        """Create a shuffled draw pile from the collection's IDs."""
+        excluded = set(exclude or ())
+        ids = [doc_id for doc_id in self._ids if doc_id not in excluded]
+        random.shuffle(ids)
+        self._piles[pile] = ids
+        self._discards.pop(pile, None)
+        return len(ids)
+
+    async def draw_from_pile(self, pile: str, count: int = 1) -> list[str]:
+        """Draw random IDs from a pile, reshuffling discards if needed."""
+        if count <= 0:
+            return []
+        ids = self._piles.setdefault(pile, [])
+        if len(ids) < count and pile in self._discards:
+            discards = list(self._discards.pop(pile))
+            random.shuffle(discards)
+            ids[:0] = discards
+        drawn = ids[-count:]
+        del ids[-count:]
+        if not ids:
+            del self._piles[pile]
+        return drawn
+
+    async def discard_to_pile(self, pile: str, document_ids: list[str]) -> None:
+        """Add IDs to a pile's discard set."""
+        if document_ids:
+            self._discards.setdefault(pile, set()).update(document_ids)
+
+    async def delete_pile(self, pile: str) -> None:
+        """Delete a draw pile and its discard set."""
+        self._piles.pop(pile, None)
+        self._discards.pop(pile, None)
+
+    async def count(self) -> int:
+        """Count the number of documents in the collection."""
+        return len(self._documents)
+
+    def dump(self) -> dict[str, Any]:
+        """Export the documents and piles of the collection.
+
+        Returns:
+            A JSON-serializable mapping, which :meth:`load` restores.
+        """
+        return {
+            "documents": {
+                doc_id: self._codec.loads(data)
+                for doc_id, data in self._documents.items()
+            },
+            "piles": dict(self._piles),
+            "discards": {pile: sorted(ids) for pile, ids in self._discards.items()},
+        }
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Replace the contents of the collection with a :meth:`dump`.
+
+        Secondary indices are rebuilt from the documents, so changing
+        the indexed fields between runs needs no migration.
+
+        Args:
+            data: What :meth:`dump` returned.
+        """
+        self._documents = {}
+        self._ids = []
+        self._positions = {}
+        self._index = {}
+        self._refs = {}
+        for doc_id, document in data.get("documents", {}).items():
+            self._write(doc_id, document)
+        self._piles = {pile: list(ids) for pile, ids in data.get("piles", {}).items()}
+        self._discards = {
+            pile: set(ids) for pile, ids in data.get("discards", {}).items()
+        }
+
+
+class MemoryStore:
+    """Every collection of a bot kept in memory, optionally saved to disk.
+
+    Each collection gets a single :class:`MemoryRepository`, shared by
+    every caller of :meth:`repository`, which is a
+    :class:`~discord_against_humanity.ports.repository.RepositoryFactory`.
+
+    With a snapshot path, :meth:`start` restores the collections saved
+    there, and the store is saved every *interval* seconds and when it
+    is stopped.  A snapshot is encoded on the event loop, so it is
+    consistent, then written to a temporary file in a worker thread and
+    renamed over the previous one, so a crash never leaves a partial
+    snapshot.  Changes made since the last save are lost by a crash.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        interval: float = 60,
+        codec: JsonCodec | None = None,
+    ) -> None:
+        """Initialize a store with no collections.
+
+        Args:
+            path: File to save the snapshots to, or None to keep the
+                data in memory only.
+            interval: Seconds between two snapshots.
+            codec: Codec encoding the documents and snapshots; orjson's
+                when it is installed.
+        """
+        self._path = path
+        self._interval = interval
+        self._codec = codec or default_codec()
+        self._repositories: dict[str, MemoryRepository] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def repository(self, collection: str) -> MemoryRepository:
+        """Get the repository of a collection, creating it if needed.
+
+        Args:
+            collection: The collection name.
+
+        Returns:
+            The collection's repository.
+        """
+        repo = self._repositories.get(collection)
+        if repo is None:
+            repo = self._repositories[collection] = MemoryRepository(
+                collection, INDEX_FIELDS.get(collection), self._codec
+            )
+        return repo
+
+    def restore(self) -> int:
+        """Load the collections of the snapshot, if there is one.
+
+        Returns:
+            The number of documents loaded.
+        """
+        if self._path is None or not os.path.exists(self._path):
+            return 0
+        with open(self._path, encoding="utf-8") as file:
+            snapshot = self._codec.loads(file.read())
+        loaded = 0
+        for collection, data in snapshot.items():
+            self.repository(collection).load(data)
+            loaded += len(data.get("documents", {}))
+        logger.info("Restored %d documents from %s", loaded, self._path)
+        return loaded
+
+    async def save(self) -> None:
+        """Save every collection to the snapshot file, if there is one."""
+        if self._path is None:
+            return
+        text = self._codec.dumps(
+            {name: repo.dump() for name, repo in self._repositories.items()}
+        )
+        await asyncio.to_thread(self._write_file, self._path, text)
+
+    @staticmethod
+    def _write_file(path: str, text: str) -> None:
+        """Replace a file with *text* without ever leaving it partial."""
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+
+    async def start(self) -> None:
+        """Restore the snapshot and start saving it periodically."""
+        self.restore()
+        if self._path is not None and self._task is None:
+            self._task = asyncio.create_task(self._save_periodically())
+
+    async def stop(self) -> None:
+        """Stop the periodic snapshots and save one last time."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.save()
+
+    async def _save_periodically(self) -> None:
+        """Save the store every interval, logging failures."""
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.save()
+            except OSError:
+                logger.exception("Could not save %s", self._path)
@@ -0,0 +1,35 @@
+"""Abstract notifier port — wakes up coroutines waiting on a game."""
+
+from abc import ABC, abstractmethod
+
+
+class Notifier(ABC):
+    """Abstract base class for change notifications keyed by a string.
+
+    This is a *port* in the hexagonal architecture: the domain waits on
+    a key (typically a game ID) and command handlers notify that key
+    after changing the state the waiter cares about.  A notification
+    sent before the waiter starts waiting is not lost: the next
+    :meth:`wait` on that key returns immediately.
+    """
+
+    @abstractmethod
+    async def notify(self, key: str) -> None:
+        """Wake up every coroutine waiting on *key*.
+
+        Args:
+            key: The key to notify.
+        """
+
+    @abstractmethod
+    async def wait(self, key: str, timeout: float | None = None) -> bool:
+        """Wait until *key* is notified.
+
+        Args:
+            key: The key to wait on.
+            timeout: Maximum number of seconds to wait, or None to wait
+                forever.
+
+        Returns:
+            True if a notification was received, False on timeout.
+        """
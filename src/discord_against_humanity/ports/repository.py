@@ -3,6 +3,15 @@
 from abc import ABC, abstractmethod
 from typing import Any, Callable
 
+# Secondary-index configuration per collection.
+# Maps collection names to the field names that should be indexed for
+# ``find_one`` look-ups.  Add an entry here when a domain model needs
+# to query by a field other than its primary ID.
+INDEX_FIELDS: dict[str, list[str]] = {
+    "games": ["guild"],
+    "players": ["user", "guild"],
+}
+
 
 class DocumentNotFoundError(Exception):
     """Raised when a document is not found in the store."""
@@ -28,6 +37,31 @@ class Repository(ABC):
             The document dict, or None if not found.
         """
 
+    @abstractmethod
+    async def find_many(
+        self, document_ids: list[str]
+    ) -> list[dict[str, Any] | None]:
+        """Find several documents by ID in a single operation.
+
+        Args:
+            document_ids: The document IDs to look up.
+
+        Returns:
+            One entry per requested ID, in the same order; entries for
+            IDs that do not exist are None.
+        """
+
+    @abstractmethod
+    async def find_all(self) -> list[dict[str, Any]]:
+        """Return every document in the collection.
+
+        Intended for small, static collections that are loaded once
+        (e.g. the card decks), not for per-request use.
+
+        Returns:
+            All documents, in no particular order.
+        """
+
     @abstractmethod
     async def find_one(
         self, query: dict[str, Any]
@@ -69,6 +103,69 @@ class Repository(ABC):
             DocumentNotFoundError: If no document matches the ID.
         """
 
+    @abstractmethod
+    async def replace_many(
+        self, documents: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Replace several existing documents in a single operation.
+
+        Each document must carry its ID under ``_id``.  Documents that
+        exist are replaced even when others are missing.
+
+        Args:
+            documents: The replacement documents.
+
+        Returns:
+            The replaced documents, in the same order.
+
+        Raises:
+            DocumentNotFoundError: If any document does not exist.
+        """
+
+    @abstractmethod
+    async def update_fields(
+        self, document_id: str, fields: dict[str, Any]
+    ) -> None:
+        """Set some fields of an existing document in one atomic write.
+
+        Fields not listed are left as they are in the store.
+
+        Args:
+            document_id: The ID of the document to update.
+            fields: The new value of each field to set.
+
+        Raises:
+            DocumentNotFoundError: If no document matches the ID.
+        """
+
+    @abstractmethod
+    async def increment(
+        self,
+        document_id: str,
+        field: str,
+        amount: int = 1,
+        once: tuple[str, Any] | None = None,
+    ) -> int:
+        """Atomically add to an integer field of an existing document.
+
+        A missing or null field counts as 0.
+
+        Args:
+            document_id: The ID of the document to update.
+            field: The field to increment.
+            amount: How much to add.
+            once: Optional ``(marker, token)`` pair making the increment
+                idempotent: it is skipped when the *marker* field already
+                holds *token*, and *marker* is set to *token* along with
+                the increment otherwise.
+
+        Returns:
+            The value of the field after the call.
+
+        Raises:
+            DocumentNotFoundError: If no document matches the ID.
+        """
+
     @abstractmethod
     async def delete_by_id(self, document_id: str) -> None:
         """Delete a document by its ID.
@@ -77,6 +174,16 @@ class Repository(ABC):
             document_id: The ID of the document to delete.
         """
 
+    @abstractmethod
+    async def delete_many(self, document_ids: list[str]) -> None:
+        """Delete several documents in a single operation.
+
+        IDs that do not exist are ignored.
+
+        Args:
+            document_ids: The IDs of the documents to delete.
+        """
+
     @abstractmethod
     async def random_member(self) -> dict[str, Any] | None:
         """Get a random document from the collection.
@@ -85,6 +192,56 @@ class Repository(ABC):
             A randomly selected document, or None if empty.
         """
 
+    @abstractmethod
+    async def create_pile(
+        self, pile: str, exclude: list[str] | None = None
+    ) -> int:
+        """Create a draw pile holding every document ID of the collection.
+
+        Any previous pile or discard pile with the same name is reset.
+
+        Args:
+            pile: Name of the pile (typically a game ID).
+            exclude: IDs to leave out of the pile, such as cards that
+                are already in play.
+
+        Returns:
+            The number of IDs in the new pile.
+        """
+
+    @abstractmethod
+    async def draw_from_pile(self, pile: str, count: int = 1) -> list[str]:
+        """Remove and return random document IDs from a draw pile.
+
+        When the pile runs out, the discard pile is shuffled back into
+        it before drawing the remainder.  IDs are never returned twice
+        until they have been discarded.
+
+        Args:
+            pile: Name of the pile.
+            count: Number of IDs to draw.
+
+        Returns:
+            Up to *count* IDs; fewer only when both piles are exhausted.
+        """
+
+    @abstractmethod
+    async def discard_to_pile(self, pile: str, document_ids: list[str]) -> None:
+        """Put document IDs on a pile's discard pile.
+
+        Args:
+            pile: Name of the pile.
+            document_ids: IDs to discard.
+        """
+
+    @abstractmethod
+    async def delete_pile(self, pile: str) -> None:
+        """Delete a draw pile and its discard pile.
+
+        Args:
+            pile: Name of the pile.
+        """
+
     @abstractmethod
     async def count(self) -> int:
         """Count the number of documents in the collection.
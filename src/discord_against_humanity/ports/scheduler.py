@@ -0,0 +1,34 @@
+"""Abstract scheduler port — runs callbacks at a given time."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+Callback = Callable[[], Awaitable[None]]
+
+
+class Scheduler(ABC):
+    """Abstract base class for one-shot timers keyed by a string.
+
+    This is a *port* in the hexagonal architecture: the domain arms a
+    timer per key (typically a game ID) for a phase deadline, and the
+    adapter decides how timers are run.  Each key holds at most one
+    timer; scheduling a key again replaces its previous timer.
+    """
+
+    @abstractmethod
+    def schedule(self, key: str, when: float, callback: Callback) -> None:
+        """Run *callback* once *when* is reached.
+
+        Args:
+            key: The timer's key.
+            when: When to fire, as a Unix timestamp.
+            callback: The coroutine function to await when it fires.
+        """
+
+    @abstractmethod
+    def cancel(self, key: str) -> None:
+        """Cancel the timer for *key*, if any.
+
+        Args:
+            key: The timer's key.
+        """
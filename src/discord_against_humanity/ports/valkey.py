@@ -1,38 +1,279 @@
 """Valkey adapter — concrete persistence backed by Valkey."""
 
-import json
+import asyncio
 import logging
-from typing import Any
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any, Concatenate, ParamSpec, TypeVar
 from uuid import uuid4
 
 import valkey.asyncio as valkey
+from valkey.commands.core import AsyncScript
+from valkey.exceptions import NoScriptError, WatchError
 
+from discord_against_humanity.ports.codec import JsonCodec, default_codec
+from discord_against_humanity.ports.lease import Leases
+from discord_against_humanity.ports.local import LocalNotifier
 from discord_against_humanity.ports.repository import (
+    INDEX_FIELDS,
     DocumentNotFoundError,
     Repository,
     RepositoryFactory,
 )
+from discord_against_humanity.utils.metrics import REPOSITORY_SECONDS
 
 logger = logging.getLogger(__name__)
 
-# Secondary-index configuration per collection.
-# Maps collection names to the field names that should be indexed for
-# ``find_one`` look-ups.  Add an entry here when a domain model needs
-# to query by a field other than its primary ID.
-_INDEX_FIELDS: dict[str, list[str]] = {
-    "games": ["guild"],
-    "players": ["user", "guild"],
-}
+T = TypeVar("T")
+P = ParamSpec("P")
+
+# Collections whose documents are stored as hashes, one field per
+# document field, instead of one JSON string.  A single field of a hash
+# document can be read or written (``HSET``, ``HINCRBY``) without
+# decoding the rest.  Each field holds its value encoded as JSON, so
+# integers can still be incremented in place.
+_HASH_COLLECTIONS: set[str] = {"games", "players"}
+
+# Maximum number of keys fetched per ``MGET`` by ``find_all``.
+_FIND_ALL_BATCH = 1000
+
+# Atomically replace a document and re-point its secondary indices.
+#
+# KEYS[1] = document key, KEYS[2] = index back-reference hash,
+# KEYS[3..] = index keys for the new document.
+# ARGV[1] = encoded document, ARGV[2] = document ID,
+# ARGV[3..#KEYS] = field names matching KEYS[3..],
+# ARGV[#KEYS + 1..] = field/value pairs of a hash document; when there
+# are any, the document is written as a hash and ARGV[1] is ignored.
+#
+# Returns 0 when the document does not exist, 1 otherwise.
+_REPLACE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local new = {}
+for i = 3, #KEYS do
+    new[ARGV[i]] = KEYS[i]
+end
+local refs = redis.call('HGETALL', KEYS[2])
+for i = 1, #refs, 2 do
+    local field, old = refs[i], refs[i + 1]
+    if new[field] ~= old then
+        if redis.call('GET', old) == ARGV[2] then
+            redis.call('DEL', old)
+        end
+        redis.call('HDEL', KEYS[2], field)
+    end
+end
+if #ARGV > #KEYS then
+    redis.call('DEL', KEYS[1])
+    redis.call('HSET', KEYS[1], unpack(ARGV, #KEYS + 1))
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+for i = 3, #KEYS do
+    redis.call('SET', KEYS[i], ARGV[2])
+    redis.call('HSET', KEYS[2], ARGV[i], KEYS[i])
+end
+return 1
+"""
+
+# Atomically delete a document, its ID-set entry and the index keys
+# that still point at it.
+#
+# KEYS[1] = document key, KEYS[2] = index back-reference hash,
+# KEYS[3] = ID set.  ARGV[1] = document ID.
+_DELETE_SCRIPT = """
+local refs = redis.call('HGETALL', KEYS[2])
+for i = 2, #refs, 2 do
+    if redis.call('GET', refs[i]) == ARGV[1] then
+        redis.call('DEL', refs[i])
+    end
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+redis.call('SREM', KEYS[3], ARGV[1])
+return 1
+"""
+
+# Resolve secondary-index keys to their documents in one round trip.
+#
+# KEYS[1..] = index keys.  ARGV[1] = document key prefix,
+# ARGV[2] = "hash" when documents are stored as hashes.
+#
+# Returns a flat list of ``id, document`` pairs for the index keys that
+# point at an existing document, in the order of KEYS.  Hash documents
+# are returned as flat field/value lists.
+_FIND_ONE_SCRIPT = """
+local found = {}
+for i = 1, #KEYS do
+    local id = redis.call('GET', KEYS[i])
+    if id then
+        local doc
+        if ARGV[2] == 'hash' then
+            doc = redis.call('HGETALL', ARGV[1] .. id)
+            if #doc == 0 then
+                doc = false
+            end
+        else
+            doc = redis.call('GET', ARGV[1] .. id)
+        end
+        if doc then
+            found[#found + 1] = id
+            found[#found + 1] = doc
+        end
+    end
+end
+return found
+"""
+
+# Set some fields of a hash document, re-pointing the secondary indices
+# of the indexed ones.
+#
+# KEYS and ARGV are laid out as for _REPLACE_SCRIPT, with only the
+# updated fields.
+#
+# Returns 0 when the document does not exist, 1 otherwise.
+_UPDATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 3, #KEYS do
+    local old = redis.call('HGET', KEYS[2], ARGV[i])
+    if old and old ~= KEYS[i] and redis.call('GET', old) == ARGV[2] then
+        redis.call('DEL', old)
+    end
+    redis.call('SET', KEYS[i], ARGV[2])
+    redis.call('HSET', KEYS[2], ARGV[i], KEYS[i])
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, #KEYS + 1))
+return 1
+"""
+
+# Increment an integer field of a hash document, at most once per token
+# when one is given.
+#
+# KEYS[1] = document key.  ARGV[1] = field, ARGV[2] = amount,
+# ARGV[3] = marker field, ARGV[4] = encoded token (both optional).
+#
+# Returns nil when the document does not exist, otherwise the field's
+# value after the call.
+_INCREMENT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+if ARGV[3] and redis.call('HGET', KEYS[1], ARGV[3]) == ARGV[4] then
+    return tonumber(redis.call('HGET', KEYS[1], ARGV[1]))
+end
+local value = redis.call('HGET', KEYS[1], ARGV[1])
+if not value or value == 'null' then
+    redis.call('HSET', KEYS[1], ARGV[1], 0)
+end
+local new = redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+if ARGV[3] then
+    redis.call('HSET', KEYS[1], ARGV[3], ARGV[4])
+end
+return new
+"""
+
+# Draw IDs from a pile, reshuffling the discard pile into it when it
+# runs out.
+#
+# KEYS[1] = draw pile, KEYS[2] = discard pile.  ARGV[1] = count.
+_DRAW_SCRIPT = """
+local count = tonumber(ARGV[1])
+local drawn = redis.call('SPOP', KEYS[1], count)
+if #drawn < count and redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('RENAME', KEYS[2], KEYS[1])
+    local more = redis.call('SPOP', KEYS[1], count - #drawn)
+    for i = 1, #more do
+        drawn[#drawn + 1] = more[i]
+    end
+end
+return drawn
+"""
+
+
+# Acquire a lease if nobody holds it.
+#
+# KEYS[1] = lease key, KEYS[2] = fencing token counter.
+# ARGV[1] = time to live in milliseconds.
+#
+# Returns the new fencing token, or nil when the lease is held.
+_ACQUIRE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return nil
+end
+local token = redis.call('INCR', KEYS[2])
+redis.call('SET', KEYS[1], token, 'PX', ARGV[1])
+return token
+"""
+
+# Renew (ARGV[2] set) or release a lease held with a fencing token.
+#
+# KEYS[1] = lease key.
+# ARGV[1] = fencing token, ARGV[2] = time to live in milliseconds.
+#
+# Returns 1 when the lease was held with the token, 0 otherwise.
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+if ARGV[2] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+else
+    redis.call('DEL', KEYS[1])
+end
+return 1
+"""
+
+
+def _metered(
+    method: Callable[Concatenate["ValkeyRepository", P], Coroutine[Any, Any, T]],
+) -> Callable[Concatenate["ValkeyRepository", P], Coroutine[Any, Any, T]]:
+    """Observe the time of a repository method, by collection."""
+
+    @wraps(method)
+    async def wrapper(
+        self: "ValkeyRepository", *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        with REPOSITORY_SECONDS.time(
+            method=method.__name__, collection=self._collection
+        ):
+            return await method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class ValkeyRepository(Repository):
-    """Concrete Valkey repository backed by valkey-py."""
+    """Concrete Valkey repository backed by valkey-py.
+
+    Every write (``insert``, ``replace``, ``delete_by_id``) costs a single
+    round trip and is atomic: inserts run as a ``MULTI``/``EXEC``
+    pipeline, replacements and deletions as server-side Lua scripts.
+    Each document keeps a back-reference hash of the index keys it owns
+    so that stale index entries can be cleaned up without reading the
+    previous version of the document.  Documents written before these
+    hashes existed get theirs from :meth:`backfill_index_refs`.
+
+    Documents are stored as JSON strings, or as hashes of JSON-encoded
+    fields for the collections in ``_HASH_COLLECTIONS``; documents
+    written before a collection switched to hashes are converted by
+    :meth:`convert_to_hashes`.  Values are encoded by a codec; every
+    codec writes the same JSON text, so the codec can change between
+    runs without touching stored data.
+
+    Draw piles are server-side sets copied from the collection's ID set,
+    so building one transfers no data and every draw is a single
+    ``SPOP``.
+    """
 
     def __init__(
         self,
         client: valkey.Valkey,
         collection: str,
         index_fields: list[str] | None = None,
+        hashed: bool = False,
+        codec: JsonCodec | None = None,
     ) -> None:
         """Initialize the repository.
 
@@ -41,10 +282,22 @@ class ValkeyRepository(Repository):
             collection: Collection name used as key prefix.
             index_fields: Fields to create secondary indices for
                 (used by ``find_one``).
+            hashed: Whether documents are stored as hashes rather than
+                JSON strings.
+            codec: Codec encoding the stored values; the standard
+                library's JSON by default.
         """
         self._client = client
         self._collection = collection
         self._index_fields = index_fields or []
+        self._hashed = hashed
+        self._codec = codec or JsonCodec()
+        self._replace_script = client.register_script(_REPLACE_SCRIPT)
+        self._delete_script = client.register_script(_DELETE_SCRIPT)
+        self._draw_script = client.register_script(_DRAW_SCRIPT)
+        self._find_one_script = client.register_script(_FIND_ONE_SCRIPT)
+        self._update_script = client.register_script(_UPDATE_SCRIPT)
+        self._increment_script = client.register_script(_INCREMENT_SCRIPT)
 
     def _doc_key(self, doc_id: str) -> str:
         """Build the Valkey key for a document."""
@@ -58,111 +311,470 @@ class ValkeyRepository(Repository):
         """Build the Valkey key for a secondary index."""
         return f"{self._collection}:idx:{field}:{value}"
 
+    def _refs_key(self, doc_id: str) -> str:
+        """Build the Valkey key for a document's index back-references."""
+        return f"{self._collection}:refs:{doc_id}"
+
+    def _pile_key(self, pile: str) -> str:
+        """Build the Valkey key for a draw pile."""
+        return f"{self._collection}:pile:{pile}"
+
+    def _discard_key(self, pile: str) -> str:
+        """Build the Valkey key for a draw pile's discards."""
+        return f"{self._collection}:discard:{pile}"
+
+    def _replace_call(
+        self, document_id: str, document: dict[str, Any]
+    ) -> tuple[list[str], list[Any]]:
+        """Build the keys and arguments of a replace script call."""
+        entries = self._index_entries(document)
+        keys = [
+            self._doc_key(document_id),
+            self._refs_key(document_id),
+            *entries.values(),
+        ]
+        if self._hashed:
+            fields = self._encode_fields(document)
+            return keys, [
+                "",
+                document_id,
+                *entries.keys(),
+                *(item for pair in fields.items() for item in pair),
+            ]
+        args = [self._codec.dumps(document), document_id, *entries.keys()]
+        return keys, args
+
+    def _delete_call(self, document_id: str) -> tuple[list[str], list[Any]]:
+        """Build the keys and arguments of a delete script call."""
+        keys = [
+            self._doc_key(document_id),
+            self._refs_key(document_id),
+            self._ids_key(),
+        ]
+        return keys, [document_id]
+
+    async def _run_script_many(
+        self,
+        script: AsyncScript,
+        calls: list[tuple[list[str], list[Any]]],
+    ) -> list[Any]:
+        """Run *script* once per ``(keys, args)`` pair in one pipeline.
+
+        ``EVALSHA`` is queued directly rather than through the script
+        object, which would cost an extra ``SCRIPT EXISTS`` round trip
+        per pipeline.  The script is loaded and the pipeline replayed
+        only if the server does not know it yet.
+        """
+
+        def queue() -> Any:
+            pipe = self._client.pipeline(transaction=False)
+            for keys, args in calls:
+                pipe.evalsha(script.sha, len(keys), *keys, *args)
+            return pipe
+
+        try:
+            results: list[Any] = await queue().execute()
+            return results
+        except NoScriptError:
+            script.sha = await self._client.script_load(script.script)
+        results = await queue().execute()
+        return results
+
+    def _encode_fields(self, document: dict[str, Any]) -> dict[str, str]:
+        """Encode each field of a document for a hash.
+
+        Raises:
+            ValueError: If the document has no field, since an empty
+                hash cannot be stored.
+        """
+        if not document:
+            raise ValueError("Cannot store an empty document as a hash")
+        return {
+            field: self._codec.dumps(value) for field, value in document.items()
+        }
+
+    def _decode(self, doc_id: str, data: Any) -> dict[str, Any] | None:
+        """Decode a document as read from the store, adding its ID.
+
+        *data* is a JSON string, or for hash documents a field/value
+        mapping or flat list; a missing document is None or empty.
+        """
+        if not data:
+            return None
+        if not self._hashed:
+            doc: dict[str, Any] = self._codec.loads(data)
+        else:
+            if not isinstance(data, dict):
+                data = dict(zip(data[::2], data[1::2]))
+            doc = {
+                field.decode() if isinstance(field, bytes) else field: (
+                    self._codec.loads(value)
+                )
+                for field, value in data.items()
+            }
+        doc["_id"] = doc_id
+        return doc
+
+    def _index_entries(self, document: dict[str, Any]) -> dict[str, str]:
+        """Map each indexed field present in *document* to its index key."""
+        return {
+            field: self._index_key(field, document[field])
+            for field in self._index_fields
+            if field in document
+        }
+
+    @_metered
     async def find_by_id(
         self, document_id: str
     ) -> dict[str, Any] | None:
         """Find a document by its ID."""
-        data = await self._client.get(self._doc_key(document_id))
-        if data is None:
-            return None
-        doc: dict[str, Any] = json.loads(data)
-        doc["_id"] = document_id
-        return doc
+        key = self._doc_key(document_id)
+        if self._hashed:
+            data = await self._client.hgetall(key)  # type: ignore[misc]
+        else:
+            data = await self._client.get(key)
+        return self._decode(document_id, data)
+
+    @_metered
+    async def find_many(
+        self, document_ids: list[str]
+    ) -> list[dict[str, Any] | None]:
+        """Find several documents by ID with a single ``MGET``.
+
+        Hash documents are read with one pipeline of ``HGETALL``.
+        """
+        if not document_ids:
+            return []
+        keys = [self._doc_key(doc_id) for doc_id in document_ids]
+        if self._hashed:
+            pipe = self._client.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(key)
+            values = await pipe.execute()
+        else:
+            values = await self._client.mget(keys)
+        return [
+            self._decode(doc_id, data)
+            for doc_id, data in zip(document_ids, values)
+        ]
+
+    @_metered
+    async def find_all(self) -> list[dict[str, Any]]:
+        """Return every document, fetched in ``MGET`` batches."""
+        doc_ids = sorted(await self._client.smembers(self._ids_key()))  # type: ignore[misc]
+        documents: list[dict[str, Any]] = []
+        for start in range(0, len(doc_ids), _FIND_ALL_BATCH):
+            batch = doc_ids[start:start + _FIND_ALL_BATCH]
+            documents.extend(
+                doc for doc in await self.find_many(batch) if doc is not None
+            )
+        return documents
 
+    @_metered
     async def find_one(
         self, query: dict[str, Any]
     ) -> dict[str, Any] | None:
         """Find a single document matching a query via secondary indices.
 
-        Uses indexed fields to locate a candidate document, then verifies
-        that *all* query predicates match before returning it.
+        The candidate documents of every indexed field in the query are
+        fetched with one script call, so a look-up costs a single round
+        trip.  The first candidate matching *all* query predicates is
+        returned.
         """
-        for field, value in query.items():
-            if field in self._index_fields:
-                doc_id = await self._client.get(
-                    self._index_key(field, value)
-                )
-                if doc_id is not None:
-                    if isinstance(doc_id, bytes):
-                        doc_id = doc_id.decode()
-                    doc = await self.find_by_id(doc_id)
-                    if doc is None:
-                        continue
-                    # Verify all query predicates match
-                    if all(doc.get(k) == v for k, v in query.items()):
-                        return doc
+        keys = [
+            self._index_key(field, value)
+            for field, value in query.items()
+            if field in self._index_fields
+        ]
+        if not keys:
+            return None
+        found = await self._find_one_script(
+            keys=keys,
+            args=[self._doc_key(""), "hash" if self._hashed else "json"],
+        )
+        for doc_id, data in zip(found[::2], found[1::2]):
+            if isinstance(doc_id, bytes):
+                doc_id = doc_id.decode()
+            doc = self._decode(doc_id, data)
+            if doc is not None and all(
+                doc.get(k) == v for k, v in query.items()
+            ):
+                return doc
         return None
 
+    @_metered
     async def insert(self, document: dict[str, Any]) -> str:
-        """Insert a new document and return its ID."""
+        """Insert a new document and return its ID.
+
+        The document, its ID-set entry and its index entries are written
+        in one ``MULTI``/``EXEC`` transaction.
+        """
         doc_id = str(document.pop("_id", None) or uuid4())
-        await self._client.set(
-            self._doc_key(doc_id), json.dumps(document)
-        )
-        await self._client.sadd(self._ids_key(), doc_id)  # type: ignore[misc]
-        for field in self._index_fields:
-            if field in document:
-                await self._client.set(
-                    self._index_key(field, document[field]),
-                    doc_id,
-                )
+        entries = self._index_entries(document)
+        pipe = self._client.pipeline(transaction=True)
+        if self._hashed:
+            pipe.delete(self._doc_key(doc_id))
+            pipe.hset(
+                self._doc_key(doc_id), mapping=self._encode_fields(document)
+            )
+        else:
+            pipe.set(self._doc_key(doc_id), self._codec.dumps(document))
+        pipe.sadd(self._ids_key(), doc_id)
+        for index_key in entries.values():
+            pipe.set(index_key, doc_id)
+        if entries:
+            pipe.hset(self._refs_key(doc_id), mapping=entries)
+        await pipe.execute()
         return doc_id
 
+    @_metered
     async def replace(
         self, document_id: str, document: dict[str, Any]
     ) -> dict[str, Any]:
         """Replace an existing document.
 
-        Removes stale secondary index entries for changed fields before
-        writing the new document and its updated index entries.
+        Runs as a single Lua script which checks that the document
+        exists, drops index entries whose value changed, then writes the
+        new document and its index entries.
 
         Raises:
             DocumentNotFoundError: If no document matches the ID.
         """
-        existing = await self._client.get(self._doc_key(document_id))
-        if existing is None:
+        doc = {k: v for k, v in document.items() if k != "_id"}
+        keys, args = self._replace_call(document_id, doc)
+        replaced = await self._replace_script(keys=keys, args=args)
+        if not replaced:
             raise DocumentNotFoundError(
                 f"Document {document_id} not found for replacement"
             )
-        old_doc = json.loads(existing)
+        result = dict(doc)
+        result["_id"] = document_id
+        return result
 
-        doc = {k: v for k, v in document.items() if k != "_id"}
+    @_metered
+    async def replace_many(
+        self, documents: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Replace several documents with one pipeline of replace scripts.
 
-        # Remove stale index entries where the value changed
-        for field in self._index_fields:
-            old_val = old_doc.get(field)
-            new_val = doc.get(field)
-            if old_val is not None and old_val != new_val:
-                await self._client.delete(
-                    self._index_key(field, old_val)
-                )
+        Each replacement is atomic on its own; the whole batch costs a
+        single round trip.
+
+        Raises:
+            DocumentNotFoundError: If any document does not exist.
+        """
+        results: list[dict[str, Any]] = []
+        calls: list[tuple[list[str], list[Any]]] = []
+        for document in documents:
+            doc = {k: v for k, v in document.items() if k != "_id"}
+            calls.append(self._replace_call(document["_id"], doc))
+            results.append({**doc, "_id": document["_id"]})
+        if not calls:
+            return []
+        replaced = await self._run_script_many(self._replace_script, calls)
+        missing = [
+            result["_id"]
+            for result, ok in zip(results, replaced)
+            if not ok
+        ]
+        if missing:
+            raise DocumentNotFoundError(
+                f"Documents {missing} not found for replacement"
+            )
+        return results
+
+    async def _update_json(
+        self, document_id: str, update: Callable[[dict[str, Any]], T]
+    ) -> T:
+        """Apply *update* to a JSON document as an optimistic transaction.
+
+        JSON documents cannot be changed field by field, so the document
+        is read under ``WATCH``, changed in place by *update*, then
+        written back with the replace script; the whole call is retried
+        if the document changes in between.
 
-        await self._client.set(
-            self._doc_key(document_id), json.dumps(doc)
+        Returns:
+            What *update* returned.
+
+        Raises:
+            DocumentNotFoundError: If no document matches the ID.
+        """
+        key = self._doc_key(document_id)
+        async with self._client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    doc = self._decode(document_id, await pipe.get(key))
+                    if doc is None:
+                        raise DocumentNotFoundError(
+                            f"Document {document_id} not found for update"
+                        )
+                    result = update(doc)
+                    del doc["_id"]
+                    keys, args = self._replace_call(document_id, doc)
+                    pipe.multi()
+                    pipe.eval(_REPLACE_SCRIPT, len(keys), *keys, *args)
+                    await pipe.execute()
+                    return result
+                except WatchError:
+                    continue
+
+    @_metered
+    async def update_fields(
+        self, document_id: str, fields: dict[str, Any]
+    ) -> None:
+        """Set some fields of a document.
+
+        Hash documents are updated with one script call writing only
+        those fields; JSON documents are rewritten whole.
+
+        Raises:
+            DocumentNotFoundError: If no document matches the ID.
+        """
+        if not fields:
+            return
+        if not self._hashed:
+            await self._update_json(document_id, lambda doc: doc.update(fields))
+            return
+        keys, args = self._replace_call(document_id, fields)
+        updated = await self._update_script(keys=keys, args=args)
+        if not updated:
+            raise DocumentNotFoundError(
+                f"Document {document_id} not found for update"
+            )
+
+    @_metered
+    async def increment(
+        self,
+        document_id: str,
+        field: str,
+        amount: int = 1,
+        once: tuple[str, Any] | None = None,
+    ) -> int:
+        """Add *amount* to an integer field of a document.
+
+        Hash documents are updated with one script call; JSON documents
+        are rewritten whole.
+
+        Raises:
+            DocumentNotFoundError: If no document matches the ID.
+        """
+        if not self._hashed:
+
+            def add(doc: dict[str, Any]) -> int:
+                if once is None or doc.get(once[0]) != once[1]:
+                    doc[field] = (doc.get(field) or 0) + amount
+                    if once is not None:
+                        doc[once[0]] = once[1]
+                return int(doc.get(field) or 0)
+
+            return await self._update_json(document_id, add)
+        args: list[str | int] = [field, amount]
+        if once is not None:
+            args += [once[0], self._codec.dumps(once[1])]
+        value = await self._increment_script(
+            keys=[self._doc_key(document_id)], args=args
         )
-        for field in self._index_fields:
-            if field in doc:
-                await self._client.set(
-                    self._index_key(field, doc[field]),
-                    document_id,
-                )
-        result = dict(doc)
-        result["_id"] = document_id
-        return result
+        if value is None:
+            raise DocumentNotFoundError(
+                f"Document {document_id} not found for increment"
+            )
+        return int(value)
 
+    @_metered
     async def delete_by_id(self, document_id: str) -> None:
-        """Delete a document by its ID."""
-        data = await self._client.get(self._doc_key(document_id))
-        if data is not None:
-            doc = json.loads(data)
-            for field in self._index_fields:
-                if field in doc:
-                    await self._client.delete(
-                        self._index_key(field, doc[field])
-                    )
-        await self._client.delete(self._doc_key(document_id))
-        await self._client.srem(self._ids_key(), document_id)  # type: ignore[misc]
+        """Delete a document by its ID, along with its index entries."""
+        keys, args = self._delete_call(document_id)
+        await self._delete_script(keys=keys, args=args)
+
+    @_metered
+    async def delete_many(self, document_ids: list[str]) -> None:
+        """Delete several documents with one pipeline of delete scripts."""
+        if document_ids:
+            await self._run_script_many(
+                self._delete_script,
+                [self._delete_call(doc_id) for doc_id in document_ids],
+            )
 
+    async def backfill_index_refs(self) -> int:
+        """Write the index back-reference hash of documents lacking one.
+
+        Documents written before back-reference hashes existed own index
+        keys that ``replace`` and ``delete_by_id`` cannot see, and would
+        leak them.  Running this once before serving requests makes those
+        documents look as if they had been written by :meth:`insert`.
+        It is idempotent and cheap once every document has its hash.
+
+        Returns:
+            The number of documents that were given a hash.
+        """
+        if not self._index_fields:
+            return 0
+        doc_ids = sorted(await self._client.smembers(self._ids_key()))  # type: ignore[misc]
+        if not doc_ids:
+            return 0
+        pipe = self._client.pipeline(transaction=False)
+        for doc_id in doc_ids:
+            pipe.exists(self._refs_key(doc_id))
+        has_refs = await pipe.execute()
+        legacy = [
+            doc_id for doc_id, exists in zip(doc_ids, has_refs) if not exists
+        ]
+        pipe = self._client.pipeline(transaction=False)
+        backfilled = 0
+        for document in await self.find_many(legacy):
+            if document is None:
+                continue
+            doc_id = document.pop("_id")
+            entries = self._index_entries(document)
+            if entries:
+                pipe.hset(self._refs_key(doc_id), mapping=entries)
+                backfilled += 1
+        if backfilled:
+            await pipe.execute()
+        return backfilled
+
+    async def convert_to_hashes(self) -> int:
+        """Rewrite the documents stored as JSON strings as hashes.
+
+        Documents written before the collection switched to hashes
+        cannot be read as hashes.  Running this once before serving
+        requests converts them; it is idempotent and costs one pipeline
+        of ``TYPE`` once every document is a hash.
+
+        Returns:
+            The number of documents converted.
+        """
+        if not self._hashed:
+            return 0
+        doc_ids = sorted(await self._client.smembers(self._ids_key()))  # type: ignore[misc]
+        if not doc_ids:
+            return 0
+        pipe = self._client.pipeline(transaction=False)
+        for doc_id in doc_ids:
+            pipe.type(self._doc_key(doc_id))
+        types = await pipe.execute()
+        legacy = [
+            doc_id
+            for doc_id, kind in zip(doc_ids, types)
+            if kind in ("string", b"string")
+        ]
+        if not legacy:
+            return 0
+        values = await self._client.mget(
+            [self._doc_key(doc_id) for doc_id in legacy]
+        )
+        pipe = self._client.pipeline(transaction=True)
+        for doc_id, data in zip(legacy, values):
+            pipe.delete(self._doc_key(doc_id))
+            pipe.hset(
+                self._doc_key(doc_id),
+                mapping=self._encode_fields(self._codec.loads(data)),
+            )
+        await pipe.execute()
+        return len(legacy)
+
+    @_metered
     async def random_member(self) -> dict[str, Any] | None:
         """Get a random document from the collection."""
         doc_id = await self._client.srandmember(self._ids_key())  # type: ignore[misc]
@@ -172,18 +784,198 @@ class ValkeyRepository(Repository):
             doc_id = doc_id.decode()
         return await self.find_by_id(doc_id)
 
+    @_metered
+    async def create_pile(
+        self, pile: str, exclude: list[str] | None = None
+    ) -> int:
+        """Create a draw pile from the collection's ID set."""
+        pipe = self._client.pipeline(transaction=True)
+        pipe.delete(self._pile_key(pile), self._discard_key(pile))
+        pipe.sunionstore(self._pile_key(pile), [self._ids_key()])
+        if exclude:
+            pipe.srem(self._pile_key(pile), *exclude)
+        _deleted, size, *removed = await pipe.execute()
+        return int(size) - sum(int(count) for count in removed)
+
+    @_metered
+    async def draw_from_pile(self, pile: str, count: int = 1) -> list[str]:
+        """Draw random IDs from a pile, reshuffling discards if needed."""
+        if count <= 0:
+            return []
+        drawn = await self._draw_script(
+            keys=[self._pile_key(pile), self._discard_key(pile)],
+            args=[count],
+        )
+        return [
+            doc_id.decode() if isinstance(doc_id, bytes) else doc_id
+            for doc_id in drawn
+        ]
+
+    @_metered
+    async def discard_to_pile(self, pile: str, document_ids: list[str]) -> None:
+        """Add IDs to a pile's discard set."""
+        if document_ids:
+            await self._client.sadd(self._discard_key(pile), *document_ids)  # type: ignore[misc]
+
+    @_metered
+    async def delete_pile(self, pile: str) -> None:
+        """Delete a draw pile and its discard set."""
+        await self._client.delete(self._pile_key(pile), self._discard_key(pile))
+
+    @_metered
     async def count(self) -> int:
         """Count the number of documents in the collection."""
         result = await self._client.scard(self._ids_key())  # type: ignore[misc]
         return int(result)
 
 
+class ValkeyNotifier(LocalNotifier):
+    """Notifier that also fans notifications out through Valkey pub/sub.
+
+    Waiters in this process are woken directly, exactly like
+    :class:`LocalNotifier`.  Every notification is additionally
+    published on ``{prefix}:{key}`` so that other bot processes sharing
+    the same Valkey server wake up their own waiters once
+    :meth:`start` has subscribed them.
+    """
+
+    _RECONNECT_DELAY = 1
+
+    def __init__(self, client: valkey.Valkey, prefix: str = "events") -> None:
+        """Initialize the notifier.
+
+        Args:
+            client: Async Valkey client.
+            prefix: Channel prefix used for published notifications.
+        """
+        super().__init__()
+        self._client = client
+        self._prefix = prefix
+        self._origin = uuid4().hex
+        self._task: asyncio.Task[None] | None = None
+
+    async def notify(self, key: str) -> None:
+        """Wake local waiters on *key* and publish to other processes."""
+        self._wake(key)
+        await self._client.publish(f"{self._prefix}:{key}", self._origin)
+
+    async def start(self) -> None:
+        """Start relaying notifications published by other processes."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop relaying notifications from other processes."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _listen(self) -> None:
+        """Subscribe to notifications and wake matching local waiters."""
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.psubscribe(f"{self._prefix}:*")
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    if message["data"] == self._origin:
+                        continue
+                    channel: str = message["channel"]
+                    self._wake(channel[len(self._prefix) + 1 :])
+            except valkey.ConnectionError:
+                logger.warning(
+                    "Lost notification subscription, retrying in %ss",
+                    self._RECONNECT_DELAY,
+                )
+                await asyncio.sleep(self._RECONNECT_DELAY)
+            finally:
+                await pubsub.aclose()
+
+
+class ValkeyLeases(Leases):
+    """Leases shared by every bot process using the same Valkey server.
+
+    A lease is a key holding its fencing token and expiring with the
+    lease.  Tokens come from one counter shared by every key, so they
+    keep increasing even when a key's lease is deleted and taken again.
+    """
+
+    def __init__(self, client: valkey.Valkey, prefix: str = "leases") -> None:
+        """Initialize the leases.
+
+        Args:
+            client: Async Valkey client.
+            prefix: Prefix of the lease keys.
+        """
+        self._prefix = prefix
+        self._acquire_script = client.register_script(_ACQUIRE_SCRIPT)
+        self._renew_script = client.register_script(_RENEW_SCRIPT)
+
+    def _key(self, key: str) -> str:
+        """Build the Valkey key of a lease."""
+        return f"{self._prefix}:{key}"
+
+    async def acquire(self, key: str, ttl: float) -> int | None:
+        """Acquire the lease of *key* if nobody holds it."""
+        token = await self._acquire_script(
+            keys=[self._key(key), f"{self._prefix}:fence"],
+            args=[int(ttl * 1000)],
+        )
+        return None if token is None else int(token)
+
+    async def renew(self, key: str, token: int, ttl: float) -> bool:
+        """Extend a lease still held with *token*."""
+        renewed = await self._renew_script(
+            keys=[self._key(key)], args=[token, int(ttl * 1000)]
+        )
+        return bool(renewed)
+
+    async def release(self, key: str, token: int) -> None:
+        """Give up a lease still held with *token*."""
+        await self._renew_script(keys=[self._key(key)], args=[token])
+
+
+async def convert_to_hashes(client: valkey.Valkey) -> None:
+    """Convert the JSON documents of every hash collection to hashes.
+
+    Args:
+        client: An async Valkey client.
+    """
+    for collection in sorted(_HASH_COLLECTIONS):
+        repo = ValkeyRepository(
+            client, collection, INDEX_FIELDS.get(collection), hashed=True
+        )
+        converted = await repo.convert_to_hashes()
+        if converted:
+            logger.info("Converted %d %s to hashes", converted, collection)
+
+
+async def backfill_index_refs(client: valkey.Valkey) -> None:
+    """Backfill index back-references in every indexed collection.
+
+    Args:
+        client: An async Valkey client.
+    """
+    for collection, fields in INDEX_FIELDS.items():
+        repo = ValkeyRepository(
+            client, collection, fields, collection in _HASH_COLLECTIONS
+        )
+        backfilled = await repo.backfill_index_refs()
+        if backfilled:
+            logger.info(
+                "Backfilled index references of %d %s", backfilled, collection
+            )
+
+
 def create_repo_factory(client: valkey.Valkey) -> RepositoryFactory:
     """Build a :class:`RepositoryFactory` backed by a Valkey client.
 
     The returned callable creates :class:`ValkeyRepository` instances for
     any collection name, automatically wiring secondary-index fields
-    from the module-level ``_INDEX_FIELDS`` mapping.
+    from the ``INDEX_FIELDS`` mapping and the storage
+    layout from ``_HASH_COLLECTIONS``.  Values are encoded with orjson
+    when it is installed.
 
     Args:
         client: An async Valkey client.
@@ -191,10 +983,16 @@ def create_repo_factory(client: valkey.Valkey) -> RepositoryFactory:
     Returns:
         A factory callable ``(collection: str) -> Repository``.
     """
+    codec = default_codec()
+    logger.info("Encoding stored values with %s", codec.name)
 
     def factory(collection: str) -> Repository:
         return ValkeyRepository(
-            client, collection, _INDEX_FIELDS.get(collection)
+            client,
+            collection,
+            INDEX_FIELDS.get(collection),
+            collection in _HASH_COLLECTIONS,
+            codec,
         )
 
     return factory
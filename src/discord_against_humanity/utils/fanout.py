@@ -0,0 +1,108 @@
+"""Concurrent fan-out of Discord calls with bounded parallelism."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from discord_against_humanity.utils.metrics import FAN_OUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# How many calls of one fan-out may be in flight at once.
+DEFAULT_LIMIT = 8
+
+# How many fan-out calls may be in flight at once in the whole process,
+# every game included.  Sends to different channels use different
+# rate-limit buckets, which discord.py tracks and waits on by itself;
+# this cap only keeps many busy tables from bursting into the global
+# rate limit together.
+PROCESS_LIMIT = 32
+
+_limiters: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    WeakKeyDictionary()
+)
+_latencies: ContextVar[dict[str, float] | None] = ContextVar(
+    "fan_out_latencies", default=None
+)
+
+
+def _process_limiter() -> asyncio.Semaphore:
+    """Get the semaphore shared by every fan-out of the running loop."""
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = asyncio.Semaphore(PROCESS_LIMIT)
+    return limiter
+
+
+@contextmanager
+def record_latencies() -> Iterator[dict[str, float]]:
+    """Collect the latency of every fan-out run inside the block.
+
+    Yields:
+        A mapping of fan-out label to its total latency in milliseconds,
+        filled in as fan-outs complete.
+    """
+    latencies: dict[str, float] = {}
+    token = _latencies.set(latencies)
+    try:
+        yield latencies
+    finally:
+        _latencies.reset(token)
+
+
+async def fan_out(
+    label: str,
+    calls: Iterable[Awaitable[Any]],
+    limit: int = DEFAULT_LIMIT,
+) -> list[Any]:
+    """Await several Discord calls concurrently.
+
+    One failing call does not cancel the others: failures are logged
+    and returned in place of a result.  The total latency is logged
+    under *label*, and added to the block of :func:`record_latencies`
+    the fan-out runs in, if any.
+
+    Args:
+        label: Name of the fan-out, used in logs (e.g. ``"hands"``).
+        calls: The awaitables to run, typically ``channel.send(...)``.
+        limit: Maximum number of calls of this fan-out in flight at
+            once.  All fan-outs of the process also share a cap of
+            :data:`PROCESS_LIMIT` calls.
+
+    Returns:
+        The result of each call, or the exception it raised, in the
+        order of *calls*.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    limiter = _process_limiter()
+
+    async def bounded(call: Awaitable[Any]) -> Any:
+        async with semaphore, limiter:
+            return await call
+
+    start = perf_counter()
+    results = await asyncio.gather(
+        *(bounded(call) for call in calls), return_exceptions=True
+    )
+    elapsed = (perf_counter() - start) * 1000
+    FAN_OUT_SECONDS.observe(elapsed / 1000, label=label)
+    failures = [result for result in results if isinstance(result, Exception)]
+    for failure in failures:
+        logger.warning("Fan-out %s: call failed: %r", label, failure)
+    logger.info(
+        "Fan-out %s: %d calls in %.1f ms (%d failed)",
+        label,
+        len(results),
+        elapsed,
+        len(failures),
+    )
+    latencies = _latencies.get()
+    if latencies is not None:
+        latencies[label] = latencies.get(label, 0.0) + elapsed
+    return results
@@ -0,0 +1,298 @@
+"""Prometheus-style metrics kept in process memory and served over HTTP."""
+
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Any
+
+from aiohttp import ClientSession, TraceConfig, web
+from aiohttp.tracing import TraceRequestEndParams, TraceRequestExceptionParams
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_REGISTRY: list["Metric"] = []
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Metric:
+    """A family of series sharing a name and label names.
+
+    Each distinct set of label values is a series.  Creating a metric
+    registers it, so it is exported by :func:`render`.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()) -> None:
+        """Create and register a metric.
+
+        Args:
+            name: Name of the metric.
+            help: One-line description of the metric.
+            labels: Names of the labels telling its series apart.
+        """
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple[str, ...], Any] = {}
+        _REGISTRY.append(self)
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        """Get the series key of the given label values."""
+        return tuple(str(labels[label]) for label in self.labels)
+
+    def _labels(self, key: tuple[str, ...], **extra: str) -> str:
+        """Format the labels of a series."""
+        pairs = [*zip(self.labels, key), *extra.items()]
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+    def samples(self) -> Iterator[str]:
+        """Format every sample of the metric.
+
+        Yields:
+            One line per sample.
+        """
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{self._labels(key)} {value}"
+
+    def clear(self) -> None:
+        """Drop every series."""
+        self._values.clear()
+
+
+class Counter(Metric):
+    """A value that only goes up, such as a number of calls."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Add to the series of the given labels.
+
+        Args:
+            amount: How much to add.
+            **labels: The value of each label.
+        """
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """A value that goes up and down, such as a number of games."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the series of the given labels.
+
+        Args:
+            value: The new value.
+            **labels: The value of each label.
+        """
+        self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    """A distribution of durations, counted in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Create and register a histogram.
+
+        Args:
+            name: Name of the metric.
+            help: One-line description of the metric.
+            labels: Names of the labels telling its series apart.
+            buckets: Upper bounds of the buckets, in increasing order.
+        """
+        super().__init__(name, help, labels)
+        self.buckets = buckets
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Count one observation in the series of the given labels.
+
+        Args:
+            value: The observed value, typically in seconds.
+            **labels: The value of each label.
+        """
+        key = self._key(labels)
+        series = self._values.get(key)
+        if series is None:
+            series = self._values[key] = [0] * (len(self.buckets) + 2)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[index] += 1
+                break
+        else:
+            series[-2] += 1
+        series[-1] += value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe how long the block takes.
+
+        Args:
+            **labels: The value of each label.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(perf_counter() - start, **labels)
+
+    def samples(self) -> Iterator[str]:
+        """Format the buckets, sum and count of every series.
+
+        Yields:
+            One line per sample.
+        """
+        for key, series in sorted(self._values.items()):
+            total = 0
+            for bound, count in zip((*self.buckets, "+Inf"), series):
+                total += count
+                le = self._labels(key, le=str(bound))
+                yield f"{self.name}_bucket{le} {total}"
+            yield f"{self.name}_sum{self._labels(key)} {series[-1]}"
+            yield f"{self.name}_count{self._labels(key)} {total}"
+
+
+def timed(
+    histogram: Histogram, label: str
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate a coroutine function to observe how long it takes.
+
+    Args:
+        histogram: The histogram observing the durations.
+        label: The label set to the name of the function.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with histogram.time(**{label: func.__name__}):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def render() -> str:
+    """Format every metric in the Prometheus text exposition format.
+
+    Returns:
+        The metrics, one sample per line.
+    """
+    lines: list[str] = []
+    for metric in _REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.samples())
+    return "\n".join(lines) + "\n"
+
+
+async def _on_request_end(
+    session: ClientSession, context: Any, params: TraceRequestEndParams
+) -> None:
+    """Count a Discord HTTP request that got a response."""
+    status = params.response.status
+    DISCORD_REQUESTS.inc(method=params.method, status=status)
+    if status == 429:
+        DISCORD_RATE_LIMITS.inc()
+
+
+async def _on_request_exception(
+    session: ClientSession, context: Any, params: TraceRequestExceptionParams
+) -> None:
+    """Count a Discord HTTP request that failed without a response."""
+    DISCORD_REQUESTS.inc(method=params.method, status="error")
+
+
+def http_trace() -> TraceConfig:
+    """Build the trace config counting the Discord HTTP requests.
+
+    Returns:
+        A trace config to pass to the client as ``http_trace``.
+    """
+    trace = TraceConfig()
+    trace.on_request_end.append(_on_request_end)
+    trace.on_request_exception.append(_on_request_exception)
+    return trace
+
+
+async def _metrics(request: web.Request) -> web.Response:
+    """Serve every metric."""
+    return web.Response(text=render(), content_type="text/plain", charset="utf-8")
+
+
+async def start_server(port: int, host: str = "0.0.0.0") -> web.AppRunner:
+    """Serve the metrics on ``/metrics``.
+
+    Args:
+        port: Port to listen on.
+        host: Address to listen on.
+
+    Returns:
+        The server's runner; call its ``cleanup`` method to stop it.
+    """
+    app = web.Application()
+    app.router.add_get("/metrics", _metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info("Serving metrics on %s:%d/metrics", host, port)
+    return runner
+
+
+COMMAND_SECONDS = Histogram(
+    "cah_command_seconds",
+    "Time to handle a slash command, checks included.",
+    ("command", "outcome"),
+)
+CHECK_SECONDS = Histogram(
+    "cah_check_seconds", "Time to run a command check.", ("check",)
+)
+REPOSITORY_SECONDS = Histogram(
+    "cah_repository_seconds",
+    "Time of a repository call, by method and collection.",
+    ("method", "collection"),
+)
+ACTIVE_GAMES = Gauge("cah_active_games", "Games being played by this process.")
+PHASE_SECONDS = Histogram(
+    "cah_phase_seconds",
+    "Time a round spent in a phase.",
+    ("phase",),
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800),
+)
+FAN_OUT_SECONDS = Histogram(
+    "cah_fan_out_seconds", "Time of a fan-out of Discord calls.", ("label",)
+)
+DISCORD_REQUESTS = Counter(
+    "cah_discord_requests_total",
+    "Discord HTTP requests, by method and status ('error' if none).",
+    ("method", "status"),
+)
+DISCORD_RATE_LIMITS = Counter(
+    "cah_discord_rate_limits_total",
+    "Discord HTTP requests answered with 429 Too Many Requests.",
+)
@@ -0,0 +1,292 @@
+"""Tracing of coroutine calls, exported as OpenTelemetry spans.
+
+Tracing is configured once from the environment when this module is
+imported:
+
+- ``TRACE_EXPORT``: a file path, to append spans to as OTLP/JSON lines
+  (readable by the collector's ``otlpjsonfile`` receiver), or an
+  ``http(s)://`` URL of a collector's OTLP/HTTP traces endpoint.
+  Tracing is off when it is not set.
+- ``TRACE_ARGS_SAMPLE``: the share of spans recording the arguments of
+  their call (``0.1`` by default).
+
+When tracing is off, :func:`traced` returns the function it decorates
+unchanged, so traced functions cost nothing.
+"""
+
+import asyncio
+import json
+import logging
+import reprlib
+import secrets
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from os import environ
+from random import random
+from time import monotonic, time_ns
+from typing import Any
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# How many finished spans are exported together.
+BATCH_SIZE = 256
+
+# Longest time finished spans wait to be exported, in seconds.
+FLUSH_INTERVAL = 5
+
+_SERVICE = "discord-against-humanity"
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+_current: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+_repr = reprlib.Repr()
+_repr.maxstring = 80
+_repr.maxother = 80
+
+
+class Span:
+    """A timed operation, child of the span current when it started."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start",
+        "end",
+        "attributes",
+        "error",
+    )
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str
+    start: int
+    end: int
+    attributes: dict[str, str]
+    error: str | None
+
+    def __init__(self, name: str, parent: "Span | None") -> None:
+        """Start a span now.
+
+        Args:
+            name: Name of the operation.
+            parent: The enclosing span, or None to start a new trace.
+        """
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else ""
+        self.start = time_ns()
+        self.end = 0
+        self.attributes = {}
+        self.error = None
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Convert the span to its OTLP/JSON form.
+
+        Returns:
+            The span as an OTLP ``Span`` message.
+        """
+        status: dict[str, Any] = {"code": _STATUS_OK}
+        if self.error is not None:
+            status = {"code": _STATUS_ERROR, "message": self.error}
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start),
+            "endTimeUnixNano": str(self.end),
+            "attributes": [
+                {"key": key, "value": {"stringValue": value}}
+                for key, value in self.attributes.items()
+            ],
+            "status": status,
+        }
+
+
+def _otlp_request(spans: list[Span]) -> dict[str, Any]:
+    """Wrap spans in an OTLP ``ExportTraceServiceRequest``."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {
+                            "key": "service.name",
+                            "value": {"stringValue": _SERVICE},
+                        }
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "discord_against_humanity"},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class Tracer:
+    """Record spans and export them in batches.
+
+    Spans are exported once a batch is full or a few seconds after the
+    previous export.  A batch is written to a file synchronously, or
+    posted to a collector in the background.
+    """
+
+    def __init__(self, export: str, args_sample: float = 0.1) -> None:
+        """Create a tracer.
+
+        Args:
+            export: File path or ``http(s)://`` URL to export spans to.
+            args_sample: Share of spans recording their call arguments.
+        """
+        self._export = export
+        self._args_sample = args_sample
+        self._finished: list[Span] = []
+        self._flushed = monotonic()
+        self._posts: set[asyncio.Task[None]] = set()
+
+    def start(self, name: str) -> Span:
+        """Start a span, child of the current one, and make it current.
+
+        The span stays current for the rest of the task, which suits
+        the root span of a task such as an interaction.
+
+        Args:
+            name: Name of the operation.
+
+        Returns:
+            The new span.
+        """
+        span = Span(name, _current.get())
+        _current.set(span)
+        return span
+
+    def end(self, span: Span, error: BaseException | None = None) -> None:
+        """End a span.
+
+        Args:
+            span: The span to end.
+            error: The exception the operation raised, if any.
+        """
+        span.end = time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        self._finished.append(span)
+        if (
+            len(self._finished) >= BATCH_SIZE
+            or monotonic() - self._flushed >= FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        """Record the block as a span.
+
+        Args:
+            name: Name of the operation.
+
+        Yields:
+            The span, to add attributes to.
+        """
+        span = Span(name, _current.get())
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            self.end(span, error)
+            raise
+        else:
+            self.end(span)
+        finally:
+            _current.reset(token)
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Record every call of a coroutine function as a span.
+
+        Args:
+            func: The coroutine function to trace.
+
+        Returns:
+            The traced function.
+        """
+        name = func.__qualname__
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self.span(name) as span:
+                if self._args_sample and random() < self._args_sample:
+                    span.attributes["code.args"] = _repr.repr(args)
+                    span.attributes["code.kwargs"] = _repr.repr(kwargs)
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    def flush(self) -> None:
+        """Export the finished spans."""
+        spans, self._finished = self._finished, []
+        self._flushed = monotonic()
+        if not spans:
+            return
+        body = json.dumps(_otlp_request(spans))
+        if not self._export.startswith(("http://", "https://")):
+            with open(self._export, "a", encoding="utf-8") as file:
+                file.write(body + "\n")
+            return
+        task = asyncio.get_running_loop().create_task(self._post(body))
+        self._posts.add(task)
+        task.add_done_callback(self._posts.discard)
+
+    async def _post(self, body: str) -> None:
+        """Send a batch of spans to the collector."""
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(
+                    self._export,
+                    data=body,
+                    headers={"Content-Type": "application/json"},
+                ) as response:
+                    response.raise_for_status()
+        except aiohttp.ClientError as error:
+            logger.warning("Could not export spans: %s", error)
+
+    async def shutdown(self) -> None:
+        """Export the remaining spans and wait for pending exports."""
+        self.flush()
+        await asyncio.gather(*self._posts, return_exceptions=True)
+
+
+def _from_environment() -> Tracer | None:
+    """Create the tracer configured by the environment, if any."""
+    export = environ.get("TRACE_EXPORT", "")
+    if not export:
+        return None
+    return Tracer(export, float(environ.get("TRACE_ARGS_SAMPLE", "0.1")))
+
+
+tracer = _from_environment()
+
+
+def traced(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate a coroutine function to record its calls as spans.
+
+    Args:
+        func: The coroutine function to trace.
+
+    Returns:
+        The traced function, or *func* itself when tracing is off.
+    """
+    if tracer is None:
+        return func
+    return tracer.wrap(func)
@@ -5,6 +5,7 @@ from uuid import uuid4
 
 import pytest
 
+from discord_against_humanity.ports.local import LocalNotifier, LocalScheduler
 from discord_against_humanity.ports.repository import Repository
 
 
@@ -13,10 +14,20 @@ def mock_valkey_client():
     """Create a mock async Valkey client.
 
     The Valkey client is used via get/set/sadd/srandmember/etc.,
-    so we mock the relevant methods.
+    so we mock the relevant methods.  ``pipeline()`` returns a shared
+    buffered pipeline mock and ``register_script()`` returns an
+    awaitable script mock, both exposed for assertions.
     """
     client = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    client.pipeline = MagicMock(return_value=pipe)
+    client._pipe = pipe
+    client.register_script = MagicMock(
+        side_effect=lambda _script: AsyncMock(return_value=1)
+    )
     client.get = AsyncMock(return_value=None)
+    client.mget = AsyncMock(return_value=[])
     client.set = AsyncMock()
     client.delete = AsyncMock()
     client.exists = AsyncMock(return_value=True)
@@ -24,6 +35,8 @@ def mock_valkey_client():
     client.srem = AsyncMock()
     client.srandmember = AsyncMock(return_value=None)
     client.scard = AsyncMock(return_value=0)
+    client.smembers = AsyncMock(return_value=set())
+    client.publish = AsyncMock(return_value=0)
     return client
 
 
@@ -31,11 +44,21 @@ def _create_mock_repo():
     """Build a fresh mock Repository."""
     repo = MagicMock(spec=Repository)
     repo.find_by_id = AsyncMock(return_value=None)
+    repo.find_many = AsyncMock(return_value=[])
+    repo.find_all = AsyncMock(return_value=[])
     repo.find_one = AsyncMock(return_value=None)
     repo.insert = AsyncMock(return_value=str(uuid4()))
     repo.replace = AsyncMock(return_value={})
+    repo.replace_many = AsyncMock(return_value=[])
+    repo.update_fields = AsyncMock()
+    repo.increment = AsyncMock(return_value=1)
     repo.delete_by_id = AsyncMock()
+    repo.delete_many = AsyncMock()
     repo.random_member = AsyncMock(return_value=None)
+    repo.create_pile = AsyncMock(return_value=0)
+    repo.draw_from_pile = AsyncMock(return_value=[])
+    repo.discard_to_pile = AsyncMock()
+    repo.delete_pile = AsyncMock()
     repo.count = AsyncMock(return_value=0)
     return repo
 
@@ -61,9 +84,13 @@ def mock_repo_factory():
 
 @pytest.fixture
 def mock_bot():
-    """Create a mock Discord Bot."""
+    """Create a mock Discord Bot with an in-process notifier."""
     bot = MagicMock()
     bot.get_guild = MagicMock(return_value=None)
+    bot.notifier = LocalNotifier()
+    bot.scheduler = LocalScheduler()
+    bot.round_timeouts = {}
+    bot.catalog = None
     return bot
 
 
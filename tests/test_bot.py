@@ -1,10 +1,30 @@
 """Tests for bot creation and configuration."""
 
-from unittest.mock import patch
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from discord.ext.commands import Bot
+import pytest
+from discord.ext.commands import AutoShardedBot, Bot
 
-from discord_against_humanity.bot import create_bot, init_logger
+from discord_against_humanity.adapters.runner import GameRunner
+from discord_against_humanity.bot import (
+    MeteredTree,
+    _observe_command,
+    create_bot,
+    init_logger,
+    parse_shards,
+    seed_cards,
+    split_shards,
+)
+from discord_against_humanity.domain.phase import Phase
+from discord_against_humanity.ports.local import (
+    LocalLeases,
+    LocalNotifier,
+    LocalScheduler,
+)
+from discord_against_humanity.ports.memory import MemoryStore
+from discord_against_humanity.ports.valkey import ValkeyNotifier
+from discord_against_humanity.utils.tracing import Tracer
 
 
 class TestCreateBot:
@@ -48,6 +68,94 @@ class TestCreateBot:
         assert hasattr(bot, "repo_factory")
         mock_factory.assert_called_once()
 
+    @patch("discord_against_humanity.bot.create_repo_factory")
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    def test_notifier_attribute(self, mock_valkey, mock_factory):
+        bot = create_bot()
+        assert isinstance(bot.notifier, ValkeyNotifier)
+
+    @patch("discord_against_humanity.bot.create_repo_factory")
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    def test_catalog_not_loaded_until_setup(self, mock_valkey, mock_factory):
+        bot = create_bot()
+        assert bot.catalog is None
+
+    @patch("discord_against_humanity.bot.create_repo_factory")
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    def test_game_runner_attribute(self, mock_valkey, mock_factory):
+        bot = create_bot()
+        assert isinstance(bot.game_runner, GameRunner)
+        assert bot.game_runner.running == set()
+
+    @patch("discord_against_humanity.bot.Bot.close", new_callable=AsyncMock)
+    @patch("discord_against_humanity.bot.create_repo_factory")
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    async def test_close_stops_background_services(
+        self, mock_valkey, mock_factory, mock_close
+    ):
+        bot = create_bot()
+        bot.valkey.aclose = AsyncMock()
+        for service in (bot.game_runner, bot.scheduler, bot.notifier):
+            service.stop = AsyncMock()
+        await bot.close()
+        bot.game_runner.stop.assert_awaited_once()
+        bot.scheduler.stop.assert_awaited_once()
+        bot.notifier.stop.assert_awaited_once()
+        mock_close.assert_awaited_once()
+        bot.valkey.aclose.assert_awaited_once()
+
+    @patch("discord_against_humanity.bot.create_repo_factory")
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    @patch.dict("os.environ", {}, clear=True)
+    def test_round_timeouts_default(self, mock_valkey, mock_factory):
+        bot = create_bot()
+        assert isinstance(bot.scheduler, LocalScheduler)
+        assert bot.round_timeouts == {
+            Phase.PLAYERS_VOTING: 300,
+            Phase.TSAR_VOTING: 300,
+        }
+
+    @patch("discord_against_humanity.bot.create_repo_factory")
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    @patch.dict("os.environ", {"PLAYERS_VOTE_TIMEOUT": "90", "TSAR_VOTE_TIMEOUT": "0"})
+    def test_round_timeouts_from_env(self, mock_valkey, mock_factory):
+        bot = create_bot()
+        assert bot.round_timeouts == {
+            Phase.PLAYERS_VOTING: 90,
+            Phase.TSAR_VOTING: None,
+        }
+
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    @patch.dict("os.environ", {"STORE": "memory"})
+    def test_memory_store_needs_no_valkey(self, mock_valkey):
+        bot = create_bot()
+        mock_valkey.assert_not_called()
+        assert bot.valkey is None
+        assert isinstance(bot.store, MemoryStore)
+        assert bot.repo_factory("games") is bot.store.repository("games")
+        assert isinstance(bot.notifier, LocalNotifier)
+        assert isinstance(bot.game_runner._leases, LocalLeases)
+
+    @patch("discord_against_humanity.bot.Bot.close", new_callable=AsyncMock)
+    @patch.dict("os.environ", {"STORE": "memory"})
+    async def test_close_saves_the_memory_store(self, mock_close):
+        bot = create_bot()
+        for service in (bot.game_runner, bot.scheduler, bot.store):
+            service.stop = AsyncMock()
+        await bot.close()
+        bot.store.stop.assert_awaited_once()
+        mock_close.assert_awaited_once()
+
+    @patch("discord_against_humanity.bot.configure_render_cache")
+    @patch("discord_against_humanity.bot.create_repo_factory")
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    @patch.dict("os.environ", {"CARD_RENDER_CACHE_SIZE": "128"})
+    def test_render_cache_size_from_env(
+        self, mock_valkey, mock_factory, mock_configure
+    ):
+        create_bot()
+        mock_configure.assert_called_once_with(128)
+
     @patch("discord_against_humanity.bot.create_repo_factory")
     @patch("discord_against_humanity.bot.valkey.Valkey")
     @patch.dict("os.environ", {"VALKEY_HOST": "db.example.com", "VALKEY_PORT": "6380"})
@@ -66,6 +174,89 @@ class TestCreateBot:
             host="localhost", port=6379, decode_responses=True
         )
 
+    @patch("discord_against_humanity.bot.create_repo_factory")
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    def test_unsharded_by_default(self, mock_valkey, mock_factory):
+        bot = create_bot()
+        assert not isinstance(bot, AutoShardedBot)
+        assert bot.game_runner.owns(123456789)
+
+    @patch("discord_against_humanity.bot.create_repo_factory")
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    def test_sharded(self, mock_valkey, mock_factory):
+        bot = create_bot([2, 3], 8)
+        assert isinstance(bot, AutoShardedBot)
+        assert bot.shard_ids == [2, 3]
+        assert bot.shard_count == 8
+        assert bot.game_runner.owns(3 << 22)
+        assert not bot.game_runner.owns(4 << 22)
+
+    @patch("discord_against_humanity.bot.create_repo_factory")
+    @patch("discord_against_humanity.bot.valkey.Valkey")
+    def test_commands_are_timed(self, mock_valkey, mock_factory):
+        bot = create_bot()
+        assert isinstance(bot.tree, MeteredTree)
+
+
+class TestCommandMetrics:
+    """Tests for the slash command latency metric."""
+
+    async def test_latency_is_observed_from_first_check(self):
+        interaction = MagicMock(extras={})
+        interaction.command.qualified_name = "join"
+        assert await MeteredTree.interaction_check(MagicMock(), interaction)
+        with patch("discord_against_humanity.bot.COMMAND_SECONDS") as histogram:
+            _observe_command(interaction, "ok")
+        histogram.observe.assert_called_once()
+        assert histogram.observe.call_args.kwargs == {
+            "command": "join",
+            "outcome": "ok",
+        }
+
+    async def test_command_is_a_root_span_when_tracing(self, tmp_path):
+        tracer = Tracer(str(tmp_path / "spans.jsonl"))
+        interaction = MagicMock(extras={})
+        interaction.command.qualified_name = "join"
+        with patch("discord_against_humanity.bot.tracer", tracer):
+            await MeteredTree.interaction_check(MagicMock(), interaction)
+            _observe_command(interaction, "error", ValueError("boom"))
+        (span,) = tracer._finished
+        assert span.name == "/join"
+        assert span.error == "ValueError: boom"
+
+    def test_unchecked_interaction_is_not_observed(self):
+        with patch("discord_against_humanity.bot.COMMAND_SECONDS") as histogram:
+            _observe_command(MagicMock(extras={}), "error")
+        histogram.observe.assert_not_called()
+
+
+class TestShards:
+    """Tests for parse_shards() and split_shards()."""
+
+    def test_parse_every_shard_by_default(self):
+        assert parse_shards("", 4) == range(4)
+
+    def test_parse_range(self):
+        assert parse_shards("4-7", 8) == range(4, 8)
+
+    def test_parse_single_shard(self):
+        assert parse_shards("3", 8) == range(3, 4)
+
+    @pytest.mark.parametrize("value", ["6-9", "5-2", "x"])
+    def test_parse_rejects_bad_ranges(self, value):
+        with pytest.raises(ValueError):
+            parse_shards(value, 8)
+
+    def test_split_into_contiguous_ranges(self):
+        assert split_shards(range(10), 3) == [
+            range(0, 4),
+            range(4, 7),
+            range(7, 10),
+        ]
+
+    def test_split_into_fewer_ranges_than_workers(self):
+        assert split_shards(range(4, 6), 4) == [range(4, 5), range(5, 6)]
+
 
 class TestInitLogger:
     """Tests for init_logger()."""
@@ -74,3 +265,25 @@ class TestInitLogger:
     def test_init_logger_calls_dictconfig(self, mock_dictconfig):
         init_logger()
         mock_dictconfig.assert_called_once()
+
+
+class TestSeedCards:
+    """Tests for seed_cards()."""
+
+    async def test_seeds_empty_collections(self, tmp_path):
+        (tmp_path / "black_cards.json").write_text(
+            json.dumps([{"_id": {"$oid": "x"}, "text": "Why _?", "pick": 1}])
+        )
+        store = MemoryStore()
+        await seed_cards(store, tmp_path)
+        cards = await store.repository("black_cards").find_all()
+        assert [(card["text"], card["pick"]) for card in cards] == [("Why _?", 1)]
+        assert await store.repository("white_cards").count() == 0
+
+    async def test_keeps_existing_cards(self, tmp_path):
+        (tmp_path / "white_cards.json").write_text(json.dumps([{"text": "New"}]))
+        store = MemoryStore()
+        await store.repository("white_cards").insert({"text": "Old"})
+        await seed_cards(store, tmp_path)
+        cards = await store.repository("white_cards").find_all()
+        assert [card["text"] for card in cards] == ["Old"]
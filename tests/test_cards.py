@@ -3,7 +3,16 @@
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
-from discord_against_humanity.domain.cards import BlackCard, WhiteCard
+import pytest
+
+from discord_against_humanity.domain.cards import (
+    BlackCard,
+    CardCatalog,
+    CatalogCard,
+    WhiteCard,
+    configure_render_cache,
+    render_cache_info,
+)
 from discord_against_humanity.ports.repository import Repository
 
 
@@ -107,3 +116,134 @@ class TestWhiteCard:
         await card.get(doc_id)
         assert card._document["_id"] == doc_id
         assert card._document["text"] == "A witty answer"
+
+
+class TestCardCatalog:
+    """Tests for CardCatalog."""
+
+    @pytest.fixture
+    def catalog(self):
+        return CardCatalog(
+            [
+                {"_id": "b1", "text": "Why did _ go to _?", "pick": 2},
+                {"_id": "b2", "text": "What is <b>love</b>?"},
+            ],
+            [{"_id": "w1", "text": "<i>Something funny</i>"}],
+        )
+
+    def test_cards_are_prerendered(self, catalog, mock_repo, mock_repo_factory):
+        card = BlackCard(repository=mock_repo, repo_factory=mock_repo_factory)
+        card._document = {"text": "Why did _ go to _?", "pick": 2}
+        assert catalog.black_card("b1") == CatalogCard(card.text, 2)
+        assert catalog.black_card("b2").pick == 1
+        assert catalog.white_card("w1").text == "_Something funny_"
+
+    def test_unknown_card_is_none(self, catalog):
+        assert catalog.black_card("w1") is None
+        assert catalog.white_card("nope") is None
+
+    def test_is_read_only(self, catalog):
+        with pytest.raises(TypeError):
+            catalog._white["w2"] = CatalogCard("x")  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            catalog.extra = 1  # type: ignore[attr-defined]
+
+    async def test_load_reads_both_collections(self, mock_repo_factory):
+        mock_repo_factory._repo.find_all = AsyncMock(
+            return_value=[{"_id": "c1", "text": "Card _"}]
+        )
+        catalog = await CardCatalog.load(mock_repo_factory)
+        mock_repo_factory.assert_any_call("black_cards")
+        mock_repo_factory.assert_any_call("white_cards")
+        assert catalog.black_card("c1") is not None
+        assert catalog.white_card("c1") is not None
+
+    async def test_black_card_served_without_io(self, catalog, mock_repo_factory):
+        card = await BlackCard.create(mock_repo_factory, "b1", catalog)
+        mock_repo_factory._repo.find_by_id.assert_not_awaited()
+        assert card.document_id == "b1"
+        assert card.pick == 2
+        assert card.text == catalog.black_card("b1").text
+
+    async def test_white_card_served_without_io(self, catalog, mock_repo_factory):
+        card = await WhiteCard.create(mock_repo_factory, "w1", catalog)
+        mock_repo_factory._repo.find_by_id.assert_not_awaited()
+        assert card.text == "_Something funny_"
+
+    async def test_create_falls_back_to_repository(self, catalog, mock_repo_factory):
+        mock_repo_factory._repo.find_by_id = AsyncMock(
+            return_value={"_id": "w9", "text": "New card"}
+        )
+        card = await WhiteCard.create(mock_repo_factory, "w9", catalog)
+        mock_repo_factory._repo.find_by_id.assert_awaited_once_with("w9")
+        assert card.text == "New card"
+
+    async def test_create_many_only_reads_uncatalogued(
+        self, catalog, mock_repo_factory
+    ):
+        repo = mock_repo_factory._repo
+        repo.find_many = AsyncMock(
+            return_value=[{"_id": "w9", "text": "New card"}, None]
+        )
+        cards = await WhiteCard.create_many(
+            mock_repo_factory, ["w9", "w1", "gone"], catalog
+        )
+        repo.find_many.assert_awaited_once_with(["w9", "gone"])
+        assert [c.document_id for c in cards] == ["w9", "w1"]
+
+    async def test_create_many_fully_cached_skips_repository(
+        self, catalog, mock_repo_factory
+    ):
+        cards = await WhiteCard.create_many(mock_repo_factory, ["w1"], catalog)
+        mock_repo_factory._repo.find_many.assert_not_awaited()
+        assert len(cards) == 1
+
+
+class TestRenderCache:
+    """Tests for the shared html2text render cache."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        configure_render_cache(8)
+        yield
+        configure_render_cache(4096)
+
+    def test_repeated_text_is_parsed_once(self, mock_repo, mock_repo_factory):
+        card = WhiteCard(repository=mock_repo, repo_factory=mock_repo_factory)
+        card._document = {"text": "<i>Cached</i>"}
+        first = card.text
+        assert card.text == first
+        info = render_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_cache_is_shared_across_cards(self, mock_repo, mock_repo_factory):
+        for _ in range(3):
+            card = BlackCard(repository=mock_repo, repo_factory=mock_repo_factory)
+            card._document = {"text": "Why _?", "pick": 1}
+            assert card.text is not None
+        assert render_cache_info().misses == 1
+        assert render_cache_info().hits == 2
+
+    def test_cache_is_bounded(self, mock_repo, mock_repo_factory):
+        card = WhiteCard(repository=mock_repo, repo_factory=mock_repo_factory)
+        for i in range(20):
+            card._document = {"text": f"Card {i}"}
+            assert card.text == f"Card {i}"
+        info = render_cache_info()
+        assert info.maxsize == 8
+        assert info.currsize == 8
+
+    def test_catalog_bypasses_cache(self, mock_repo, mock_repo_factory):
+        catalog = CardCatalog(
+            [{"_id": "b", "text": "Why _?", "pick": 1}],
+            [{"_id": "w", "text": "<i>Answer</i>"}],
+        )
+        assert catalog.white_card("w").text == "_Answer_"
+        assert render_cache_info() == (0, 0, 8, 0)
+
+    def test_configure_resets_counters(self, mock_repo, mock_repo_factory):
+        card = WhiteCard(repository=mock_repo, repo_factory=mock_repo_factory)
+        card._document = {"text": "Card"}
+        _ = card.text
+        configure_render_cache(2)
+        assert render_cache_info() == (0, 0, 2, 0)
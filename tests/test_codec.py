@@ -0,0 +1,64 @@
+"""Tests for the value codecs of the Valkey adapter."""
+
+import json
+
+import pytest
+
+from discord_against_humanity.ports import codec
+from discord_against_humanity.ports.codec import (
+    JsonCodec,
+    OrjsonCodec,
+    default_codec,
+)
+
+GAME = {
+    "guild": 1234567890123456789,
+    "players": ["a", "b"],
+    "black_cards": ["c"],
+    "white_cards": [],
+    "results": [["a", "Ça « marche »"]],
+    "playing": True,
+    "tsar": None,
+}
+
+
+class TestJsonCodec:
+    """Tests for JsonCodec."""
+
+    def test_round_trip(self):
+        assert JsonCodec().loads(JsonCodec().dumps(GAME)) == GAME
+
+    def test_writes_compact_text(self):
+        assert JsonCodec().dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'
+
+    def test_reads_text_of_older_versions(self):
+        assert JsonCodec().loads(json.dumps(GAME)) == GAME
+
+
+class TestOrjsonCodec:
+    """Tests for OrjsonCodec."""
+
+    @pytest.fixture(autouse=True)
+    def _orjson(self):
+        pytest.importorskip("orjson")
+
+    def test_writes_the_same_text_as_json(self):
+        assert OrjsonCodec().dumps(GAME) == JsonCodec().dumps(GAME)
+
+    def test_reads_text_of_older_versions(self):
+        assert OrjsonCodec().loads(json.dumps(GAME)) == GAME
+
+    def test_converts_keys_like_json(self):
+        assert OrjsonCodec().dumps({1: 2}) == JsonCodec().dumps({1: 2})
+
+
+class TestDefaultCodec:
+    """Tests for default_codec."""
+
+    def test_prefers_orjson(self):
+        pytest.importorskip("orjson")
+        assert isinstance(default_codec(), OrjsonCodec)
+
+    def test_falls_back_to_json(self, monkeypatch):
+        monkeypatch.setattr(codec, "orjson", None)
+        assert type(default_codec()) is JsonCodec
@@ -0,0 +1,92 @@
+"""Tests for the fan_out helper."""
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+from discord_against_humanity.utils import fanout
+from discord_against_humanity.utils.fanout import fan_out, record_latencies
+
+
+class TestFanOut:
+    """Tests for fan_out()."""
+
+    async def test_returns_results_in_order(self):
+        async def echo(value, delay):
+            await asyncio.sleep(delay)
+            return value
+
+        results = await fan_out("test", [echo(1, 0.02), echo(2, 0.0), echo(3, 0.01)])
+        assert results == [1, 2, 3]
+
+    async def test_runs_concurrently_within_limit(self):
+        in_flight = 0
+        peak = 0
+
+        async def send():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await fan_out("test", [send() for _ in range(10)], limit=3)
+        assert peak == 3
+
+    async def test_failure_does_not_cancel_others(self):
+        async def fail():
+            raise RuntimeError("channel gone")
+
+        async def ok():
+            await asyncio.sleep(0.01)
+            return "sent"
+
+        results = await fan_out("test", [fail(), ok()])
+        assert isinstance(results[0], RuntimeError)
+        assert results[1] == "sent"
+
+    async def test_empty(self):
+        assert await fan_out("test", []) == []
+
+    async def test_logs_latency(self, caplog):
+        async def send():
+            return None
+
+        with caplog.at_level(
+            logging.INFO, logger="discord_against_humanity.utils.fanout"
+        ):
+            await fan_out("hands", [send(), send()])
+        assert "Fan-out hands: 2 calls in" in caplog.text
+
+    async def test_fan_outs_share_process_limit(self):
+        in_flight = 0
+        peak = 0
+
+        async def send():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        with (
+            patch.object(fanout, "PROCESS_LIMIT", 4),
+            patch.dict(fanout._limiters, clear=True),
+        ):
+            await asyncio.gather(
+                fan_out("a", [send() for _ in range(10)]),
+                fan_out("b", [send() for _ in range(10)]),
+            )
+        assert peak == 4
+
+    async def test_records_latencies_per_label(self):
+        async def send():
+            await asyncio.sleep(0.01)
+
+        with record_latencies() as latencies:
+            await fan_out("question", [send()])
+            await fan_out("hands", [send()])
+            await fan_out("hands", [send()])
+        await fan_out("proposals", [send()])
+        assert set(latencies) == {"question", "hands"}
+        assert latencies["hands"] >= 20
@@ -1,12 +1,21 @@
 """Tests for Game."""
 
+import asyncio
+import logging
+from time import time
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import discord
 import pytest
 
 from discord_against_humanity.domain.game import Game
-from discord_against_humanity.ports.repository import Repository
+from discord_against_humanity.domain.phase import Phase
+from discord_against_humanity.ports.repository import (
+    DocumentNotFoundError,
+    Repository,
+)
+from discord_against_humanity.utils.metrics import PHASE_SECONDS
 
 
 @pytest.fixture
@@ -14,11 +23,21 @@ def mock_repo():
     """Create a mock Repository for game tests."""
     repo = MagicMock(spec=Repository)
     repo.find_by_id = AsyncMock(return_value=None)
+    repo.find_many = AsyncMock(return_value=[])
+    repo.find_all = AsyncMock(return_value=[])
     repo.find_one = AsyncMock(return_value=None)
     repo.insert = AsyncMock(return_value=str(uuid4()))
     repo.replace = AsyncMock(return_value={})
+    repo.replace_many = AsyncMock(return_value=[])
+    repo.update_fields = AsyncMock()
+    repo.increment = AsyncMock(return_value=1)
     repo.delete_by_id = AsyncMock()
+    repo.delete_many = AsyncMock()
     repo.random_member = AsyncMock(return_value=None)
+    repo.create_pile = AsyncMock(return_value=0)
+    repo.draw_from_pile = AsyncMock(return_value=[])
+    repo.discard_to_pile = AsyncMock()
+    repo.delete_pile = AsyncMock()
     repo.count = AsyncMock(return_value=0)
     return repo
 
@@ -120,18 +139,33 @@ class TestGameProperties:
     def test_voting_default(self, game):
         assert game.voting == "nobody"
 
-    def test_voting_setter_valid(self, game):
-        for val in ("players", "tsar", "nobody"):
-            game.voting = val
-            assert game.voting == val
-
-    def test_voting_setter_rejects_wrong_type(self, game):
-        with pytest.raises(TypeError):
-            game.voting = 123
-
-    def test_voting_setter_rejects_invalid_value(self, game):
-        with pytest.raises(ValueError, match="Wrong value for voting"):
-            game.voting = "invalid"
+    def test_voting_follows_phase(self, game):
+        expected = {
+            Phase.IDLE: "nobody",
+            Phase.DEALING: "nobody",
+            Phase.PLAYERS_VOTING: "players",
+            Phase.TSAR_VOTING: "tsar",
+            Phase.SCORING: "nobody",
+        }
+        for phase, voting in expected.items():
+            game._document["phase"] = phase
+            assert game.voting == voting
+
+    def test_voting_is_read_only(self, game):
+        with pytest.raises(AttributeError):
+            game.voting = "players"
+
+    def test_phase_default(self, game):
+        assert game.phase is Phase.IDLE
+        assert game.phase_since is None
+        assert game.deadline is None
+
+    def test_phase_read_from_legacy_voting(self, game):
+        del game._document["phase"]
+        game._document["voting"] = "tsar"
+        assert game.phase is Phase.TSAR_VOTING
+        game._document["voting"] = "nobody"
+        assert game.phase is Phase.IDLE
 
     def test_players_id_default(self, game):
         assert game.players_id == []
@@ -193,6 +227,28 @@ class TestGameCreate:
         assert game.playing is True
         assert game.voting == "players"
 
+    async def test_create_reuses_identity_map(
+        self, mock_bot, mock_repo_factory, mock_guild
+    ):
+        identity_map = {}
+        first = await Game.create(
+            mock_bot, mock_repo_factory, mock_guild, identity_map=identity_map
+        )
+        second = await Game.create(
+            mock_bot, mock_repo_factory, mock_guild, identity_map=identity_map
+        )
+        assert second is first
+        assert identity_map == {("games", mock_guild.id): first}
+        mock_repo_factory._repo.find_one.assert_awaited_once()
+
+    async def test_create_without_identity_map_always_loads(
+        self, mock_bot, mock_repo_factory, mock_guild
+    ):
+        first = await Game.create(mock_bot, mock_repo_factory, mock_guild)
+        second = await Game.create(mock_bot, mock_repo_factory, mock_guild)
+        assert second is not first
+        assert mock_repo_factory._repo.find_one.await_count == 2
+
 
 class TestGameMethods:
     """Tests for Game methods."""
@@ -224,6 +280,46 @@ class TestGameMethods:
 
         assert player.document_id in game._document["players"]
 
+    async def test_join_type_check(self, game):
+        with pytest.raises(TypeError, match="Wrong type for player"):
+            await game.join("not a player")
+
+    async def test_join_writes_new_player_with_game(
+        self, game, mock_bot, mock_repo, mock_repo_factory
+    ):
+        from discord_against_humanity.domain.player import Player
+
+        player = Player(repository=mock_repo, repo_factory=mock_repo_factory)
+        player._bot = mock_bot
+        player._set_default_values()
+        mock_repo.insert = AsyncMock(side_effect=lambda doc: doc["_id"])
+        game._document["_id"] = str(uuid4())
+        game._repo.replace = AsyncMock(side_effect=lambda _id, doc: doc)
+
+        await game.join(player)
+
+        assert player.document_id
+        assert game.players_id == [player.document_id]
+        mock_repo.insert.assert_awaited_once()
+        game._repo.replace.assert_awaited_once()
+
+    async def test_join_saves_known_player(
+        self, game, mock_bot, mock_repo, mock_repo_factory
+    ):
+        from discord_against_humanity.domain.player import Player
+
+        player = Player(repository=mock_repo, repo_factory=mock_repo_factory)
+        player._bot = mock_bot
+        player._set_default_values()
+        player._document["_id"] = str(uuid4())
+        mock_repo.replace = AsyncMock(side_effect=lambda _id, doc: doc)
+        game._document["_id"] = str(uuid4())
+
+        await game.join(player)
+
+        assert game.players_id == [player.document_id]
+        mock_repo.insert.assert_not_awaited()
+
     async def test_delete_player(
         self, game, mock_bot, mock_repo, mock_repo_factory
     ):
@@ -255,7 +351,7 @@ class TestGameMethods:
         game._document["players"] = [tsar_id, player1_id, player2_id]
         game._document["tsar"] = tsar_id
 
-        # Patch Player.create to return mock players
+        # Patch Player.create_many to return mock players
         async def fake_create(bot, factory, doc_id):
             from discord_against_humanity.domain.player import Player
 
@@ -270,9 +366,12 @@ class TestGameMethods:
             # player2 has no answers (empty list)
             return p
 
+        async def fake_create_many(bot, factory, doc_ids):
+            return [await fake_create(bot, factory, i) for i in doc_ids]
+
         with patch(
-            "discord_against_humanity.domain.game.Player.create",
-            side_effect=fake_create,
+            "discord_against_humanity.domain.game.Player.create_many",
+            side_effect=fake_create_many,
         ):
             count = await game.get_players_answers()
             assert count == 1
@@ -297,9 +396,12 @@ class TestGameMethods:
                 p._document["score"] = 1
             return p
 
+        async def fake_create_many(bot, factory, doc_ids):
+            return [await fake_create(bot, factory, i) for i in doc_ids]
+
         with patch(
-            "discord_against_humanity.domain.game.Player.create",
-            side_effect=fake_create,
+            "discord_against_humanity.domain.game.Player.create_many",
+            side_effect=fake_create_many,
         ):
             scores = await game.get_players_score()
             assert len(scores) == 2
@@ -324,9 +426,12 @@ class TestGameMethods:
             p._document["score"] = 2
             return p
 
+        async def fake_create_many(bot, factory, doc_ids):
+            return [await fake_create(bot, factory, i) for i in doc_ids]
+
         with patch(
-            "discord_against_humanity.domain.game.Player.create",
-            side_effect=fake_create,
+            "discord_against_humanity.domain.game.Player.create_many",
+            side_effect=fake_create_many,
         ):
             result = await game.is_points_max()
             assert result is False
@@ -348,9 +453,12 @@ class TestGameMethods:
             p._document["score"] = 5
             return p
 
+        async def fake_create_many(bot, factory, doc_ids):
+            return [await fake_create(bot, factory, i) for i in doc_ids]
+
         with patch(
-            "discord_against_humanity.domain.game.Player.create",
-            side_effect=fake_create,
+            "discord_against_humanity.domain.game.Player.create_many",
+            side_effect=fake_create_many,
         ):
             result = await game.is_points_max()
             assert result is True
@@ -420,6 +528,485 @@ class TestGameMethods:
             assert result is False
 
 
+class TestGameDecks:
+    """Tests for the per-game draw piles."""
+
+    async def test_build_decks(self, game, mock_repo_factory):
+        game._document["_id"] = "game-id"
+        await game.build_decks()
+        repo = mock_repo_factory._repo
+        assert repo.create_pile.await_count == 2
+        repo.create_pile.assert_awaited_with("game-id")
+
+    async def test_draw_black_card_raises_when_exhausted(self, game):
+        game._document["_id"] = "game-id"
+        with pytest.raises(RuntimeError, match="deck is exhausted"):
+            await game.draw_black_card()
+
+    async def test_draw_black_card_discards_previous(
+        self, game, mock_repo_factory
+    ):
+        game._document["_id"] = "game-id"
+        game._document["black_cards"] = ["old"]
+        repo = mock_repo_factory._repo
+        repo.draw_from_pile = AsyncMock(return_value=["new"])
+        repo.find_by_id = AsyncMock(
+            return_value={"_id": "new", "text": "Why _?", "pick": 1}
+        )
+        game._repo.replace = AsyncMock(side_effect=lambda _id, doc: dict(doc))
+        await game.draw_black_card()
+        repo.discard_to_pile.assert_awaited_once_with("game-id", ["old"])
+        assert game.black_cards_id == ["new"]
+
+    async def test_delete_removes_piles(self, game, mock_repo_factory):
+        game._document["_id"] = "game-id"
+        await game.delete()
+        repo = mock_repo_factory._repo
+        assert repo.delete_pile.await_count == 2
+        game._repo.delete_by_id.assert_awaited_once_with("game-id")
+
+
+class TestGameRoundWaits:
+    """Tests for the notification-driven round waits."""
+
+    @pytest.fixture
+    def running_game(self, game, mock_guild, mock_text_channel):
+        tsar_id = str(uuid4())
+        game._document["_id"] = str(uuid4())
+        game._document["guild"] = mock_guild.id
+        game._document["players"] = [tsar_id, str(uuid4())]
+        game._document["tsar"] = tsar_id
+        game._document["playing"] = True
+        game._bot.get_guild.return_value = mock_guild
+        mock_guild.get_channel.return_value = mock_text_channel
+        game._repo.replace = AsyncMock(side_effect=lambda _id, doc: dict(doc))
+        game._repo.find_by_id = AsyncMock(
+            side_effect=lambda _id: dict(game._document)
+        )
+        return game
+
+    async def test_players_wait_wakes_on_notify(self, running_game):
+        answers = AsyncMock(side_effect=[0, 1])
+        with patch.object(running_game, "get_players_answers", answers):
+            waiter = asyncio.create_task(
+                running_game.wait_for_players_answers()
+            )
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+            await running_game.notify()
+            await asyncio.wait_for(waiter, 1)
+        assert answers.await_count == 2
+        running_game._repo.replace.assert_not_awaited()
+
+    async def test_tsar_wait_exits_when_stopped(self, running_game):
+        tsar_answer = AsyncMock(return_value=False)
+        with patch.object(running_game, "get_tsar_answer", tsar_answer):
+            waiter = asyncio.create_task(running_game.wait_for_tsar_answer())
+            await asyncio.sleep(0.01)
+            running_game._document["playing"] = False
+            await running_game.notify()
+            await asyncio.wait_for(waiter, 1)
+        assert tsar_answer.await_count == 1
+
+    async def test_players_wait_wakes_at_deadline(self, running_game):
+        running_game._document["deadline"] = time() + 0.02
+        answers = AsyncMock(return_value=0)
+        auto_play = AsyncMock()
+        with (
+            patch.object(running_game, "get_players_answers", answers),
+            patch.object(running_game, "_auto_play", auto_play),
+        ):
+            await asyncio.wait_for(
+                running_game.wait_for_players_answers(), 1
+            )
+        auto_play.assert_awaited_once()
+        assert running_game._bot.scheduler.pending == 0
+
+    async def test_tsar_wait_chooses_at_deadline(self, running_game):
+        running_game._document["deadline"] = time() - 1
+        auto_choose = AsyncMock()
+        with (
+            patch.object(
+                running_game, "get_tsar_answer", AsyncMock(return_value=False)
+            ),
+            patch.object(running_game, "_auto_choose", auto_choose),
+        ):
+            await running_game.wait_for_tsar_answer()
+        auto_choose.assert_awaited_once()
+
+    async def test_answer_before_deadline_cancels_timer(self, running_game):
+        running_game._document["deadline"] = time() + 60
+        answers = AsyncMock(side_effect=[0, 1])
+        with patch.object(running_game, "get_players_answers", answers):
+            waiter = asyncio.create_task(
+                running_game.wait_for_players_answers()
+            )
+            await asyncio.sleep(0.01)
+            assert running_game._bot.scheduler.pending == 1
+            await running_game.notify()
+            await asyncio.wait_for(waiter, 1)
+        assert running_game._bot.scheduler.pending == 0
+
+    async def test_auto_play_fills_missing_answers(self, running_game):
+        tsar_id = running_game.tsar_id
+        absent, voted = MagicMock(), MagicMock()
+        absent.document_id, voted.document_id = str(uuid4()), str(uuid4())
+        absent.answers_id, voted.answers_id = [], [str(uuid4())]
+        absent.white_cards_id = [str(uuid4()) for _ in range(7)]
+        absent.add_answers = AsyncMock()
+        absent.user.mention = "<@1>"
+        voted.add_answers = AsyncMock()
+        tsar = MagicMock(document_id=tsar_id)
+        black_card = MagicMock(pick=2)
+        with (
+            patch.object(
+                running_game,
+                "get_players",
+                AsyncMock(return_value=[tsar, absent, voted]),
+            ),
+            patch.object(
+                running_game,
+                "get_black_card",
+                AsyncMock(return_value=black_card),
+            ),
+        ):
+            await running_game._auto_play()
+        (picked,), _ = absent.add_answers.await_args
+        assert len(picked) == 2
+        assert all(1 <= index <= 7 for index in picked)
+        voted.add_answers.assert_not_awaited()
+        assert "<@1>" in running_game.board.send.await_args.args[0]
+
+    async def test_auto_play_skips_members_who_left(self, running_game):
+        gone = MagicMock(document_id=str(uuid4()), answers_id=[], user=None)
+        gone.white_cards_id = [str(uuid4()) for _ in range(7)]
+        gone.add_answers = AsyncMock()
+        with (
+            patch.object(
+                running_game, "get_players", AsyncMock(return_value=[gone])
+            ),
+            patch.object(
+                running_game,
+                "get_black_card",
+                AsyncMock(return_value=MagicMock(pick=1)),
+            ),
+        ):
+            await running_game._auto_play()
+        gone.add_answers.assert_not_awaited()
+        running_game.board.send.assert_not_awaited()
+
+    def test_is_proposal_counts_results_not_players(self, game):
+        game._document["players"] = [str(uuid4()) for _ in range(5)]
+        game._document["results"] = [["a", "x"], ["b", "y"]]
+        assert game.is_proposal(1)
+        assert game.is_proposal(2)
+        assert not game.is_proposal(3)
+        assert not game.is_proposal(0)
+
+    async def test_auto_choose_picks_a_proposal(self, running_game):
+        running_game._document["results"] = [["a", "x"], ["b", "y"]]
+        tsar = MagicMock()
+        tsar.save = AsyncMock()
+        with patch.object(
+            running_game, "get_tsar", AsyncMock(return_value=tsar)
+        ):
+            await running_game._auto_choose()
+        assert tsar.tsar_choice in (1, 2)
+        tsar.save.assert_awaited_once()
+
+    async def test_notify_without_id_is_noop(self, game):
+        await game.notify()
+        assert game._bot.notifier._events == {}
+
+
+class TestGamePlay:
+    """Tests for the round loop and its resumption by phase."""
+
+    _STEPS = (
+        "draw_black_card",
+        "wait_for_players_answers",
+        "send_answers",
+        "wait_for_tsar_answer",
+        "select_winner",
+    )
+
+    @pytest.fixture
+    def round_game(self, game, mock_guild, mock_text_channel):
+        game._document["_id"] = str(uuid4())
+        game._document["guild"] = mock_guild.id
+        game._document["playing"] = True
+        game._document["results"] = [[str(uuid4()), "Proposal"]]
+        game._bot.get_guild.return_value = mock_guild
+        mock_guild.get_channel.return_value = mock_text_channel
+        game._repo.replace = AsyncMock(side_effect=lambda _id, doc: dict(doc))
+        tsar = MagicMock()
+        tsar.channel = None
+        game.get_tsar = AsyncMock(return_value=tsar)
+        game.get_players = AsyncMock(return_value=[])
+        for name in ("deal_round", "score", *self._STEPS):
+            setattr(game, name, AsyncMock())
+        return game
+
+    def _called(self, game):
+        return [
+            name for name in self._STEPS if getattr(game, name).await_count
+        ]
+
+    async def test_fresh_round_runs_every_step(self, round_game):
+        await round_game.play_round()
+        assert self._called(round_game) == list(self._STEPS)
+
+    async def test_resumes_players_vote(self, round_game):
+        round_game._document["phase"] = Phase.PLAYERS_VOTING
+        await round_game.play_round()
+        assert "draw_black_card" not in self._called(round_game)
+        round_game.wait_for_players_answers.assert_awaited_once()
+
+    async def test_resumes_tsar_vote(self, round_game):
+        round_game._document["phase"] = Phase.TSAR_VOTING
+        await round_game.play_round()
+        assert self._called(round_game) == [
+            "wait_for_tsar_answer",
+            "select_winner",
+        ]
+
+    async def test_fresh_round_walks_every_phase(self, round_game):
+        seen = []
+        transition = round_game.transition
+
+        async def record(phase, timeout=None):
+            await transition(phase, timeout)
+            seen.append(round_game._stored["phase"])
+
+        round_game.transition = record
+        await round_game.play_round()
+        assert seen == [
+            Phase.DEALING,
+            Phase.PLAYERS_VOTING,
+            Phase.TSAR_VOTING,
+            Phase.SCORING,
+            Phase.IDLE,
+        ]
+
+    async def test_resumed_scoring_scores_the_round(self, round_game):
+        round_game._document["phase"] = Phase.SCORING
+        await round_game.play_round()
+        assert self._called(round_game) == ["select_winner"]
+        round_game.score.assert_awaited_once()
+        assert round_game.phase is Phase.IDLE
+
+    async def test_voting_phases_get_configured_deadlines(self, round_game):
+        round_game._bot.round_timeouts = {
+            Phase.PLAYERS_VOTING: 60,
+            Phase.TSAR_VOTING: 30,
+        }
+        deadlines = {}
+        transition = round_game.transition
+
+        async def record(phase, timeout=None):
+            await transition(phase, timeout)
+            deadlines[phase] = timeout
+
+        round_game.transition = record
+        await round_game.play_round()
+        assert deadlines[Phase.PLAYERS_VOTING] == 60
+        assert deadlines[Phase.TSAR_VOTING] == 30
+        assert deadlines[Phase.SCORING] is None
+
+    async def test_question_fans_out_to_every_channel(self, round_game):
+        players = [MagicMock() for _ in range(3)]
+        for player in players:
+            player.channel.send = AsyncMock()
+        players[1].channel.send.side_effect = RuntimeError("gone")
+        round_game.get_players.return_value = players
+        question = round_game.draw_black_card.return_value
+        await round_game.play_round()
+        for player in players:
+            player.channel.send.assert_awaited_once_with(embed=question)
+        round_game.board.send.assert_any_await(embed=question)
+        round_game.deal_round.assert_awaited_once_with(players)
+
+    async def test_logs_fan_out_latency_per_round(self, round_game, caplog):
+        with caplog.at_level(
+            logging.INFO, logger="discord_against_humanity.domain.game"
+        ):
+            await round_game.play_round()
+        assert (
+            f"Round of game {round_game.document_id}: fan-out latency "
+            "question" in caplog.text
+        )
+        assert "proposals" in caplog.text
+
+    async def test_round_without_answers_is_skipped(self, round_game):
+        round_game._document["results"] = []
+        await round_game.play_round()
+        round_game.wait_for_tsar_answer.assert_not_awaited()
+        assert round_game.phase is Phase.IDLE
+
+    async def test_stop_during_players_vote_ends_round(self, round_game):
+        async def stop():
+            round_game._document["playing"] = False
+
+        round_game.wait_for_players_answers.side_effect = stop
+        await round_game.play_round()
+        round_game.send_answers.assert_not_awaited()
+        round_game.select_winner.assert_not_awaited()
+
+    async def test_play_loops_until_points_max(self, round_game):
+        round_game._repo.find_by_id = AsyncMock(
+            side_effect=lambda _id: dict(round_game._document)
+        )
+        with (
+            patch.object(round_game, "play_round", AsyncMock()) as play_round,
+            patch.object(
+                round_game,
+                "is_points_max",
+                AsyncMock(side_effect=[False, False, True]),
+            ),
+        ):
+            await round_game.play()
+        assert play_round.await_count == 2
+
+    async def test_play_restores_missing_decks_first(self, round_game):
+        round_game._repo.find_by_id = AsyncMock(
+            side_effect=lambda _id: dict(round_game._document)
+        )
+        round_game._document["playing"] = False
+        with patch.object(
+            round_game, "restore_decks", AsyncMock()
+        ) as restore_decks:
+            await round_game.play()
+        restore_decks.assert_awaited_once()
+
+    async def test_teardown_pools_channels(
+        self, round_game, mock_text_channel
+    ):
+        player = MagicMock()
+        player.document_id = str(uuid4())
+        player.channel = mock_text_channel
+        mock_text_channel.edit = AsyncMock()
+        mock_text_channel.purge = AsyncMock()
+        mock_text_channel.delete = AsyncMock()
+        round_game._document["players"] = [player.document_id]
+        round_game.get_players.return_value = [player]
+        await round_game.teardown()
+        assert round_game.closing
+        assert not round_game.playing
+        repo = round_game._repo_factory._repo
+        repo.delete_many.assert_awaited_once_with([player.document_id])
+        assert mock_text_channel.edit.await_count == 2
+        assert mock_text_channel.purge.await_count == 2
+        mock_text_channel.delete.assert_not_awaited()
+        channel_id = [str(mock_text_channel.id)]
+        repo.discard_to_pile.assert_any_await(
+            f"{round_game._document['guild']}:boards", channel_id
+        )
+        repo.discard_to_pile.assert_any_await(
+            f"{round_game._document['guild']}:players", channel_id
+        )
+        round_game._repo.delete_by_id.assert_awaited_once_with(
+            round_game.document_id
+        )
+
+    async def test_teardown_keeps_game_on_partial_failure(
+        self, round_game, mock_text_channel
+    ):
+        gone, stuck = MagicMock(), MagicMock()
+        gone.document_id, stuck.document_id = str(uuid4()), str(uuid4())
+        gone.channel = MagicMock(edit=AsyncMock(), purge=AsyncMock())
+        stuck.channel = MagicMock(
+            edit=AsyncMock(side_effect=discord.HTTPException(MagicMock(), ""))
+        )
+        mock_text_channel.edit = AsyncMock()
+        mock_text_channel.purge = AsyncMock()
+        round_game._document["players"] = [gone.document_id, stuck.document_id]
+        round_game.get_players.return_value = [gone, stuck]
+        with pytest.raises(RuntimeError, match="Could not release"):
+            await round_game.teardown()
+        round_game._repo_factory._repo.delete_many.assert_awaited_once_with(
+            [gone.document_id]
+        )
+        assert round_game.players_id == [stuck.document_id]
+        assert round_game.closing
+        round_game._repo.delete_by_id.assert_not_awaited()
+
+    async def test_teardown_resumes_without_saving_again(
+        self, round_game, mock_text_channel
+    ):
+        round_game._document["closing"] = True
+        round_game._document["playing"] = False
+        mock_text_channel.edit = AsyncMock(
+            side_effect=discord.NotFound(MagicMock(), "")
+        )
+        await round_game.teardown()
+        round_game._repo.replace.assert_not_awaited()
+        round_game._repo.delete_by_id.assert_awaited_once()
+
+    async def test_teardown_of_deleted_game_stops(self, round_game):
+        round_game._repo.replace = AsyncMock(
+            side_effect=DocumentNotFoundError("gone")
+        )
+        await round_game.teardown()
+        round_game.get_players.assert_not_awaited()
+
+
+class TestGameTransition:
+    """Tests for the persisted round state machine."""
+
+    async def test_transition_persists_in_one_write(self, game):
+        game._document["_id"] = str(uuid4())
+        game._document["voting"] = "nobody"
+        game._repo.replace = AsyncMock(side_effect=lambda _id, doc: dict(doc))
+        await game.transition(Phase.DEALING)
+        game._repo.replace.assert_awaited_once()
+        assert game.phase is Phase.DEALING
+        assert game.phase_since is not None
+        assert game.deadline is None
+        assert "voting" not in game._document
+
+    async def test_transition_sets_deadline(self, game):
+        game._document["_id"] = str(uuid4())
+        game._repo.replace = AsyncMock(side_effect=lambda _id, doc: dict(doc))
+        await game.transition(Phase.DEALING, timeout=30)
+        assert game.deadline == pytest.approx(game.phase_since + 30)
+
+    async def test_transition_observes_time_in_previous_phase(
+        self, game, monkeypatch
+    ):
+        observe = MagicMock()
+        monkeypatch.setattr(PHASE_SECONDS, "observe", observe)
+        game._document["_id"] = str(uuid4())
+        game._document["phase"] = Phase.PLAYERS_VOTING
+        game._document["phase_since"] = time() - 10
+        game._repo.replace = AsyncMock(side_effect=lambda _id, doc: dict(doc))
+        await game.transition(Phase.TSAR_VOTING)
+        observe.assert_called_once()
+        assert observe.call_args.args[0] == pytest.approx(10, abs=1)
+        assert observe.call_args.kwargs == {"phase": Phase.PLAYERS_VOTING}
+
+    async def test_transition_rejects_skipping_phases(self, game):
+        with pytest.raises(ValueError, match="Cannot move"):
+            await game.transition(Phase.TSAR_VOTING)
+        game._repo.replace.assert_not_awaited()
+
+    @pytest.mark.parametrize("phase", list(Phase))
+    def test_any_phase_can_go_idle(self, phase):
+        assert phase.can_become(Phase.IDLE)
+
+    def test_round_cycle(self):
+        cycle = [
+            Phase.DEALING,
+            Phase.PLAYERS_VOTING,
+            Phase.TSAR_VOTING,
+            Phase.SCORING,
+            Phase.DEALING,
+        ]
+        assert Phase.IDLE.can_become(Phase.DEALING)
+        for current, following in zip(cycle, cycle[1:]):
+            assert current.can_become(following)
+            assert not following.can_become(current)
+
+
 class TestGameDefaultValues:
     """Tests for _set_default_values()."""
 
@@ -432,6 +1019,8 @@ class TestGameDefaultValues:
         assert game._document["white_cards"] == []
         assert game._document["points"] == 5
         assert game._document["playing"] is False
-        assert game._document["voting"] == "nobody"
+        assert game._document["phase"] == "idle"
+        assert game._document["phase_since"] is None
+        assert game._document["deadline"] is None
         assert game._document["results"] == []
         assert game._document["tsar"] == 0
@@ -1,68 +1,16 @@
 """Comprehensive game simulation — 5 players, 6 rounds."""
 
-import random
-from typing import Any
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
+from discord_against_humanity.domain.cards import CardCatalog
 from discord_against_humanity.domain.game import Game
+from discord_against_humanity.domain.phase import Phase
 from discord_against_humanity.domain.player import Player
-from discord_against_humanity.ports.repository import DocumentNotFoundError
-
-# ── In-memory repository ─────────────────────────────────────────────────────
-
-
-class InMemoryRepository:
-    """Dict-backed Repository for deterministic testing."""
-
-    def __init__(self) -> None:
-        self._store: dict[str, dict[str, Any]] = {}
-
-    async def find_by_id(self, document_id: str) -> dict[str, Any] | None:
-        doc = self._store.get(document_id)
-        return dict(doc) if doc is not None else None
-
-    async def find_one(self, query: dict[str, Any]) -> dict[str, Any] | None:
-        for doc in self._store.values():
-            if all(doc.get(k) == v for k, v in query.items()):
-                return dict(doc)
-        return None
-
-    async def insert(self, document: dict[str, Any]) -> str:
-        if "_id" not in document or not document["_id"]:
-            document["_id"] = str(uuid4())
-        doc_id = document["_id"]
-        self._store[doc_id] = dict(document)
-        return doc_id
-
-    async def replace(
-        self, document_id: str, document: dict[str, Any]
-    ) -> dict[str, Any]:
-        if document_id not in self._store:
-            raise DocumentNotFoundError(document_id)
-        document["_id"] = document_id
-        self._store[document_id] = dict(document)
-        return dict(document)
-
-    async def delete_by_id(self, document_id: str) -> None:
-        self._store.pop(document_id, None)
-
-    async def random_member(self) -> dict[str, Any] | None:
-        if not self._store:
-            return None
-        doc_id = random.choice(list(self._store.keys()))
-        return dict(self._store[doc_id])
-
-    async def count(self) -> int:
-        return len(self._store)
-
-    # helpers for test setup
-    def seed(self, doc: dict[str, Any]) -> str:
-        """Insert a document directly (sync) and return its ID."""
-        doc_id = doc["_id"]
-        self._store[doc_id] = dict(doc)
-        return doc_id
-
+from discord_against_humanity.ports.local import LocalNotifier, LocalScheduler
+from discord_against_humanity.ports.memory import MemoryRepository, MemoryStore
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
@@ -72,35 +20,29 @@ GUILD_ID = 123456789
 BOARD_CHANNEL_ID = 9999
 
 
-def _make_repos() -> dict[str, InMemoryRepository]:
+def _make_repos() -> dict[str, MemoryRepository]:
+    store = MemoryStore()
     return {
-        "games": InMemoryRepository(),
-        "players": InMemoryRepository(),
-        "black_cards": InMemoryRepository(),
-        "white_cards": InMemoryRepository(),
+        name: store.repository(name)
+        for name in ("games", "players", "black_cards", "white_cards")
     }
 
 
-def _seed_black_cards(repo: InMemoryRepository, n: int = 10) -> list[str]:
+def _seed_black_cards(repo: MemoryRepository, n: int = 10) -> list[str]:
     """Pre-populate the black-cards collection and return their IDs."""
-    ids: list[str] = []
-    for i in range(n):
-        card_id = f"bc-{i}"
-        repo.seed(
-            {"_id": card_id, "text": f"Why is _ question {i}?", "pick": 1}
-        )
-        ids.append(card_id)
-    return ids
+    documents = {
+        f"bc-{i}": {"text": f"Why is _ question {i}?", "pick": 1}
+        for i in range(n)
+    }
+    repo.load({"documents": documents})
+    return list(documents)
 
 
-def _seed_white_cards(repo: InMemoryRepository, n: int = 60) -> list[str]:
+def _seed_white_cards(repo: MemoryRepository, n: int = 60) -> list[str]:
     """Pre-populate the white-cards collection and return their IDs."""
-    ids: list[str] = []
-    for i in range(n):
-        card_id = f"wc-{i}"
-        repo.seed({"_id": card_id, "text": f"Answer {i}"})
-        ids.append(card_id)
-    return ids
+    documents = {f"wc-{i}": {"text": f"Answer {i}"} for i in range(n)}
+    repo.load({"documents": documents})
+    return list(documents)
 
 
 def _build_mock_bot() -> MagicMock:
@@ -136,6 +78,9 @@ def _build_mock_bot() -> MagicMock:
 
     bot = MagicMock()
     bot.get_guild = MagicMock(return_value=mock_guild)
+    bot.catalog = None
+    bot.scheduler = LocalScheduler()
+    bot.round_timeouts = {}
     return bot
 
 
@@ -150,7 +95,7 @@ async def test_full_game_simulation():
     _seed_white_cards(repos["white_cards"], n=60)
     bot = _build_mock_bot()
 
-    def repo_factory(collection: str) -> InMemoryRepository:
+    def repo_factory(collection: str) -> MemoryRepository:
         return repos[collection]
 
     # Create and persist player documents
@@ -176,6 +121,7 @@ async def test_full_game_simulation():
     game._document["players"] = list(player_ids)
     game._document["playing"] = True
     await game.save()
+    await game.build_decks()
 
     drawn_black_cards: list[str] = []
 
@@ -200,7 +146,7 @@ async def test_full_game_simulation():
             if pid == tsar_id:
                 continue
             player = await Player.create(bot, repo_factory, pid)
-            await player.draw_white_cards(game.white_cards_id or [])
+            await player.draw_white_cards(game.document_id)
             assert len(player.white_cards_id) == 7
 
             # Submit the first card as the answer (pick = 1)
@@ -255,7 +201,7 @@ async def test_scores_accumulate_per_winner():
     _seed_white_cards(repos["white_cards"], n=60)
     bot = _build_mock_bot()
 
-    def repo_factory(collection: str) -> InMemoryRepository:
+    def repo_factory(collection: str) -> MemoryRepository:
         return repos[collection]
 
     # Create players
@@ -279,6 +225,7 @@ async def test_scores_accumulate_per_winner():
     game._document["players"] = list(player_ids)
     game._document["playing"] = True
     await game.save()
+    await game.build_decks()
 
     # Force player 0 as tsar so player at results[0] wins consistently
     game._document["tsar"] = player_ids[0]
@@ -290,7 +237,7 @@ async def test_scores_accumulate_per_winner():
         if pid == player_ids[0]:
             continue
         player = await Player.create(bot, repo_factory, pid)
-        await player.draw_white_cards(game.white_cards_id or [])
+        await player.draw_white_cards(game.document_id)
         await player.add_answers([1])
 
     await game.send_answers()
@@ -316,7 +263,7 @@ async def test_black_cards_unique_across_rounds():
     _seed_white_cards(repos["white_cards"], n=60)
     bot = _build_mock_bot()
 
-    def repo_factory(collection: str) -> InMemoryRepository:
+    def repo_factory(collection: str) -> MemoryRepository:
         return repos[collection]
 
     player_ids: list[str] = []
@@ -338,15 +285,18 @@ async def test_black_cards_unique_across_rounds():
     game._document["players"] = list(player_ids)
     game._document["playing"] = True
     await game.save()
+    await game.build_decks()
 
+    bc_ids: list[str] = []
     for _ in range(NUM_ROUNDS):
         game._document["tsar"] = player_ids[0]
         await game.save()
         await game.draw_black_card()
+        bc_ids.append(game.black_cards_id[-1])
 
         for pid in player_ids[1:]:
             player = await Player.create(bot, repo_factory, pid)
-            await player.draw_white_cards(game.white_cards_id or [])
+            await player.draw_white_cards(game.document_id)
             await player.add_answers([1])
 
         await game.send_answers()
@@ -356,7 +306,6 @@ async def test_black_cards_unique_across_rounds():
         await game.select_winner()
 
     # All drawn black cards should be unique
-    bc_ids = game.black_cards_id
     assert len(bc_ids) == NUM_ROUNDS
     assert len(set(bc_ids)) == NUM_ROUNDS
 
@@ -368,7 +317,7 @@ async def test_hand_management_draw_play_redraw():
     _seed_white_cards(repos["white_cards"], n=60)
     bot = _build_mock_bot()
 
-    def repo_factory(collection: str) -> InMemoryRepository:
+    def repo_factory(collection: str) -> MemoryRepository:
         return repos[collection]
 
     p = Player(repository=repo_factory("players"), repo_factory=repo_factory)
@@ -379,8 +328,10 @@ async def test_hand_management_draw_play_redraw():
     p._document["channel"] = 2000
     await p.save()
 
+    await repos["white_cards"].create_pile("deck")
+
     # First draw — hand goes from 0 → 7
-    await p.draw_white_cards([])
+    await p.draw_white_cards("deck")
     assert len(p.white_cards_id) == 7
 
     # Play two cards (indices 1 and 2, 1-based)
@@ -394,5 +345,442 @@ async def test_hand_management_draw_play_redraw():
 
     # Clear answers and redraw
     await p.delete_answers()
-    await p.draw_white_cards([])
+    await p.draw_white_cards("deck")
     assert len(p.white_cards_id) == 7
+
+
+async def test_hands_never_share_cards():
+    """Cards dealt from the pile are unique across all hands in play."""
+    repos = _make_repos()
+    _seed_white_cards(repos["white_cards"], n=40)
+    bot = _build_mock_bot()
+
+    def repo_factory(collection: str) -> MemoryRepository:
+        return repos[collection]
+
+    await repos["white_cards"].create_pile("deck")
+    hands: list[str] = []
+    for i in range(NUM_PLAYERS):
+        p = Player(repository=repo_factory("players"), repo_factory=repo_factory)
+        p._bot = bot
+        p._set_default_values()
+        p._document["guild"] = GUILD_ID
+        p._document["user"] = 1000 + i
+        p._document["channel"] = 2000 + i
+        await p.save()
+        await p.draw_white_cards("deck")
+        hands.extend(p.white_cards_id)
+
+    assert len(hands) == NUM_PLAYERS * 7
+    assert len(set(hands)) == len(hands)
+
+
+async def test_black_deck_reshuffles_discards():
+    """Once the black deck runs out, discarded questions come back."""
+    repos = _make_repos()
+    _seed_black_cards(repos["black_cards"], n=2)
+    bot = _build_mock_bot()
+
+    def repo_factory(collection: str) -> MemoryRepository:
+        return repos[collection]
+
+    game = Game(repository=repo_factory("games"), repo_factory=repo_factory)
+    game._bot = bot
+    game._set_default_values()
+    game._document["guild"] = GUILD_ID
+    game._document["board"] = BOARD_CHANNEL_ID
+    await game.save()
+    await game.build_decks()
+
+    drawn: list[str] = []
+    for _ in range(5):
+        await game.draw_black_card()
+        drawn.append(game.black_cards_id[-1])
+
+    assert set(drawn) == {"bc-0", "bc-1"}
+    assert game.black_cards_id == drawn[-1:]
+
+
+async def test_restore_decks_of_game_started_without_piles():
+    """A game from before draw piles gets piles without its used cards."""
+    repos = _make_repos()
+    _seed_black_cards(repos["black_cards"], n=5)
+    _seed_white_cards(repos["white_cards"], n=20)
+    bot = _build_mock_bot()
+
+    def repo_factory(collection: str) -> MemoryRepository:
+        return repos[collection]
+
+    player = Player(repository=repo_factory("players"), repo_factory=repo_factory)
+    player._bot = bot
+    player._set_default_values()
+    player._document["white_cards"] = ["wc-0", "wc-1"]
+    player._document["answers"] = ["wc-2"]
+    await player.save()
+
+    game = Game(repository=repo_factory("games"), repo_factory=repo_factory)
+    game._bot = bot
+    game._set_default_values()
+    del game._document["decks"]
+    game._document["players"] = [player.document_id]
+    game._document["black_cards"] = ["bc-0", "bc-1"]
+    game._document["white_cards"] = ["wc-3"]
+    await game.save()
+
+    await game.restore_decks()
+
+    assert set(repos["black_cards"]._piles[game.document_id]) == {
+        "bc-2",
+        "bc-3",
+        "bc-4",
+    }
+    white_pile = repos["white_cards"]._piles[game.document_id]
+    assert set(white_pile) == {f"wc-{i}" for i in range(4, 20)}
+    assert game.white_cards_id == []
+
+    # Piles are only restored once.
+    repos["black_cards"].create_pile = AsyncMock()
+    await game.restore_decks()
+    repos["black_cards"].create_pile.assert_not_awaited()
+
+
+async def test_deal_round_batches_the_whole_table():
+    """deal_round fills every hand with one draw, write and read."""
+    repos = _make_repos()
+    _seed_white_cards(repos["white_cards"], n=60)
+    bot = _build_mock_bot()
+
+    def repo_factory(collection: str) -> MemoryRepository:
+        return repos[collection]
+
+    players: list[Player] = []
+    for i in range(NUM_PLAYERS):
+        p = Player(repository=repo_factory("players"), repo_factory=repo_factory)
+        p._bot = bot
+        p._set_default_values()
+        p._document["guild"] = GUILD_ID
+        p._document["user"] = 1000 + i
+        p._document["channel"] = 2000 + i
+        await p.save()
+        players.append(p)
+
+    game = Game(repository=repo_factory("games"), repo_factory=repo_factory)
+    game._bot = bot
+    game._set_default_values()
+    game._document["guild"] = GUILD_ID
+    game._document["players"] = [p.document_id for p in players]
+    await game.save()
+    await repos["white_cards"].create_pile(game.document_id)
+    players[0]._document["white_cards"] = await repos[
+        "white_cards"
+    ].draw_from_pile(game.document_id, 2)
+
+    white_repo, player_repo = repos["white_cards"], repos["players"]
+    white_repo.draw_from_pile = AsyncMock(wraps=white_repo.draw_from_pile)
+    white_repo.find_many = AsyncMock(wraps=white_repo.find_many)
+    player_repo.replace_many = AsyncMock(wraps=player_repo.replace_many)
+
+    await game.deal_round(players)
+
+    white_repo.draw_from_pile.assert_awaited_once_with(
+        game.document_id, NUM_PLAYERS * 7 - 2
+    )
+    white_repo.find_many.assert_awaited_once()
+    player_repo.replace_many.assert_awaited_once()
+
+    dealt: list[str] = []
+    for p in players:
+        stored = await Player.create(bot, repo_factory, p.document_id)
+        assert stored.white_cards_id == p.white_cards_id
+        assert len(p.white_cards_id) == 7
+        p.channel.send.assert_awaited_once()
+        dealt.extend(p.white_cards_id)
+    assert len(set(dealt)) == len(dealt)
+
+
+async def test_send_answers_batches_reads_and_writes():
+    """send_answers loads all players and answers with one read each."""
+    repos = _make_repos()
+    _seed_black_cards(repos["black_cards"], n=10)
+    _seed_white_cards(repos["white_cards"], n=60)
+    bot = _build_mock_bot()
+
+    def repo_factory(collection: str) -> MemoryRepository:
+        return repos[collection]
+
+    player_ids: list[str] = []
+    for i in range(NUM_PLAYERS):
+        p = Player(repository=repo_factory("players"), repo_factory=repo_factory)
+        p._bot = bot
+        p._set_default_values()
+        p._document["guild"] = GUILD_ID
+        p._document["user"] = 1000 + i
+        p._document["channel"] = 2000 + i
+        await p.save()
+        player_ids.append(p.document_id)
+
+    game = Game(repository=repo_factory("games"), repo_factory=repo_factory)
+    game._bot = bot
+    game._set_default_values()
+    game._document["guild"] = GUILD_ID
+    game._document["board"] = BOARD_CHANNEL_ID
+    game._document["players"] = list(player_ids)
+    game._document["tsar"] = player_ids[0]
+    await game.save()
+    await game.build_decks()
+    await game.draw_black_card()
+    await game.deal_round(await game.get_players())
+    for pid in player_ids[1:]:
+        player = await Player.create(bot, repo_factory, pid)
+        await player.add_answers([1])
+
+    white_repo, player_repo = repos["white_cards"], repos["players"]
+    white_repo.find_many = AsyncMock(wraps=white_repo.find_many)
+    player_repo.find_many = AsyncMock(wraps=player_repo.find_many)
+    player_repo.replace_many = AsyncMock(wraps=player_repo.replace_many)
+
+    await game.send_answers()
+
+    white_repo.find_many.assert_awaited_once()
+    player_repo.find_many.assert_awaited_once_with(player_ids)
+    player_repo.replace_many.assert_awaited_once()
+    assert len(game._document["results"]) == NUM_PLAYERS - 1
+    for pid in player_ids:
+        player = await Player.create(bot, repo_factory, pid)
+        assert player.answers_id == []
+
+
+async def test_card_catalog_serves_cards_without_reads():
+    """With a loaded catalog, dealing and judging never read card docs."""
+    repos = _make_repos()
+    _seed_black_cards(repos["black_cards"], n=10)
+    _seed_white_cards(repos["white_cards"], n=60)
+    bot = _build_mock_bot()
+
+    def repo_factory(collection: str) -> MemoryRepository:
+        return repos[collection]
+
+    bot.catalog = await CardCatalog.load(repo_factory)
+    players: list[Player] = []
+    for i in range(NUM_PLAYERS):
+        p = Player(repository=repo_factory("players"), repo_factory=repo_factory)
+        p._bot = bot
+        p._set_default_values()
+        p._document["guild"] = GUILD_ID
+        p._document["user"] = 1000 + i
+        p._document["channel"] = 2000 + i
+        await p.save()
+        players.append(p)
+
+    game = Game(repository=repo_factory("games"), repo_factory=repo_factory)
+    game._bot = bot
+    game._set_default_values()
+    game._document["guild"] = GUILD_ID
+    game._document["board"] = BOARD_CHANNEL_ID
+    game._document["players"] = [p.document_id for p in players]
+    game._document["tsar"] = players[0].document_id
+    await game.save()
+    await game.build_decks()
+
+    black_repo, white_repo = repos["black_cards"], repos["white_cards"]
+    black_repo.find_by_id = AsyncMock(wraps=black_repo.find_by_id)
+    white_repo.find_many = AsyncMock(wraps=white_repo.find_many)
+
+    await game.draw_black_card()
+    await game.deal_round(players)
+    for p in players[1:]:
+        await p.add_answers([1])
+    await game.send_answers()
+
+    black_repo.find_by_id.assert_not_awaited()
+    white_repo.find_many.assert_not_awaited()
+    assert len(game._document["results"]) == NUM_PLAYERS - 1
+
+
+async def test_round_resumes_after_restart():
+    """A game restored mid-round by phase finishes that round."""
+    repos = _make_repos()
+    _seed_black_cards(repos["black_cards"], n=10)
+    _seed_white_cards(repos["white_cards"], n=60)
+    bot = _build_mock_bot()
+
+    def repo_factory(collection: str) -> MemoryRepository:
+        return repos[collection]
+
+    player_ids: list[str] = []
+    for i in range(NUM_PLAYERS):
+        p = Player(repository=repo_factory("players"), repo_factory=repo_factory)
+        p._bot = bot
+        p._set_default_values()
+        p._document["guild"] = GUILD_ID
+        p._document["user"] = 1000 + i
+        p._document["channel"] = 2000 + i
+        await p.save()
+        player_ids.append(p.document_id)
+
+    game = Game(repository=repo_factory("games"), repo_factory=repo_factory)
+    game._bot = bot
+    game._set_default_values()
+    game._document["guild"] = GUILD_ID
+    game._document["board"] = BOARD_CHANNEL_ID
+    game._document["players"] = list(player_ids)
+    game._document["tsar"] = player_ids[0]
+    game._document["playing"] = True
+    await game.save()
+    await game.build_decks()
+    await game.draw_black_card()
+    await game.deal_round(await game.get_players())
+    for pid in player_ids[1:]:
+        player = await Player.create(bot, repo_factory, pid)
+        await player.add_answers([1])
+    await game.send_answers()
+    game._document["phase"] = Phase.TSAR_VOTING
+    await game.save()
+
+    # "Restart": a fresh bot rebuilds the game from its stored document.
+    restarted = _build_mock_bot()
+    restarted.notifier = LocalNotifier()
+    document = await repos["games"].find_by_id(game.document_id)
+    resumed = Game.from_document(restarted, repo_factory, document)
+    round_task = asyncio.create_task(resumed.play_round())
+    await asyncio.sleep(0.01)
+    assert not round_task.done()
+
+    tsar = await Player.create(restarted, repo_factory, player_ids[0])
+    tsar.tsar_choice = 1
+    await tsar.save()
+    await resumed.notify()
+    await asyncio.wait_for(round_task, 1)
+
+    winner_id = resumed._document["results"][0][0]
+    winner = await Player.create(restarted, repo_factory, winner_id)
+    assert winner.score == 1
+    assert resumed.tsar_id == winner_id
+    assert resumed.phase is Phase.IDLE
+
+
+async def test_scoring_interrupted_midway_awards_one_point():
+    """A round resumed while scoring awards its point exactly once."""
+    repos = _make_repos()
+    _seed_black_cards(repos["black_cards"], n=10)
+    _seed_white_cards(repos["white_cards"], n=60)
+    bot = _build_mock_bot()
+
+    def repo_factory(collection: str) -> MemoryRepository:
+        return repos[collection]
+
+    player_ids: list[str] = []
+    for i in range(NUM_PLAYERS):
+        p = Player(repository=repo_factory("players"), repo_factory=repo_factory)
+        p._bot = bot
+        p._set_default_values()
+        p._document["guild"] = GUILD_ID
+        p._document["user"] = 1000 + i
+        p._document["channel"] = 2000 + i
+        await p.save()
+        player_ids.append(p.document_id)
+
+    game = Game(repository=repo_factory("games"), repo_factory=repo_factory)
+    game._bot = bot
+    game._set_default_values()
+    game._document["guild"] = GUILD_ID
+    game._document["board"] = BOARD_CHANNEL_ID
+    game._document["players"] = list(player_ids)
+    game._document["tsar"] = player_ids[0]
+    game._document["playing"] = True
+    await game.save()
+    await game.build_decks()
+    await game.draw_black_card()
+    await game.deal_round(await game.get_players())
+    for pid in player_ids[1:]:
+        player = await Player.create(bot, repo_factory, pid)
+        await player.add_answers([1])
+    await game.send_answers()
+    tsar = await Player.create(bot, repo_factory, player_ids[0])
+    tsar.tsar_choice = 1
+    await tsar.save()
+    game._document["phase"] = Phase.TSAR_VOTING
+    await game.transition(Phase.SCORING)
+
+    # Crash after the point is saved, before the tsar's choice is cleared.
+    with patch.object(
+        Player, "delete_choice", AsyncMock(side_effect=RuntimeError("crash"))
+    ):
+        with pytest.raises(RuntimeError):
+            await game.select_winner()
+
+    document = await repos["games"].find_by_id(game.document_id)
+    resumed = Game.from_document(_build_mock_bot(), repo_factory, document)
+    await resumed.play_round()
+
+    winner_id = resumed._document["results"][0][0]
+    scores = {
+        pid: (await Player.create(bot, repo_factory, pid)).score
+        for pid in player_ids
+    }
+    assert scores[winner_id] == 1
+    assert sum(scores.values()) == 1
+    assert resumed.tsar_id == winner_id
+    assert resumed.phase is Phase.IDLE
+    old_tsar = await Player.create(bot, repo_factory, player_ids[0])
+    assert not old_tsar.tsar_choice
+
+    # Scoring again is a no-op once the new tsar is in place.
+    await resumed.select_winner()
+    winner = await Player.create(bot, repo_factory, winner_id)
+    assert winner.score == 1
+
+
+async def test_afk_players_are_auto_played_at_deadline():
+    """An AFK table still finishes the round once the deadlines fire."""
+    repos = _make_repos()
+    _seed_black_cards(repos["black_cards"], n=10)
+    _seed_white_cards(repos["white_cards"], n=60)
+    bot = _build_mock_bot()
+    bot.notifier = LocalNotifier()
+    bot.round_timeouts = {
+        Phase.PLAYERS_VOTING: 0.02,
+        Phase.TSAR_VOTING: 0.02,
+    }
+
+    def repo_factory(collection: str) -> MemoryRepository:
+        return repos[collection]
+
+    player_ids: list[str] = []
+    for i in range(NUM_PLAYERS):
+        p = Player(repository=repo_factory("players"), repo_factory=repo_factory)
+        p._bot = bot
+        p._set_default_values()
+        p._document["guild"] = GUILD_ID
+        p._document["user"] = 1000 + i
+        p._document["channel"] = 2000 + i
+        await p.save()
+        player_ids.append(p.document_id)
+
+    game = Game(repository=repo_factory("games"), repo_factory=repo_factory)
+    game._bot = bot
+    game._set_default_values()
+    game._document["guild"] = GUILD_ID
+    game._document["board"] = BOARD_CHANNEL_ID
+    game._document["players"] = list(player_ids)
+    game._document["tsar"] = player_ids[0]
+    game._document["playing"] = True
+    await game.save()
+    await game.build_decks()
+
+    # Only one player answers; everyone else, tsar included, is AFK.
+    async def one_vote() -> None:
+        while game.phase is not Phase.PLAYERS_VOTING:
+            await asyncio.sleep(0)
+        player = await Player.create(bot, repo_factory, player_ids[1])
+        await player.add_answers([1])
+
+    await asyncio.wait_for(asyncio.gather(game.play_round(), one_vote()), 2)
+
+    assert game.phase is Phase.IDLE
+    assert len(game._document["results"]) == NUM_PLAYERS - 1
+    scores = [
+        (await Player.create(bot, repo_factory, pid)).score for pid in player_ids
+    ]
+    assert sum(scores) == 1
+    assert bot.scheduler.pending == 0
@@ -5,12 +5,15 @@ correctly against an actual Valkey server seeded with card data.
 They are automatically skipped when Docker is not available.
 """
 
+import asyncio
 import json
+from uuid import uuid4
 
 import pytest
 
 from discord_against_humanity.ports.repository import DocumentNotFoundError
 from discord_against_humanity.ports.valkey import (
+    ValkeyLeases,
     ValkeyRepository,
     create_repo_factory,
 )
@@ -184,6 +187,87 @@ class TestValkeyRepositoryIntegration:
         )
         assert result is None
 
+    async def test_hash_documents(self, valkey_client):
+        """Hash documents keep their types and can be updated in place."""
+        repo = ValkeyRepository(
+            valkey_client, "hash_test", index_fields=["guild"], hashed=True
+        )
+        doc_id = await repo.insert(
+            {"guild": 2**60, "players": ["a"], "score": 1, "tsar": None}
+        )
+        await valkey_client.hincrby(f"hash_test:{doc_id}", "score", 2)
+        result = await repo.find_one({"guild": 2**60})
+        assert result == {
+            "_id": doc_id,
+            "guild": 2**60,
+            "players": ["a"],
+            "score": 3,
+            "tsar": None,
+        }
+        await repo.replace(doc_id, {"guild": 7, "playing": True})
+        assert await repo.find_by_id(doc_id) == {
+            "_id": doc_id,
+            "guild": 7,
+            "playing": True,
+        }
+        assert await repo.find_one({"guild": 2**60}) is None
+        assert await repo.find_many([doc_id, "missing"]) == [
+            {"_id": doc_id, "guild": 7, "playing": True},
+            None,
+        ]
+
+    @pytest.mark.parametrize("hashed", [False, True])
+    async def test_update_fields(self, valkey_client, hashed):
+        """Updating fields leaves the others and re-points indices."""
+        repo = ValkeyRepository(
+            valkey_client, f"update_{hashed}", ["guild"], hashed=hashed
+        )
+        doc_id = await repo.insert({"guild": 1, "score": 0, "name": "a"})
+        await repo.update_fields(doc_id, {"guild": 2, "score": 5})
+        assert await repo.find_one({"guild": 1}) is None
+        assert await repo.find_one({"guild": 2}) == {
+            "_id": doc_id,
+            "guild": 2,
+            "score": 5,
+            "name": "a",
+        }
+        with pytest.raises(DocumentNotFoundError):
+            await repo.update_fields("missing", {"score": 1})
+
+    @pytest.mark.parametrize("hashed", [False, True])
+    async def test_increment(self, valkey_client, hashed):
+        """Increments add up, and once-tokens apply only once."""
+        repo = ValkeyRepository(
+            valkey_client, f"increment_{hashed}", hashed=hashed
+        )
+        doc_id = await repo.insert({"score": None, "win": None})
+        assert await repo.increment(doc_id, "score") == 1
+        assert await repo.increment(doc_id, "score", 2) == 3
+        assert await repo.increment(doc_id, "score", once=("win", "w")) == 4
+        assert await repo.increment(doc_id, "score", once=("win", "w")) == 4
+        assert await repo.find_by_id(doc_id) == {
+            "_id": doc_id,
+            "score": 4,
+            "win": "w",
+        }
+        with pytest.raises(DocumentNotFoundError):
+            await repo.increment("missing", "score")
+
+    async def test_convert_to_hashes(self, valkey_client):
+        """JSON documents become hashes readable by a hash repository."""
+        legacy = ValkeyRepository(valkey_client, "convert_test", ["guild"])
+        doc_id = await legacy.insert({"guild": 1, "players": []})
+        repo = ValkeyRepository(
+            valkey_client, "convert_test", ["guild"], hashed=True
+        )
+        assert await repo.convert_to_hashes() == 1
+        assert await repo.convert_to_hashes() == 0
+        assert await repo.find_one({"guild": 1}) == {
+            "_id": doc_id,
+            "guild": 1,
+            "players": [],
+        }
+
     async def test_find_by_id_returns_none_when_missing(
         self, repository
     ):
@@ -219,6 +303,85 @@ class TestValkeyRepositoryIntegration:
         result = await repository.find_by_id(inserted_id)
         assert result is None
 
+    async def test_find_many(self, repository):
+        """find_many returns documents in order, None for missing IDs."""
+        first = await repository.insert({"value": "a"})
+        second = await repository.insert({"value": "b"})
+
+        result = await repository.find_many([second, "missing", first])
+
+        assert result[0]["value"] == "b"
+        assert result[1] is None
+        assert result[2]["value"] == "a"
+
+    async def test_find_all(self, valkey_client):
+        """find_all returns every document in the collection."""
+        repo = ValkeyRepository(valkey_client, "find_all_test")
+        ids = {await repo.insert({"value": i}) for i in range(3)}
+
+        result = await repo.find_all()
+
+        assert {doc["_id"] for doc in result} == ids
+
+    async def test_replace_many(self, valkey_client):
+        """replace_many writes every document and its index entries."""
+        repo = ValkeyRepository(
+            valkey_client, "replace_many_test", index_fields=["guild"]
+        )
+        first = await repo.insert({"guild": 1})
+        second = await repo.insert({"guild": 2})
+
+        await repo.replace_many(
+            [{"_id": first, "guild": 3}, {"_id": second, "guild": 4}]
+        )
+
+        assert (await repo.find_one({"guild": 3}))["_id"] == first
+        assert (await repo.find_one({"guild": 4}))["_id"] == second
+        assert await repo.find_one({"guild": 1}) is None
+
+    async def test_replace_moves_index_entry(self, valkey_client):
+        """Changing an indexed field re-points the index atomically."""
+        repo = ValkeyRepository(
+            valkey_client, "reindex_test", index_fields=["guild"]
+        )
+        inserted_id = await repo.insert({"guild": 1})
+
+        await repo.replace(inserted_id, {"guild": 2})
+
+        assert await repo.find_one({"guild": 1}) is None
+        result = await repo.find_one({"guild": 2})
+        assert result is not None
+        assert result["_id"] == inserted_id
+
+    async def test_delete_by_id_removes_index_entries(self, valkey_client):
+        """Deleting a document also drops the index keys it owned."""
+        repo = ValkeyRepository(
+            valkey_client, "delete_index_test", index_fields=["guild"]
+        )
+        inserted_id = await repo.insert({"guild": 7})
+
+        await repo.delete_by_id(inserted_id)
+
+        assert await valkey_client.get("delete_index_test:idx:guild:7") is None
+        assert await repo.count() == 0
+
+    async def test_backfilled_legacy_document_drops_index_on_delete(
+        self, valkey_client
+    ):
+        """Documents written without back-references are cleaned up too."""
+        repo = ValkeyRepository(
+            valkey_client, "legacy_test", index_fields=["guild"]
+        )
+        await valkey_client.set("legacy_test:old", json.dumps({"guild": 9}))
+        await valkey_client.sadd("legacy_test:ids", "old")
+        await valkey_client.set("legacy_test:idx:guild:9", "old")
+
+        assert await repo.backfill_index_refs() == 1
+        assert await repo.backfill_index_refs() == 0
+        await repo.delete_by_id("old")
+
+        assert await valkey_client.get("legacy_test:idx:guild:9") is None
+
     async def test_random_member(self, repository):
         """random_member returns a document from the collection."""
         await repository.insert({"value": "a"})
@@ -238,6 +401,31 @@ class TestValkeyRepositoryIntegration:
         assert result >= 3
 
 
+class TestValkeyLeasesIntegration:
+    """Integration tests for ValkeyLeases."""
+
+    async def test_lease_cycle(self, valkey_client):
+        """A lease is exclusive, renewable and released with its token."""
+        leases = ValkeyLeases(valkey_client, prefix=f"leases_{uuid4().hex}")
+        token = await leases.acquire("game", 30)
+        assert token is not None
+        assert await leases.acquire("game", 30) is None
+        assert await leases.renew("game", token, 30)
+        assert not await leases.renew("game", token + 1, 30)
+
+        await leases.release("game", token)
+        assert await leases.acquire("game", 30) == token + 1
+
+    async def test_expired_lease_is_taken_over(self, valkey_client):
+        """Once a lease expires, its old token can no longer renew it."""
+        leases = ValkeyLeases(valkey_client, prefix=f"leases_{uuid4().hex}")
+        stale = await leases.acquire("game", 0.001)
+        await asyncio.sleep(0.01)
+        token = await leases.acquire("game", 30)
+        assert token is not None and token > stale
+        assert not await leases.renew("game", stale, 30)
+
+
 # ---------------------------------------------------------------------------
 # Document integration tests
 # ---------------------------------------------------------------------------
@@ -437,6 +625,7 @@ class TestGameCardDrawIntegration:
 
         factory = create_repo_factory(seeded_client)
         mock_bot = MagicMock()
+        mock_bot.catalog = None
         game = Game(
             repository=factory("games"),
             repo_factory=factory,
@@ -444,6 +633,7 @@ class TestGameCardDrawIntegration:
         game._bot = mock_bot
         game._set_default_values()
         await game.save()
+        await game.build_decks()
 
         embed = await game.draw_black_card()
 
@@ -469,6 +659,7 @@ class TestGameCardDrawIntegration:
 
         factory = create_repo_factory(seeded_client)
         mock_bot = MagicMock()
+        mock_bot.catalog = None
         game = Game(
             repository=factory("games"),
             repo_factory=factory,
@@ -476,13 +667,32 @@ class TestGameCardDrawIntegration:
         game._bot = mock_bot
         game._set_default_values()
         await game.save()
+        await game.build_decks()
 
+        drawn = []
         for _ in range(5):
             await game.draw_black_card()
+            drawn.extend(game.black_cards_id)
+
+        assert len(drawn) == 5
+        assert len(set(drawn)) == 5
+
+    async def test_draw_pile_reshuffles_discards(self, seeded_client):
+        """A drained pile refills from its discards, without duplicates."""
+        repo = ValkeyRepository(seeded_client, "white_cards")
+        size = await repo.create_pile("game")
+        assert size == len(SEED_WHITE_CARDS)
+
+        first = await repo.draw_from_pile("game", size)
+        assert len(set(first)) == size
+        assert await repo.draw_from_pile("game", 1) == []
+
+        await repo.discard_to_pile("game", first[:3])
+        second = await repo.draw_from_pile("game", 5)
+        assert sorted(second) == sorted(first[:3])
 
-        assert len(game.black_cards_id) == 5
-        unique_ids = set(game.black_cards_id)
-        assert len(unique_ids) == 5
+        await repo.delete_pile("game")
+        assert await seeded_client.exists("white_cards:pile:game") == 0
 
     async def test_sample_random_white_cards(self, seeded_client):
         """random_member draws random white cards from the deck."""
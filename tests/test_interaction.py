@@ -0,0 +1,21 @@
+"""Tests for interaction-scoped adapter helpers."""
+
+from unittest.mock import MagicMock
+
+from discord_against_humanity.adapters.interaction import documents
+
+
+class TestDocuments:
+    """Tests for documents()."""
+
+    def test_creates_map_in_extras(self):
+        interaction = MagicMock()
+        interaction.extras = {}
+        identity_map = documents(interaction)
+        assert identity_map == {}
+        assert interaction.extras["documents"] is identity_map
+
+    def test_returns_same_map_for_same_interaction(self):
+        interaction = MagicMock()
+        interaction.extras = {}
+        assert documents(interaction) is documents(interaction)
@@ -0,0 +1,75 @@
+"""Tests for the Leases adapters."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from discord_against_humanity.ports.local import LocalLeases
+from discord_against_humanity.ports.valkey import ValkeyLeases
+
+
+class TestLocalLeases:
+    """Tests for LocalLeases."""
+
+    async def test_acquire_once(self):
+        leases = LocalLeases()
+        assert await leases.acquire("game", 10) == 1
+        assert await leases.acquire("game", 10) is None
+
+    async def test_tokens_increase(self):
+        leases = LocalLeases()
+        first = await leases.acquire("a", 10)
+        await leases.release("a", first)
+        assert await leases.acquire("a", 10) > first
+
+    async def test_expired_lease_is_taken_over(self):
+        leases = LocalLeases()
+        stale = await leases.acquire("game", 0)
+        assert await leases.acquire("game", 10) > stale
+        assert not await leases.renew("game", stale, 10)
+
+    async def test_renew(self):
+        leases = LocalLeases()
+        token = await leases.acquire("game", 10)
+        assert await leases.renew("game", token, 10)
+        assert not await leases.renew("game", token + 1, 10)
+
+    async def test_release_needs_the_token(self):
+        leases = LocalLeases()
+        token = await leases.acquire("game", 10)
+        await leases.release("game", token + 1)
+        assert await leases.acquire("game", 10) is None
+        await leases.release("game", token)
+        assert await leases.acquire("game", 10) is not None
+
+
+class TestValkeyLeases:
+    """Tests for ValkeyLeases."""
+
+    @pytest.fixture
+    def leases(self):
+        client = MagicMock()
+        client.register_script = MagicMock(side_effect=lambda _: AsyncMock())
+        return ValkeyLeases(client)
+
+    async def test_acquire(self, leases):
+        leases._acquire_script.return_value = 7
+        assert await leases.acquire("game:1", 1.5) == 7
+        leases._acquire_script.assert_awaited_once_with(
+            keys=["leases:game:1", "leases:fence"], args=[1500]
+        )
+
+    async def test_acquire_held(self, leases):
+        leases._acquire_script.return_value = None
+        assert await leases.acquire("game:1", 30) is None
+
+    async def test_renew(self, leases):
+        leases._renew_script.return_value = 1
+        assert await leases.renew("game:1", 7, 30) is True
+        leases._renew_script.assert_awaited_once_with(
+            keys=["leases:game:1"], args=[7, 30000]
+        )
+
+    async def test_release(self, leases):
+        await leases.release("game:1", 7)
+        leases._renew_script.assert_awaited_once_with(keys=["leases:game:1"], args=[7])
@@ -0,0 +1,221 @@
+"""Tests for the in-memory repository adapter."""
+
+import json
+
+import pytest
+
+from discord_against_humanity.ports.memory import MemoryRepository, MemoryStore
+from discord_against_humanity.ports.repository import DocumentNotFoundError
+
+
+@pytest.fixture
+def repo():
+    return MemoryRepository("players", ["user", "guild"])
+
+
+class TestMemoryRepository:
+    """Tests for MemoryRepository."""
+
+    async def test_insert_and_find_by_id(self, repo):
+        doc_id = await repo.insert({"user": 1, "guild": 2, "cards": ("a",)})
+        assert await repo.find_by_id(doc_id) == {
+            "_id": doc_id,
+            "user": 1,
+            "guild": 2,
+            "cards": ["a"],
+        }
+
+    async def test_insert_keeps_given_id(self, repo):
+        assert await repo.insert({"_id": "p1", "user": 1}) == "p1"
+
+    async def test_returns_copies(self, repo):
+        doc_id = await repo.insert({"cards": ["a"]})
+        (await repo.find_by_id(doc_id))["cards"].append("b")
+        assert (await repo.find_by_id(doc_id))["cards"] == ["a"]
+
+    async def test_find_many(self, repo):
+        first = await repo.insert({"user": 1})
+        assert await repo.find_many([first, "missing"]) == [
+            {"_id": first, "user": 1},
+            None,
+        ]
+
+    async def test_find_all_is_ordered_by_id(self, repo):
+        for doc_id in ("b", "a", "c"):
+            await repo.insert({"_id": doc_id})
+        assert [doc["_id"] for doc in await repo.find_all()] == ["a", "b", "c"]
+
+    async def test_find_one_matches_every_predicate(self, repo):
+        await repo.insert({"_id": "p1", "user": 1, "guild": 2})
+        assert (await repo.find_one({"user": 1, "guild": 2}))["_id"] == "p1"
+        assert await repo.find_one({"user": 1, "guild": 3}) is None
+
+    async def test_find_one_needs_an_indexed_field(self, repo):
+        await repo.insert({"user": 1, "name": "x"})
+        assert await repo.find_one({"name": "x"}) is None
+
+    async def test_replace_moves_index_entry(self, repo):
+        await repo.insert({"_id": "p1", "user": 1})
+        await repo.replace("p1", {"user": 2})
+        assert await repo.find_one({"user": 1}) is None
+        assert (await repo.find_one({"user": 2}))["_id"] == "p1"
+
+    async def test_replace_keeps_index_entry_taken_by_another(self, repo):
+        await repo.insert({"_id": "p1", "user": 1})
+        await repo.insert({"_id": "p2", "user": 1})
+        await repo.replace("p1", {"user": 3})
+        assert (await repo.find_one({"user": 1}))["_id"] == "p2"
+
+    async def test_replace_nonexistent_raises_error(self, repo):
+        with pytest.raises(DocumentNotFoundError):
+            await repo.replace("missing", {"user": 1})
+
+    async def test_replace_many_replaces_existing_before_raising(self, repo):
+        await repo.insert({"_id": "p1", "score": 0})
+        with pytest.raises(DocumentNotFoundError):
+            await repo.replace_many(
+                [{"_id": "p1", "score": 1}, {"_id": "missing", "score": 1}]
+            )
+        assert (await repo.find_by_id("p1"))["score"] == 1
+
+    async def test_update_fields(self, repo):
+        await repo.insert({"_id": "p1", "user": 1, "score": 0})
+        await repo.update_fields("p1", {"user": 2})
+        assert await repo.find_by_id("p1") == {"_id": "p1", "user": 2, "score": 0}
+        assert (await repo.find_one({"user": 2}))["_id"] == "p1"
+
+    async def test_update_fields_nonexistent_raises_error(self, repo):
+        with pytest.raises(DocumentNotFoundError):
+            await repo.update_fields("missing", {"user": 1})
+
+    async def test_increment(self, repo):
+        await repo.insert({"_id": "p1", "score": None})
+        assert await repo.increment("p1", "score") == 1
+        assert await repo.increment("p1", "score", 2) == 3
+
+    async def test_increment_once_per_token(self, repo):
+        await repo.insert({"_id": "p1"})
+        assert await repo.increment("p1", "score", once=("won", "r1")) == 1
+        assert await repo.increment("p1", "score", once=("won", "r1")) == 1
+        assert await repo.increment("p1", "score", once=("won", "r2")) == 2
+
+    async def test_increment_nonexistent_raises_error(self, repo):
+        with pytest.raises(DocumentNotFoundError):
+            await repo.increment("missing", "score")
+
+    async def test_delete_by_id_removes_index_entries(self, repo):
+        await repo.insert({"_id": "p1", "user": 1})
+        await repo.delete_by_id("p1")
+        await repo.delete_by_id("p1")
+        assert await repo.find_by_id("p1") is None
+        assert await repo.find_one({"user": 1}) is None
+        assert await repo.count() == 0
+
+    async def test_delete_many_keeps_random_member_consistent(self, repo):
+        for doc_id in "abcde":
+            await repo.insert({"_id": doc_id})
+        await repo.delete_many(["a", "c", "missing"])
+        assert await repo.count() == 3
+        members = {(await repo.random_member())["_id"] for _ in range(50)}
+        assert members == {"b", "d", "e"}
+
+    async def test_random_member_of_empty_collection(self, repo):
+        assert await repo.random_member() is None
+
+
+class TestMemoryPiles:
+    """Tests for the draw piles of MemoryRepository."""
+
+    @pytest.fixture
+    async def cards(self):
+        repo = MemoryRepository("white_cards")
+        for index in range(5):
+            await repo.insert({"_id": f"c{index}"})
+        return repo
+
+    async def test_create_pile_excludes_cards(self, cards):
+        assert await cards.create_pile("g", exclude=["c0", "c1"]) == 3
+        assert set(await cards.draw_from_pile("g", 5)) == {"c2", "c3", "c4"}
+        assert await cards.draw_from_pile("g") == []
+
+    async def test_draws_are_unique(self, cards):
+        await cards.create_pile("g")
+        drawn = await cards.draw_from_pile("g", 2)
+        drawn += await cards.draw_from_pile("g", 3)
+        assert sorted(drawn) == ["c0", "c1", "c2", "c3", "c4"]
+
+    async def test_reshuffles_discards(self, cards):
+        await cards.create_pile("g")
+        first = await cards.draw_from_pile("g", 4)
+        await cards.discard_to_pile("g", first[:2])
+        (left,) = {"c0", "c1", "c2", "c3", "c4"} - set(first)
+        drawn = await cards.draw_from_pile("g", 4)
+        assert sorted(drawn) == sorted([left, *first[:2]])
+
+    async def test_create_pile_resets_discards(self, cards):
+        await cards.create_pile("g")
+        await cards.discard_to_pile("g", await cards.draw_from_pile("g", 5))
+        await cards.create_pile("g", exclude=["c0", "c1", "c2", "c3"])
+        assert await cards.draw_from_pile("g", 5) == ["c4"]
+
+    async def test_delete_pile(self, cards):
+        await cards.create_pile("g")
+        await cards.discard_to_pile("g", ["c0"])
+        await cards.delete_pile("g")
+        assert await cards.draw_from_pile("g") == []
+
+
+class TestMemoryStore:
+    """Tests for MemoryStore."""
+
+    async def test_one_repository_per_collection(self):
+        store = MemoryStore()
+        assert store.repository("games") is store.repository("games")
+
+    async def test_collections_get_their_index_fields(self):
+        games = MemoryStore().repository("games")
+        await games.insert({"_id": "g1", "guild": 7})
+        assert (await games.find_one({"guild": 7}))["_id"] == "g1"
+
+    async def test_without_path_nothing_is_saved(self):
+        store = MemoryStore()
+        await store.start()
+        assert store._task is None
+        await store.repository("games").insert({"guild": 1})
+        await store.stop()
+
+    async def test_snapshot_round_trip(self, tmp_path):
+        path = str(tmp_path / "store.json")
+        store = MemoryStore(path)
+        await store.start()
+        games = store.repository("games")
+        await games.insert({"_id": "g1", "guild": 7, "round": 2})
+        cards = store.repository("white_cards")
+        for index in range(3):
+            await cards.insert({"_id": f"c{index}"})
+        await cards.create_pile("g1", exclude=["c0"])
+        await cards.discard_to_pile("g1", ["c0"])
+        await store.stop()
+
+        restored = MemoryStore(path)
+        await restored.start()
+        games = restored.repository("games")
+        assert await games.find_one({"guild": 7}) == {
+            "_id": "g1",
+            "guild": 7,
+            "round": 2,
+        }
+        cards = restored.repository("white_cards")
+        assert await cards.count() == 3
+        assert sorted(await cards.draw_from_pile("g1", 3)) == ["c0", "c1", "c2"]
+        await restored.stop()
+
+    async def test_snapshot_is_replaced_whole(self, tmp_path):
+        path = tmp_path / "store.json"
+        store = MemoryStore(str(path))
+        await store.repository("games").insert({"_id": "g1"})
+        await store.save()
+        await store.repository("games").delete_by_id("g1")
+        await store.save()
+        assert json.loads(path.read_text())["games"]["documents"] == {}
+        assert [p.name for p in tmp_path.iterdir()] == ["store.json"]
@@ -0,0 +1,105 @@
+"""Tests for the metrics utilities."""
+
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+
+from discord_against_humanity.utils import metrics
+from discord_against_humanity.utils.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    render,
+    start_server,
+    timed,
+)
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    """Give each test an empty registry."""
+    monkeypatch.setattr(metrics, "_REGISTRY", [])
+
+
+class TestMetrics:
+    """Tests for the metric types and render()."""
+
+    def test_counter(self):
+        counter = Counter("calls_total", "Calls.", ("method",))
+        counter.inc(method="get")
+        counter.inc(2, method="get")
+        assert render() == (
+            "# HELP calls_total Calls.\n"
+            "# TYPE calls_total counter\n"
+            'calls_total{method="get"} 3\n'
+        )
+
+    def test_gauge_without_labels(self):
+        Gauge("games", "Games.").set(4)
+        assert "games 4\n" in render()
+
+    def test_label_values_are_escaped(self):
+        Counter("calls_total", "Calls.", ("name",)).inc(name='a "b"\n')
+        assert 'calls_total{name="a \\"b\\"\\n"} 1' in render()
+
+    def test_histogram(self):
+        histogram = Histogram("took", "Took.", ("op",), buckets=(1, 5))
+        for value in (0.5, 3, 9):
+            histogram.observe(value, op="x")
+        assert render().splitlines()[2:] == [
+            'took_bucket{op="x",le="1"} 1',
+            'took_bucket{op="x",le="5"} 2',
+            'took_bucket{op="x",le="+Inf"} 3',
+            'took_sum{op="x"} 12.5',
+            'took_count{op="x"} 3',
+        ]
+
+    async def test_timed(self):
+        histogram = Histogram("took", "Took.", ("check",))
+
+        @timed(histogram, "check")
+        async def is_ready():
+            return True
+
+        assert await is_ready() is True
+        assert 'took_count{check="is_ready"} 1' in render()
+
+
+class TestHttpTrace:
+    """Tests for the Discord HTTP request counters."""
+
+    async def test_counts_responses_and_rate_limits(self, monkeypatch):
+        requests = Counter("requests", "Requests.", ("method", "status"))
+        rate_limits = Counter("rate_limits", "Rate limits.")
+        monkeypatch.setattr(metrics, "DISCORD_REQUESTS", requests)
+        monkeypatch.setattr(metrics, "DISCORD_RATE_LIMITS", rate_limits)
+        trace = metrics.http_trace()
+        for status in (200, 429):
+            params = MagicMock(method="POST")
+            params.response.status = status
+            for callback in trace.on_request_end:
+                await callback(MagicMock(), MagicMock(), params)
+        for callback in trace.on_request_exception:
+            await callback(MagicMock(), MagicMock(), MagicMock(method="GET"))
+        text = render()
+        assert 'requests{method="POST",status="200"} 1' in text
+        assert 'requests{method="POST",status="429"} 1' in text
+        assert 'requests{method="GET",status="error"} 1' in text
+        assert "rate_limits 1" in text
+
+
+class TestServer:
+    """Tests for start_server()."""
+
+    async def test_serves_metrics(self):
+        Gauge("games", "Games.").set(2)
+        runner = await start_server(0, "127.0.0.1")
+        try:
+            host, port = runner.addresses[0][:2]
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f"http://{host}:{port}/metrics") as resp:
+                    assert resp.status == 200
+                    assert "games 2" in await resp.text()
+        finally:
+            await runner.cleanup()
@@ -0,0 +1,107 @@
+"""Tests for the Notifier adapters."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from discord_against_humanity.ports.local import LocalNotifier
+from discord_against_humanity.ports.valkey import ValkeyNotifier
+
+
+class TestLocalNotifier:
+    """Tests for LocalNotifier."""
+
+    async def test_wait_returns_after_notify(self):
+        notifier = LocalNotifier()
+        waiter = asyncio.create_task(notifier.wait("game"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await notifier.notify("game")
+        assert await asyncio.wait_for(waiter, 1) is True
+
+    async def test_notify_before_wait_is_not_lost(self):
+        notifier = LocalNotifier()
+        await notifier.notify("game")
+        assert await notifier.wait("game", timeout=1) is True
+
+    async def test_notification_is_consumed(self):
+        notifier = LocalNotifier()
+        await notifier.notify("game")
+        await notifier.wait("game")
+        assert await notifier.wait("game", timeout=0.01) is False
+        assert notifier._events == {}
+
+    async def test_wait_times_out(self):
+        notifier = LocalNotifier()
+        assert await notifier.wait("game", timeout=0.01) is False
+
+    async def test_notified_keys_without_waiters_are_bounded(self):
+        notifier = LocalNotifier()
+        for i in range(notifier._PENDING_LIMIT + 10):
+            await notifier.notify(f"game{i}")
+        assert notifier._events == {}
+        assert len(notifier._pending) == notifier._PENDING_LIMIT
+        assert await notifier.wait("game0", timeout=0.01) is False
+        assert await notifier.wait("game10", timeout=0.01) is True
+
+    async def test_notify_wakes_every_waiter(self):
+        notifier = LocalNotifier()
+        waiters = [asyncio.create_task(notifier.wait("game")) for _ in range(2)]
+        await asyncio.sleep(0)
+        await notifier.notify("game")
+        assert await asyncio.gather(*waiters) == [True, True]
+        assert notifier._events == {}
+        assert notifier._waiters == {}
+
+    async def test_timed_out_waiter_keeps_others_waiting(self):
+        notifier = LocalNotifier()
+        patient = asyncio.create_task(notifier.wait("game", timeout=1))
+        assert await notifier.wait("game", timeout=0.01) is False
+        await notifier.notify("game")
+        assert await patient is True
+
+    async def test_keys_are_independent(self):
+        notifier = LocalNotifier()
+        await notifier.notify("other")
+        assert await notifier.wait("game", timeout=0.01) is False
+
+
+class TestValkeyNotifier:
+    """Tests for ValkeyNotifier."""
+
+    async def test_notify_wakes_locally_and_publishes(self, mock_valkey_client):
+        notifier = ValkeyNotifier(mock_valkey_client)
+        await notifier.notify("game")
+        mock_valkey_client.publish.assert_awaited_once_with(
+            "events:game", notifier._origin
+        )
+        assert await notifier.wait("game", timeout=1) is True
+
+    async def test_listener_wakes_on_foreign_messages_only(self, mock_valkey_client):
+        messages = [
+            {"type": "psubscribe", "channel": "events:*", "data": 1},
+            {"type": "pmessage", "channel": "events:own", "data": None},
+            {"type": "pmessage", "channel": "events:game", "data": "peer"},
+        ]
+        notifier = ValkeyNotifier(mock_valkey_client)
+        messages[1]["data"] = notifier._origin
+        received = asyncio.Event()
+
+        async def listen():
+            for message in messages:
+                yield message
+            received.set()
+            await asyncio.Event().wait()
+
+        pubsub = MagicMock()
+        pubsub.psubscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        pubsub.listen = listen
+        mock_valkey_client.pubsub = MagicMock(return_value=pubsub)
+
+        await notifier.start()
+        await asyncio.wait_for(received.wait(), 1)
+        await notifier.stop()
+
+        pubsub.psubscribe.assert_awaited_once_with("events:*")
+        assert await notifier.wait("game", timeout=0.01) is True
+        assert await notifier.wait("own", timeout=0.01) is False
@@ -14,11 +14,21 @@ def mock_repo():
     """Create a mock Repository for player tests."""
     repo = MagicMock(spec=Repository)
     repo.find_by_id = AsyncMock(return_value=None)
+    repo.find_many = AsyncMock(return_value=[])
+    repo.find_all = AsyncMock(return_value=[])
     repo.find_one = AsyncMock(return_value=None)
     repo.insert = AsyncMock(return_value=str(uuid4()))
     repo.replace = AsyncMock(return_value={})
+    repo.replace_many = AsyncMock(return_value=[])
+    repo.update_fields = AsyncMock()
+    repo.increment = AsyncMock(return_value=1)
     repo.delete_by_id = AsyncMock()
+    repo.delete_many = AsyncMock()
     repo.random_member = AsyncMock(return_value=None)
+    repo.create_pile = AsyncMock(return_value=0)
+    repo.draw_from_pile = AsyncMock(return_value=[])
+    repo.discard_to_pile = AsyncMock()
+    repo.delete_pile = AsyncMock()
     repo.count = AsyncMock(return_value=0)
     return repo
 
@@ -201,6 +211,59 @@ class TestPlayerCreate:
             {"user": mock_member.id, "guild": mock_member.guild.id}
         )
 
+    async def test_create_many_preserves_order_and_skips_missing(
+        self, mock_bot, mock_repo_factory
+    ):
+        ids = [str(uuid4()), str(uuid4()), str(uuid4())]
+        repo = mock_repo_factory._repo
+        repo.find_many = AsyncMock(
+            return_value=[
+                {"_id": ids[0], "score": 1},
+                None,
+                {"_id": ids[2], "score": 3},
+            ]
+        )
+
+        players = await Player.create_many(mock_bot, mock_repo_factory, ids)
+
+        repo.find_many.assert_awaited_once_with(ids)
+        assert [p.document_id for p in players] == [ids[0], ids[2]]
+        assert [p.score for p in players] == [1, 3]
+        assert all(p._bot is mock_bot for p in players)
+
+    async def test_create_reuses_identity_map(
+        self, mock_bot, mock_repo_factory, mock_member, mock_guild
+    ):
+        identity_map = {}
+        first = await Player.create(
+            mock_bot,
+            mock_repo_factory,
+            user=mock_member,
+            guild=mock_guild,
+            identity_map=identity_map,
+        )
+        second = await Player.create(
+            mock_bot,
+            mock_repo_factory,
+            user=mock_member,
+            guild=mock_guild,
+            identity_map=identity_map,
+        )
+        assert second is first
+        mock_repo_factory._repo.find_one.assert_awaited_once()
+
+    async def test_create_by_id_bypasses_identity_map(
+        self, mock_bot, mock_repo_factory
+    ):
+        identity_map = {}
+        await Player.create(
+            mock_bot,
+            mock_repo_factory,
+            document_id=str(uuid4()),
+            identity_map=identity_map,
+        )
+        assert identity_map == {}
+
 
 class TestPlayerMethods:
     """Tests for Player methods."""
@@ -243,11 +306,12 @@ class TestPlayerMethods:
 
         assert player.tsar_choice == 0
 
-    async def test_get_white_cards(self, player, mock_repo):
+    async def test_get_white_cards(self, player, mock_repo_factory):
         card_ids = [str(uuid4()), str(uuid4())]
         player._document["white_cards"] = card_ids
-        mock_repo.find_by_id = AsyncMock(
-            side_effect=[
+        repo = mock_repo_factory._repo
+        repo.find_many = AsyncMock(
+            return_value=[
                 {"_id": card_ids[0], "text": "Card A"},
                 {"_id": card_ids[1], "text": "Card B"},
             ]
@@ -255,15 +319,31 @@ class TestPlayerMethods:
 
         cards = await player.get_white_cards()
 
-        assert len(cards) == 2
+        assert [card.document_id for card in cards] == card_ids
+        repo.find_many.assert_awaited_once_with(card_ids)
 
-    async def test_get_answers(self, player, mock_repo):
+    async def test_get_white_cards_skips_missing(
+        self, player, mock_repo_factory
+    ):
+        card_ids = [str(uuid4()), str(uuid4())]
+        player._document["white_cards"] = card_ids
+        mock_repo_factory._repo.find_many = AsyncMock(
+            return_value=[None, {"_id": card_ids[1], "text": "Card B"}]
+        )
+
+        cards = await player.get_white_cards()
+
+        assert [card.document_id for card in cards] == card_ids[1:]
+
+    async def test_get_answers(self, player, mock_repo_factory):
         answer_ids = [str(uuid4())]
         player._document["answers"] = answer_ids
-        mock_repo.find_by_id = AsyncMock(
-            return_value={"_id": answer_ids[0], "text": "An answer"}
+        repo = mock_repo_factory._repo
+        repo.find_many = AsyncMock(
+            return_value=[{"_id": answer_ids[0], "text": "An answer"}]
         )
 
         answers = await player.get_answers()
 
         assert len(answers) == 1
+        repo.find_many.assert_awaited_once_with(answer_ids)
@@ -0,0 +1,89 @@
+"""Tests for ChannelPool."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+from discord import CategoryChannel, TextChannel
+
+from discord_against_humanity.domain.pool import (
+    ChannelPool,
+    default_overwrites,
+)
+
+
+@pytest.fixture
+def pool(mock_repo_factory):
+    return ChannelPool(mock_repo_factory, 123456789)
+
+
+@pytest.fixture
+def spare(mock_guild, mock_category_channel):
+    channel = MagicMock(spec=TextChannel)
+    channel.id = 42
+    channel.guild = mock_guild
+    channel.category = mock_category_channel
+    channel.edit = AsyncMock()
+    channel.purge = AsyncMock()
+    mock_guild.get_channel.side_effect = lambda channel_id: (
+        channel if channel_id == 42 else None
+    )
+    return channel
+
+
+class TestChannelPool:
+    """Tests for ChannelPool."""
+
+    async def test_take_board_reuses_spare(self, pool, mock_guild, spare):
+        pool._repo.draw_from_pile.return_value = ["42"]
+        assert await pool.take_board(mock_guild) is spare
+        pool._repo.draw_from_pile.assert_awaited_once_with("123456789:boards")
+        mock_guild.create_category.assert_not_called()
+
+    async def test_take_board_creates_when_empty(self, pool, mock_guild):
+        mock_guild.create_category = AsyncMock()
+        mock_guild.create_text_channel = AsyncMock()
+        board = await pool.take_board(mock_guild)
+        assert board is mock_guild.create_text_channel.return_value
+        mock_guild.create_category.assert_awaited_once()
+
+    async def test_take_skips_deleted_spares(self, pool, mock_guild, spare):
+        pool._repo.draw_from_pile.side_effect = [["7"], ["42"]]
+        assert await pool.take_board(mock_guild) is spare
+
+    async def test_take_channel_sets_it_up_in_one_edit(
+        self, pool, spare, mock_category_channel, mock_guild
+    ):
+        mock_category_channel.guild = mock_guild
+        pool._repo.draw_from_pile.return_value = ["42"]
+        overwrites = default_overwrites(mock_guild)
+        channel = await pool.take_channel("Player", mock_category_channel, overwrites)
+        assert channel is spare
+        spare.edit.assert_awaited_once_with(
+            name="Player",
+            category=mock_category_channel,
+            overwrites=overwrites,
+        )
+
+    async def test_take_channel_creates_when_empty(self, pool, mock_guild):
+        category = MagicMock(spec=CategoryChannel)
+        category.guild = mock_guild
+        category.create_text_channel = AsyncMock()
+        channel = await pool.take_channel("Player", category, {})
+        assert channel is category.create_text_channel.return_value
+        pool._repo.draw_from_pile.assert_awaited_once_with("123456789:players")
+
+    async def test_release_hides_empties_and_pools(self, pool, spare):
+        assert await pool.release(spare)
+        spare.edit.assert_awaited_once_with(overwrites=default_overwrites(spare.guild))
+        spare.purge.assert_awaited_once_with(limit=None)
+        pool._repo.discard_to_pile.assert_awaited_once_with("123456789:players", ["42"])
+
+    async def test_release_of_deleted_channel(self, pool, spare):
+        spare.edit.side_effect = discord.NotFound(MagicMock(), "")
+        assert await pool.release(spare, board=True)
+        pool._repo.discard_to_pile.assert_not_awaited()
+
+    async def test_release_nothing(self, pool):
+        assert await pool.release(None)
+        pool._repo.discard_to_pile.assert_not_awaited()
@@ -0,0 +1,250 @@
+"""Tests for the GameRunner supervisor."""
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock, call, patch
+from uuid import uuid4
+
+import pytest
+
+from discord_against_humanity.adapters.runner import GameRunner
+from discord_against_humanity.domain.game import Game
+from discord_against_humanity.ports.local import LocalLeases
+
+
+def _game(document_id=None):
+    game = MagicMock(spec=Game)
+    game.document_id = document_id or str(uuid4())
+    game.closing = False
+    game.play = AsyncMock()
+    game.teardown = AsyncMock()
+    return game
+
+
+@pytest.fixture
+def runner(mock_bot, mock_repo_factory):
+    mock_bot.wait_until_ready = AsyncMock()
+    mock_bot.repo_factory = mock_repo_factory
+    return GameRunner(mock_bot)
+
+
+class TestGameRunner:
+    """Tests for GameRunner."""
+
+    async def test_run_plays_then_tears_down(self, runner):
+        game = _game()
+        runner.run(game)
+        assert runner.running == {game.document_id}
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        game.play.assert_awaited_once()
+        game.teardown.assert_awaited_once()
+        assert runner.running == set()
+
+    async def test_finished_game_logs_render_cache_stats(self, runner, caplog):
+        game = _game()
+        with caplog.at_level(
+            logging.INFO, logger="discord_against_humanity.adapters.runner"
+        ):
+            runner.run(game)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+        assert "Card render cache:" in caplog.text
+        assert "Document saves:" in caplog.text
+
+    async def test_active_games_gauge(self, runner, monkeypatch):
+        gauge = MagicMock()
+        monkeypatch.setattr(
+            "discord_against_humanity.adapters.runner.ACTIVE_GAMES", gauge
+        )
+        game = _game()
+        runner.run(game)
+        gauge.set.assert_called_with(1)
+        await runner._tasks[game.document_id]
+        gauge.set.assert_called_with(0)
+
+    async def test_run_twice_keeps_one_task(self, runner):
+        game = _game()
+        started = asyncio.Event()
+
+        async def play():
+            started.set()
+            await asyncio.sleep(1)
+
+        game.play.side_effect = play
+        runner.run(game)
+        runner.run(game)
+        await started.wait()
+        assert game.play.await_count == 1
+        await runner.stop()
+
+    async def test_failed_game_is_not_torn_down(self, runner):
+        game = _game()
+        game.play.side_effect = RuntimeError("boom")
+        runner.run(game)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        game.teardown.assert_not_awaited()
+        assert runner.running == set()
+
+    async def test_stop_cancels_games_without_teardown(self, runner):
+        game = _game()
+        game.play.side_effect = asyncio.Event().wait
+        runner.run(game)
+        await asyncio.sleep(0)
+        await runner.stop()
+        game.teardown.assert_not_awaited()
+        assert runner.running == set()
+
+    async def test_cancel_stops_game_without_teardown(self, runner):
+        game = _game()
+        game.play.side_effect = asyncio.Event().wait
+        runner.run(game)
+        await asyncio.sleep(0)
+        await runner.cancel(game.document_id)
+        game.teardown.assert_not_awaited()
+        assert runner.running == set()
+
+    async def test_cancel_unknown_game(self, runner):
+        await runner.cancel("missing")
+        assert runner.running == set()
+
+    async def test_closing_game_only_finishes_teardown(self, runner):
+        game = _game()
+        game.closing = True
+        runner.run(game)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        game.play.assert_not_awaited()
+        game.teardown.assert_awaited_once()
+        assert runner.running == set()
+
+    async def test_game_closed_while_playing_is_not_torn_down_again(self, runner):
+        game = _game()
+
+        async def play():
+            game.closing = True
+
+        game.play.side_effect = play
+        runner.run(game)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        game.teardown.assert_not_awaited()
+
+    async def test_start_resumes_playing_and_closing_games(
+        self, runner, mock_repo_factory
+    ):
+        playing = {"_id": "a", "playing": True, "phase": "tsar_voting"}
+        idle = {"_id": "b", "playing": False, "phase": "idle"}
+        closing = {"_id": "c", "playing": False, "closing": True}
+        mock_repo_factory._repo.find_all = AsyncMock(
+            return_value=[playing, idle, closing]
+        )
+        resumed, closed = _game("a"), _game("c")
+        with (
+            patch.object(
+                Game, "from_document", MagicMock(side_effect=[resumed, closed])
+            ) as from_document,
+            patch.object(runner, "run") as run,
+        ):
+            await runner.start()
+            await runner._resume_task
+        runner._bot.wait_until_ready.assert_awaited_once()
+        mock_repo_factory.assert_any_call("games")
+        assert from_document.call_args_list == [
+            call(runner._bot, mock_repo_factory, playing),
+            call(runner._bot, mock_repo_factory, closing),
+        ]
+        assert run.call_args_list == [call(resumed), call(closed)]
+
+    async def test_start_resumes_only_games_of_own_shards(
+        self, mock_bot, mock_repo_factory
+    ):
+        mock_bot.wait_until_ready = AsyncMock()
+        mock_bot.repo_factory = mock_repo_factory
+        runner = GameRunner(mock_bot, [1], 2)
+        own = {"_id": "a", "playing": True, "guild": 1 << 22}
+        other = {"_id": "b", "playing": True, "guild": 2 << 22}
+        mock_repo_factory._repo.find_all = AsyncMock(return_value=[own, other])
+        resumed = _game("a")
+        with (
+            patch.object(
+                Game, "from_document", MagicMock(return_value=resumed)
+            ) as from_document,
+            patch.object(runner, "run") as run,
+        ):
+            await runner.start()
+            await runner._resume_task
+        from_document.assert_called_once_with(
+            mock_bot, mock_repo_factory, own
+        )
+        run.assert_called_once_with(resumed)
+
+
+class TestGameRunnerLeases:
+    """Tests for GameRunner with leases."""
+
+    @pytest.fixture
+    def leases(self):
+        return LocalLeases()
+
+    @pytest.fixture
+    def runner(self, mock_bot, mock_repo_factory, leases):
+        mock_bot.wait_until_ready = AsyncMock()
+        mock_bot.repo_factory = mock_repo_factory
+        return GameRunner(mock_bot, leases=leases, lease_ttl=0.03)
+
+    async def test_game_is_played_under_its_lease(self, runner, leases):
+        game = _game("a")
+        held = []
+
+        async def play():
+            held.append(await leases.acquire("game:a", 10))
+
+        game.play.side_effect = play
+        runner.run(game)
+        await runner._tasks["a"]
+        assert held == [None]
+        game.teardown.assert_awaited_once()
+        assert await leases.acquire("game:a", 10) is not None
+
+    async def test_game_leased_elsewhere_is_not_played(self, runner, leases):
+        await leases.acquire("game:a", 10)
+        game = _game("a")
+        runner.run(game)
+        await runner._tasks["a"]
+        game.play.assert_not_awaited()
+
+    async def test_lease_is_renewed(self, runner):
+        game = _game("a")
+
+        async def play():
+            await asyncio.sleep(0.1)
+
+        game.play.side_effect = play
+        runner.run(game)
+        await runner._tasks["a"]
+        game.teardown.assert_awaited_once()
+
+    async def test_lost_lease_stops_game(self, runner, leases):
+        game = _game("a")
+
+        async def play():
+            await asyncio.sleep(1)
+
+        game.play.side_effect = play
+        leases.renew = AsyncMock(return_value=False)
+        runner.run(game)
+        task = runner._tasks["a"]
+        await asyncio.gather(task, return_exceptions=True)
+        assert task.cancelled()
+        game.teardown.assert_not_awaited()
+
+    async def test_resume_keeps_looking_for_games(
+        self, runner, mock_repo_factory
+    ):
+        mock_repo_factory._repo.find_all = AsyncMock(return_value=[])
+        await runner.start()
+        await asyncio.sleep(0.05)
+        assert mock_repo_factory._repo.find_all.await_count >= 2
+        await runner.stop()
@@ -0,0 +1,108 @@
+"""Tests for the Scheduler adapters."""
+
+import asyncio
+from time import time
+from unittest.mock import AsyncMock
+
+from discord_against_humanity.ports.local import LocalScheduler
+
+
+class TestLocalScheduler:
+    """Tests for LocalScheduler."""
+
+    async def test_fires_in_deadline_order(self):
+        scheduler = LocalScheduler()
+        fired: list[str] = []
+        done = asyncio.Event()
+
+        def record(key):
+            async def callback():
+                fired.append(key)
+                if len(fired) == 3:
+                    done.set()
+
+            return callback
+
+        now = time()
+        scheduler.schedule("c", now + 0.03, record("c"))
+        scheduler.schedule("a", now + 0.01, record("a"))
+        scheduler.schedule("b", now + 0.02, record("b"))
+        await asyncio.wait_for(done.wait(), 1)
+        assert fired == ["a", "b", "c"]
+        assert scheduler.pending == 0
+        await scheduler.stop()
+
+    async def test_past_deadline_fires_immediately(self):
+        scheduler = LocalScheduler()
+        callback = AsyncMock()
+        scheduler.schedule("game", time() - 10, callback)
+        await asyncio.sleep(0.01)
+        callback.assert_awaited_once()
+        await scheduler.stop()
+
+    async def test_cancel(self):
+        scheduler = LocalScheduler()
+        callback = AsyncMock()
+        scheduler.schedule("game", time() + 0.01, callback)
+        scheduler.cancel("game")
+        await asyncio.sleep(0.03)
+        callback.assert_not_awaited()
+        assert scheduler.pending == 0
+        await scheduler.stop()
+
+    async def test_reschedule_replaces_timer(self):
+        scheduler = LocalScheduler()
+        first, second = AsyncMock(), AsyncMock()
+        scheduler.schedule("game", time() + 0.01, first)
+        scheduler.schedule("game", time() + 0.02, second)
+        await asyncio.sleep(0.05)
+        first.assert_not_awaited()
+        second.assert_awaited_once()
+        await scheduler.stop()
+
+    async def test_one_task_for_all_timers(self):
+        scheduler = LocalScheduler()
+        for i in range(100):
+            scheduler.schedule(f"game{i}", time() + 60, AsyncMock())
+        task = scheduler._task
+        scheduler.schedule("late", time() + 120, AsyncMock())
+        assert scheduler._task is task
+        assert scheduler.pending == 101
+        await scheduler.stop()
+
+    async def test_failing_callback_does_not_stop_others(self):
+        scheduler = LocalScheduler()
+        ok = AsyncMock()
+        scheduler.schedule("bad", time(), AsyncMock(side_effect=RuntimeError))
+        scheduler.schedule("good", time() + 0.01, ok)
+        await asyncio.sleep(0.03)
+        ok.assert_awaited_once()
+        await scheduler.stop()
+
+    async def test_slow_callback_does_not_delay_others(self):
+        scheduler = LocalScheduler()
+        release = asyncio.Event()
+        fast = AsyncMock()
+        scheduler.schedule("slow", time(), release.wait)
+        scheduler.schedule("fast", time() + 0.01, fast)
+        await asyncio.sleep(0.05)
+        fast.assert_awaited_once()
+        release.set()
+        await scheduler.stop()
+
+    async def test_stop_cancels_running_callbacks(self):
+        scheduler = LocalScheduler()
+        scheduler.schedule("slow", time(), asyncio.Event().wait)
+        await asyncio.sleep(0.01)
+        assert len(scheduler._running) == 1
+        await scheduler.stop()
+        await asyncio.sleep(0)
+        assert not scheduler._running
+
+    async def test_cancelled_entries_are_compacted(self):
+        scheduler = LocalScheduler()
+        for _ in range(200):
+            scheduler.schedule("game", time() + 60, AsyncMock())
+        assert scheduler.pending == 1
+        assert len(scheduler._heap) < 100
+        await scheduler.stop()
@@ -0,0 +1,143 @@
+"""Tests for the tracing utilities."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from discord_against_humanity.utils import tracing
+from discord_against_humanity.utils.tracing import Tracer, traced
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    return Tracer(str(tmp_path / "spans.jsonl"), args_sample=0)
+
+
+def _spans(tracer):
+    return {span.name: span for span in tracer._finished}
+
+
+class TestTraced:
+    """Tests for traced()."""
+
+    def test_returns_function_when_tracing_is_off(self, monkeypatch):
+        monkeypatch.setattr(tracing, "tracer", None)
+
+        async def sample():
+            pass
+
+        assert traced(sample) is sample
+
+    async def test_wraps_function_when_tracing_is_on(self, monkeypatch, tracer):
+        monkeypatch.setattr(tracing, "tracer", tracer)
+
+        @traced
+        async def sample(x, y):
+            return x + y
+
+        assert sample.__name__ == "sample"
+        assert await sample(2, 3) == 5
+        assert len(tracer._finished) == 1
+
+
+class TestTracer:
+    """Tests for Tracer."""
+
+    async def test_nested_calls_are_child_spans(self, tracer):
+        @tracer.wrap
+        async def inner():
+            pass
+
+        @tracer.wrap
+        async def outer():
+            await inner()
+
+        await outer()
+        spans = _spans(tracer)
+        parent = spans["TestTracer.test_nested_calls_are_child_spans.<locals>.outer"]
+        child = spans["TestTracer.test_nested_calls_are_child_spans.<locals>.inner"]
+        assert child.trace_id == parent.trace_id
+        assert child.parent_id == parent.span_id
+        assert parent.parent_id == ""
+        assert parent.start <= child.start <= child.end <= parent.end
+
+    async def test_tasks_get_their_own_traces(self, tracer):
+        async def handle(name):
+            root = tracer.start(name)
+            with tracer.span(f"{name}.check"):
+                await asyncio.sleep(0)
+            tracer.end(root)
+
+        await asyncio.gather(handle("a"), handle("b"))
+        spans = _spans(tracer)
+        assert spans["a.check"].parent_id == spans["a"].span_id
+        assert spans["b.check"].parent_id == spans["b"].span_id
+        assert spans["a"].trace_id != spans["b"].trace_id
+
+    async def test_error_is_recorded(self, tracer):
+        @tracer.wrap
+        async def failing():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await failing()
+        assert tracer._finished[0].to_otlp()["status"] == {
+            "code": 2,
+            "message": "ValueError: boom",
+        }
+
+    async def test_arguments_are_sampled(self, tmp_path):
+        tracer = Tracer(str(tmp_path / "spans.jsonl"), args_sample=1)
+
+        @tracer.wrap
+        async def sample(x, y=None):
+            pass
+
+        await sample(1, y="two")
+        assert tracer._finished[0].attributes == {
+            "code.args": "(1,)",
+            "code.kwargs": "{'y': 'two'}",
+        }
+
+    async def test_flush_to_file(self, tracer, tmp_path):
+        with tracer.span("op"):
+            pass
+        tracer.flush()
+        tracer.flush()
+        lines = (tmp_path / "spans.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        request = json.loads(lines[0])
+        (spans,) = request["resourceSpans"][0]["scopeSpans"]
+        assert spans["spans"][0]["name"] == "op"
+        assert tracer._finished == []
+
+    async def test_flush_when_batch_is_full(self, tracer, monkeypatch):
+        monkeypatch.setattr(tracing, "BATCH_SIZE", 2)
+        for _ in range(2):
+            with tracer.span("op"):
+                pass
+        assert tracer._finished == []
+
+    async def test_shutdown_posts_to_collector(self):
+        received = []
+
+        async def traces(request):
+            received.append(await request.json())
+            return web.Response()
+
+        app = web.Application()
+        app.router.add_post("/v1/traces", traces)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        host, port = runner.addresses[0][:2]
+        try:
+            tracer = Tracer(f"http://{host}:{port}/v1/traces")
+            with tracer.span("op"):
+                pass
+            await tracer.shutdown()
+        finally:
+            await runner.cleanup()
+        assert len(received) == 1
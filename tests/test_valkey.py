@@ -5,12 +5,13 @@ from uuid import uuid4
 
 import pytest
 
-from discord_against_humanity.domain.document import Document
+from discord_against_humanity.domain.document import Document, save_info
 from discord_against_humanity.ports.repository import (
     DocumentNotFoundError,
     Repository,
 )
 from discord_against_humanity.ports.valkey import ValkeyRepository
+from discord_against_humanity.utils.metrics import REPOSITORY_SECONDS
 
 
 class ConcreteDocument(Document):
@@ -28,11 +29,21 @@ def mock_repo():
     """Create a mock Repository."""
     repo = MagicMock(spec=Repository)
     repo.find_by_id = AsyncMock(return_value=None)
+    repo.find_many = AsyncMock(return_value=[])
+    repo.find_all = AsyncMock(return_value=[])
     repo.find_one = AsyncMock(return_value=None)
     repo.insert = AsyncMock(return_value=str(uuid4()))
     repo.replace = AsyncMock(return_value={})
+    repo.replace_many = AsyncMock(return_value=[])
+    repo.update_fields = AsyncMock()
+    repo.increment = AsyncMock(return_value=1)
     repo.delete_by_id = AsyncMock()
+    repo.delete_many = AsyncMock()
     repo.random_member = AsyncMock(return_value=None)
+    repo.create_pile = AsyncMock(return_value=0)
+    repo.draw_from_pile = AsyncMock(return_value=[])
+    repo.discard_to_pile = AsyncMock()
+    repo.delete_pile = AsyncMock()
     repo.count = AsyncMock(return_value=0)
     return repo
 
@@ -165,6 +176,62 @@ class TestSave:
             doc_id, doc._document
         )
 
+    async def test_save_skips_unchanged_document(self, doc, mock_repo):
+        doc_id = str(uuid4())
+        mock_repo.find_by_id = AsyncMock(
+            return_value={"_id": doc_id, "players": ["a"]}
+        )
+        await doc.get(doc_id)
+        before = save_info()
+        await doc.save()
+        mock_repo.replace.assert_not_awaited()
+        assert save_info().skipped == before.skipped + 1
+
+    async def test_save_writes_nested_change(self, doc, mock_repo):
+        doc_id = str(uuid4())
+        mock_repo.find_by_id = AsyncMock(
+            return_value={"_id": doc_id, "players": ["a"]}
+        )
+        await doc.get(doc_id)
+        doc._document["players"].append("b")
+        assert doc.dirty_fields == {"players"}
+        before = save_info()
+        await doc.save()
+        mock_repo.update_fields.assert_awaited_once_with(
+            doc_id, {"players": ["a", "b"]}
+        )
+        mock_repo.replace.assert_not_awaited()
+        assert save_info().written == before.written + 1
+        assert doc.dirty_fields == set()
+
+    async def test_save_replaces_after_field_removal(self, doc, mock_repo):
+        mock_repo.find_by_id = AsyncMock(return_value={"_id": "a", "old": 1})
+        mock_repo.replace = AsyncMock(side_effect=lambda _id, document: document)
+        await doc.get("a")
+        del doc._document["old"]
+        await doc.save()
+        mock_repo.replace.assert_awaited_once_with("a", {"_id": "a"})
+        mock_repo.update_fields.assert_not_awaited()
+
+    async def test_increment_updates_local_copy(self, doc, mock_repo):
+        mock_repo.find_by_id = AsyncMock(return_value={"_id": "a", "score": 1})
+        mock_repo.increment = AsyncMock(return_value=2)
+        await doc.get("a")
+        assert await doc.increment("score", once=("win", "w")) == 2
+        mock_repo.increment.assert_awaited_once_with("a", "score", 1, ("win", "w"))
+        assert doc._document == {"_id": "a", "score": 2, "win": "w"}
+        assert doc.dirty_fields == set()
+
+    async def test_removed_field_is_dirty(self, doc, mock_repo):
+        mock_repo.find_by_id = AsyncMock(return_value={"_id": "a", "old": 1})
+        await doc.get("a")
+        del doc._document["old"]
+        assert doc.dirty_fields == {"old"}
+
+    def test_unknown_stored_version_is_dirty(self, doc):
+        doc._document = {"_id": "a", "field": 1}
+        assert doc.dirty_fields == {"_id", "field"}
+
 
 class TestDelete:
     """Tests for the delete() method."""
@@ -208,20 +275,348 @@ class TestValkeyRepository:
         assert result["_id"] == doc_id
         assert result["field"] == "value"
 
+    async def test_calls_are_timed_by_method_and_collection(
+        self, repo, monkeypatch
+    ):
+        time = MagicMock()
+        monkeypatch.setattr(REPOSITORY_SECONDS, "time", time)
+        repo._client.get = AsyncMock(return_value=None)
+        await repo.find_by_id(str(uuid4()))
+        time.assert_called_once_with(method="find_by_id", collection="test_col")
+
     async def test_find_by_id_returns_none(self, repo):
         repo._client.get = AsyncMock(return_value=None)
         result = await repo.find_by_id(str(uuid4()))
         assert result is None
 
+    async def test_find_one_is_one_round_trip(self, mock_valkey_client):
+        import json
+
+        repo = ValkeyRepository(mock_valkey_client, "players", ["user", "guild"])
+        repo._find_one_script.return_value = [
+            b"other",
+            json.dumps({"user": 1, "guild": 3}),
+            b"match",
+            json.dumps({"user": 2, "guild": 3}),
+        ]
+        result = await repo.find_one({"user": 1, "guild": 2})
+        assert result is None
+        result = await repo.find_one({"user": 2, "guild": 3})
+        assert result == {"user": 2, "guild": 3, "_id": "match"}
+        repo._find_one_script.assert_awaited_with(
+            keys=["players:idx:user:2", "players:idx:guild:3"],
+            args=["players:", "json"],
+        )
+
+    async def test_hash_documents_round_trip(self, mock_valkey_client):
+        repo = ValkeyRepository(mock_valkey_client, "games", hashed=True)
+        mock_valkey_client.hgetall = AsyncMock(
+            return_value={b"guild": b"42", "players": '["a"]'}
+        )
+        assert await repo.find_by_id("g") == {
+            "guild": 42,
+            "players": ["a"],
+            "_id": "g",
+        }
+        mock_valkey_client.hgetall = AsyncMock(return_value={})
+        assert await repo.find_by_id("g") is None
+
+    async def test_hash_insert_writes_fields(self, mock_valkey_client):
+        repo = ValkeyRepository(mock_valkey_client, "games", hashed=True)
+        doc_id = await repo.insert({"guild": 42, "tsar": None})
+        mock_valkey_client._pipe.hset.assert_called_once_with(
+            f"games:{doc_id}", mapping={"guild": "42", "tsar": "null"}
+        )
+        mock_valkey_client._pipe.set.assert_not_called()
+
+    async def test_hash_insert_rejects_empty_document(
+        self, mock_valkey_client
+    ):
+        repo = ValkeyRepository(mock_valkey_client, "games", hashed=True)
+        with pytest.raises(ValueError, match="empty document"):
+            await repo.insert({})
+
+    async def test_hash_replace_passes_fields(self, mock_valkey_client):
+        repo = ValkeyRepository(
+            mock_valkey_client, "games", index_fields=["guild"], hashed=True
+        )
+        await repo.replace("g", {"_id": "g", "guild": 42, "score": 1})
+        repo._replace_script.assert_awaited_once_with(
+            keys=["games:g", "games:refs:g", "games:idx:guild:42"],
+            args=["", "g", "guild", "guild", "42", "score", "1"],
+        )
+
+    async def test_convert_to_hashes_only_json_documents(
+        self, mock_valkey_client
+    ):
+        import json
+
+        repo = ValkeyRepository(mock_valkey_client, "games", hashed=True)
+        mock_valkey_client.smembers = AsyncMock(return_value={"new", "old"})
+        pipe = mock_valkey_client._pipe
+        pipe.execute = AsyncMock(side_effect=[["hash", "string"], []])
+        mock_valkey_client.mget = AsyncMock(
+            return_value=[json.dumps({"guild": 42})]
+        )
+        assert await repo.convert_to_hashes() == 1
+        mock_valkey_client.mget.assert_awaited_once_with(["games:old"])
+        pipe.hset.assert_called_once_with(
+            "games:old", mapping={"guild": "42"}
+        )
+
+    async def test_hash_update_writes_only_fields(self, mock_valkey_client):
+        repo = ValkeyRepository(
+            mock_valkey_client, "games", index_fields=["guild"], hashed=True
+        )
+        await repo.update_fields("g", {"tsar_choice": 2})
+        repo._update_script.assert_awaited_once_with(
+            keys=["games:g", "games:refs:g"],
+            args=["", "g", "tsar_choice", "2"],
+        )
+        await repo.update_fields("g", {"guild": 3})
+        repo._update_script.assert_awaited_with(
+            keys=["games:g", "games:refs:g", "games:idx:guild:3"],
+            args=["", "g", "guild", "guild", "3"],
+        )
+
+    async def test_hash_update_missing_raises(self, mock_valkey_client):
+        repo = ValkeyRepository(mock_valkey_client, "games", hashed=True)
+        repo._update_script.return_value = 0
+        with pytest.raises(DocumentNotFoundError):
+            await repo.update_fields("g", {"playing": False})
+
+    async def test_update_nothing(self, repo):
+        await repo.update_fields("g", {})
+        repo._update_script.assert_not_awaited()
+
+    async def test_hash_increment_is_one_script(self, mock_valkey_client):
+        repo = ValkeyRepository(mock_valkey_client, "players", hashed=True)
+        repo._increment_script.return_value = 3
+        assert await repo.increment("p", "score", once=("win", "w")) == 3
+        repo._increment_script.assert_awaited_once_with(
+            keys=["players:p"], args=["score", 1, "win", '"w"']
+        )
+
+    async def test_hash_increment_missing_raises(self, mock_valkey_client):
+        repo = ValkeyRepository(mock_valkey_client, "players", hashed=True)
+        repo._increment_script.return_value = None
+        with pytest.raises(DocumentNotFoundError):
+            await repo.increment("p", "score")
+
+    async def test_convert_to_hashes_of_json_collection(self, repo):
+        assert await repo.convert_to_hashes() == 0
+
+    async def test_find_one_without_index(self, repo):
+        assert await repo.find_one({"guild": 1}) is None
+        repo._find_one_script.assert_not_awaited()
+
     async def test_insert(self, repo):
         result = await repo.insert({"data": "test"})
         assert isinstance(result, str)
-        repo._client.set.assert_awaited()
-        repo._client.sadd.assert_awaited()
+        repo._client.pipeline.assert_called_once_with(transaction=True)
+        repo._client._pipe.set.assert_called_once()
+        repo._client._pipe.sadd.assert_called_once()
+        repo._client._pipe.execute.assert_awaited_once()
+
+    async def test_insert_writes_index_entries_in_same_transaction(
+        self, mock_valkey_client
+    ):
+        repo = ValkeyRepository(
+            mock_valkey_client, "games", index_fields=["guild"]
+        )
+        doc_id = await repo.insert({"guild": 42})
+        pipe = mock_valkey_client._pipe
+        pipe.set.assert_any_call("games:idx:guild:42", doc_id)
+        pipe.hset.assert_called_once_with(
+            f"games:refs:{doc_id}",
+            mapping={"guild": "games:idx:guild:42"},
+        )
+        pipe.execute.assert_awaited_once()
+
+    async def test_replace_is_one_round_trip(self, mock_valkey_client):
+        repo = ValkeyRepository(
+            mock_valkey_client, "games", index_fields=["guild"]
+        )
+        doc_id = str(uuid4())
+        result = await repo.replace(doc_id, {"_id": doc_id, "guild": 42})
+        repo._replace_script.assert_awaited_once_with(
+            keys=[
+                f"games:{doc_id}",
+                f"games:refs:{doc_id}",
+                "games:idx:guild:42",
+            ],
+            args=['{"guild":42}', doc_id, "guild"],
+        )
+        mock_valkey_client.get.assert_not_awaited()
+        mock_valkey_client.set.assert_not_awaited()
+        assert result == {"_id": doc_id, "guild": 42}
+
+    async def test_replace_missing_raises(self, repo):
+        repo._replace_script.return_value = 0
+        with pytest.raises(DocumentNotFoundError):
+            await repo.replace(str(uuid4()), {"data": "x"})
 
     async def test_delete_by_id(self, repo):
         doc_id = str(uuid4())
-        repo._client.get = AsyncMock(return_value=None)
         await repo.delete_by_id(doc_id)
-        repo._client.delete.assert_awaited()
-        repo._client.srem.assert_awaited()
+        repo._delete_script.assert_awaited_once_with(
+            keys=[
+                f"test_col:{doc_id}",
+                f"test_col:refs:{doc_id}",
+                "test_col:ids",
+            ],
+            args=[doc_id],
+        )
+
+    async def test_create_pile_copies_id_set(self, repo):
+        repo._client._pipe.execute = AsyncMock(return_value=[0, 42])
+        size = await repo.create_pile("game")
+        assert size == 42
+        repo._client._pipe.delete.assert_called_once_with(
+            "test_col:pile:game", "test_col:discard:game"
+        )
+        repo._client._pipe.sunionstore.assert_called_once_with(
+            "test_col:pile:game", ["test_col:ids"]
+        )
+
+    async def test_create_pile_leaves_out_excluded_ids(self, repo):
+        repo._client._pipe.execute = AsyncMock(return_value=[0, 42, 2])
+        size = await repo.create_pile("game", ["a", "b"])
+        assert size == 40
+        repo._client._pipe.srem.assert_called_once_with(
+            "test_col:pile:game", "a", "b"
+        )
+
+    async def test_draw_from_pile_is_one_round_trip(self, repo):
+        repo._draw_script.return_value = ["a", "b"]
+        drawn = await repo.draw_from_pile("game", 2)
+        assert drawn == ["a", "b"]
+        repo._draw_script.assert_awaited_once_with(
+            keys=["test_col:pile:game", "test_col:discard:game"],
+            args=[2],
+        )
+
+    async def test_draw_nothing(self, repo):
+        assert await repo.draw_from_pile("game", 0) == []
+        repo._draw_script.assert_not_awaited()
+
+    async def test_discard_to_pile(self, repo):
+        await repo.discard_to_pile("game", ["a", "b"])
+        repo._client.sadd.assert_awaited_once_with(
+            "test_col:discard:game", "a", "b"
+        )
+
+    async def test_discard_nothing(self, repo):
+        await repo.discard_to_pile("game", [])
+        repo._client.sadd.assert_not_awaited()
+
+    async def test_delete_pile(self, repo):
+        await repo.delete_pile("game")
+        repo._client.delete.assert_awaited_once_with(
+            "test_col:pile:game", "test_col:discard:game"
+        )
+
+    async def test_find_many_preserves_order_and_missing(self, repo):
+        import json
+
+        repo._client.mget = AsyncMock(
+            return_value=[json.dumps({"n": 1}), None, json.dumps({"n": 3})]
+        )
+        result = await repo.find_many(["a", "b", "c"])
+        repo._client.mget.assert_awaited_once_with(
+            ["test_col:a", "test_col:b", "test_col:c"]
+        )
+        assert result == [{"n": 1, "_id": "a"}, None, {"n": 3, "_id": "c"}]
+
+    async def test_find_many_empty(self, repo):
+        assert await repo.find_many([]) == []
+        repo._client.mget.assert_not_awaited()
+
+    async def test_find_all_reads_every_member(self, repo):
+        import json
+
+        repo._client.smembers = AsyncMock(return_value={"b", "a"})
+        repo._client.mget = AsyncMock(
+            return_value=[json.dumps({"n": 1}), json.dumps({"n": 2})]
+        )
+        result = await repo.find_all()
+        repo._client.smembers.assert_awaited_once_with("test_col:ids")
+        repo._client.mget.assert_awaited_once_with(
+            ["test_col:a", "test_col:b"]
+        )
+        assert result == [{"n": 1, "_id": "a"}, {"n": 2, "_id": "b"}]
+
+    async def test_find_all_batches_reads(self, repo):
+        from discord_against_humanity.ports import valkey as valkey_module
+
+        ids = {f"id{i}" for i in range(valkey_module._FIND_ALL_BATCH + 1)}
+        repo._client.smembers = AsyncMock(return_value=ids)
+        repo._client.mget = AsyncMock(
+            side_effect=lambda keys: [None] * len(keys)
+        )
+        assert await repo.find_all() == []
+        assert repo._client.mget.await_count == 2
+
+    async def test_backfill_index_refs_only_legacy_documents(
+        self, mock_valkey_client
+    ):
+        import json
+
+        repo = ValkeyRepository(
+            mock_valkey_client, "games", index_fields=["guild"]
+        )
+        mock_valkey_client.smembers = AsyncMock(return_value={"new", "old"})
+        pipe = mock_valkey_client._pipe
+        pipe.execute = AsyncMock(side_effect=[[1, 0], []])
+        mock_valkey_client.mget = AsyncMock(
+            return_value=[json.dumps({"guild": 42})]
+        )
+        assert await repo.backfill_index_refs() == 1
+        mock_valkey_client.mget.assert_awaited_once_with(["games:old"])
+        pipe.hset.assert_called_once_with(
+            "games:refs:old", mapping={"guild": "games:idx:guild:42"}
+        )
+
+    async def test_backfill_index_refs_without_indices(self, repo):
+        assert await repo.backfill_index_refs() == 0
+        repo._client.smembers.assert_not_awaited()
+
+    async def test_replace_many_is_one_pipeline(self, repo):
+        pipe = repo._client._pipe
+        pipe.execute = AsyncMock(return_value=[1, 1])
+        result = await repo.replace_many(
+            [{"_id": "a", "n": 1}, {"_id": "b", "n": 2}]
+        )
+        repo._client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.evalsha.call_count == 2
+        pipe.execute.assert_awaited_once()
+        assert result == [{"n": 1, "_id": "a"}, {"n": 2, "_id": "b"}]
+
+    async def test_replace_many_missing_raises(self, repo):
+        repo._client._pipe.execute = AsyncMock(return_value=[1, 0])
+        with pytest.raises(DocumentNotFoundError, match="'b'"):
+            await repo.replace_many(
+                [{"_id": "a", "n": 1}, {"_id": "b", "n": 2}]
+            )
+
+    async def test_delete_many_is_one_pipeline(self, repo):
+        pipe = repo._client._pipe
+        pipe.execute = AsyncMock(return_value=[1, 0])
+        await repo.delete_many(["a", "b"])
+        repo._client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.evalsha.call_count == 2
+        pipe.execute.assert_awaited_once()
+
+    async def test_delete_many_empty(self, repo):
+        await repo.delete_many([])
+        repo._client.pipeline.assert_not_called()
+
+    async def test_replace_many_reloads_unknown_script(self, repo):
+        from valkey.exceptions import NoScriptError
+
+        pipe = repo._client._pipe
+        pipe.execute = AsyncMock(side_effect=[NoScriptError("NOSCRIPT"), [1]])
+        repo._client.script_load = AsyncMock(return_value="sha")
+        await repo.replace_many([{"_id": "a", "n": 1}])
+        repo._client.script_load.assert_awaited_once()
+        assert pipe.execute.await_count == 2